@@ -6,22 +6,22 @@ Auto Scene Splitter - Whisper 타임스탬프와 자막 세그먼트 자동 매
 타이밍 파일(s{n}_timed.json)을 생성합니다.
 """
 
-import json
 from pathlib import Path
 from typing import List, Dict, Any
 import re
 
+from json_io import read_json, write_json_atomic
+from whisper_words import WhisperWords, load_section_words, seconds
+
 BASE_DIR = Path(__file__).parent
 SCRIPTS_DIR = BASE_DIR / "output" / "1_scripts"
 AUDIO_DIR = BASE_DIR / "output" / "2_audio"
 
 def load_json(path: Path) -> Dict:
-    with open(path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return read_json(path)
 
 def save_json(path: Path, data: Dict):
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    write_json_atomic(path, data)
 
 def normalize_text(text: str) -> str:
     """텍스트 정규화 (비교용)"""
@@ -30,9 +30,10 @@ def normalize_text(text: str) -> str:
     text = re.sub(r'\s+', ' ', text)
     return text.strip().lower()
 
-def find_word_match(words: List[Dict], target_text: str, start_idx: int = 0) -> tuple:
+def find_word_match(words: WhisperWords, target_text: str, start_idx: int = 0) -> tuple:
     """
     target_text의 시작/끝에 해당하는 word 인덱스를 찾음
+    (정규화된 단어 목록은 섹션당 한 번만 계산, 시간은 float32 배열에서 조회)
     Returns: (start_word_idx, end_word_idx, start_time, end_time, matched_words)
     """
     target_normalized = normalize_text(target_text)
@@ -41,12 +42,14 @@ def find_word_match(words: List[Dict], target_text: str, start_idx: int = 0) ->
     if not target_words or start_idx >= len(words):
         return None
 
+    normalized = words.normalized(normalize_text)
+
     # 첫 단어 찾기
     first_target = target_words[0]
     start_word_idx = None
 
     for i in range(start_idx, len(words)):
-        word_normalized = normalize_text(words[i]['word'])
+        word_normalized = normalized[i]
         # 부분 매칭 허용 (조사 분리 등)
         if first_target in word_normalized or word_normalized in first_target or first_target[:2] == word_normalized[:2]:
             start_word_idx = i
@@ -55,8 +58,9 @@ def find_word_match(words: List[Dict], target_text: str, start_idx: int = 0) ->
     if start_word_idx is None:
         # 첫 두 글자로 재시도
         for i in range(start_idx, len(words)):
-            if len(words[i]['word']) >= 2 and len(first_target) >= 2:
-                if words[i]['word'][:2] == first_target[:2]:
+            raw_word = words.word(i)
+            if len(raw_word) >= 2 and len(first_target) >= 2:
+                if raw_word[:2] == first_target[:2]:
                     start_word_idx = i
                     break
 
@@ -71,34 +75,31 @@ def find_word_match(words: List[Dict], target_text: str, start_idx: int = 0) ->
     last_target = target_words[-1] if target_words else ""
     for i in range(end_word_idx, start_word_idx, -1):
         if i < len(words):
-            word_normalized = normalize_text(words[i]['word'])
+            word_normalized = normalized[i]
             if last_target in word_normalized or word_normalized in last_target:
                 end_word_idx = i
                 break
 
-    matched_words = [words[j]['word'] for j in range(start_word_idx, min(end_word_idx + 1, len(words)))]
+    matched_words = [words.word(j) for j in range(start_word_idx, min(end_word_idx + 1, len(words)))]
 
     return (
         start_word_idx,
         end_word_idx,
-        words[start_word_idx]['start'],
-        words[min(end_word_idx, len(words) - 1)]['end'],
+        seconds(words.start[start_word_idx]),
+        seconds(words.end[min(end_word_idx, len(words) - 1)]),
         matched_words
     )
 
 def process_section(section: str, scene_ids: List[str]):
     """섹션의 모든 씬 타이밍 처리"""
 
-    # Whisper 데이터 로드
-    whisper_path = AUDIO_DIR / f"{section}_whisper.json"
-    if not whisper_path.exists():
+    # Whisper 데이터 로드 (컬럼 형식 memmap)
+    words = load_section_words(AUDIO_DIR, section)
+    if words is None:
         print(f"[SKIP] {section}: whisper file not found")
         return
 
-    whisper_data = load_json(whisper_path)
-    words = whisper_data.get('words', [])
-
-    if not words:
+    if not len(words):
         print(f"[SKIP] {section}: no words in whisper data")
         return
 
@@ -150,7 +151,7 @@ def process_section(section: str, scene_ids: List[str]):
                 elif scene_start:
                     start_time = scene_start
                 else:
-                    start_time = words[word_idx]['start'] if word_idx < len(words) else 0
+                    start_time = seconds(words.start[word_idx]) if word_idx < len(words) else 0
 
                 end_time = start_time + estimated_duration
 
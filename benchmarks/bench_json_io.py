@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+JSON I/O 벤치마크 - 합성 1000씬 프로젝트 load/save 시간 측정
+
+사용법:
+    python benchmarks/bench_json_io.py
+    python benchmarks/bench_json_io.py --scenes 300 --words 60000
+
+측정 항목 (백엔드별: stdlib / orjson / msgspec 중 설치된 것):
+    save    s{n}.json + s{n}_timed.json + 섹션 whisper.json 저장 (json_io.write_json_atomic)
+    load    같은 파일 전체 로드 (json_io.read_json)
+    bytes   디스크 사용량 (에이전트용 pretty + 기계용 compact)
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import json_io  # noqa: E402
+
+
+SECTIONS = ["hook", "background", "core1", "core2", "core3", "insight", "outro"]
+
+
+def make_project(num_scenes: int, num_words: int):
+    """합성 프로젝트 데이터 생성 {파일명: 데이터}"""
+    rng = random.Random(42)
+    files = {}
+
+    per_section = max(1, num_scenes // len(SECTIONS))
+    scene_no = 0
+    for section in SECTIONS:
+        for _ in range(per_section):
+            scene_no += 1
+            scene_id = f"s{scene_no}"
+            segments = [f"{scene_id} 자막 세그먼트 {i} 조선시대 얼음 창고 이야기" for i in range(4)]
+            files[f"1_scripts/{scene_id}.json"] = {
+                "scene_id": scene_id,
+                "section": section,
+                "narration_tts": " ".join(segments) * 2,
+                "subtitle_display": ";;".join(segments),
+                "subtitle_segments": segments,
+                "bg_id": f"bg_{rng.randint(1, 40)}",
+                "required_elements": [
+                    {"asset": f"icon_{rng.randint(1, 200)}", "type": "icon", "role": "강조"}
+                    for _ in range(3)
+                ],
+            }
+            start = rng.uniform(0, 300)
+            files[f"2_audio/{scene_id}_timed.json"] = {
+                "scene_id": scene_id,
+                "section": section,
+                "timing": {"scene_start": start, "scene_end": start + 6, "duration": 6.0},
+                "captions": [
+                    {"index": i, "text": t, "start": start + i * 1.5, "end": start + i * 1.5 + 1.4,
+                     "duration": 1.4, "words_matched": t.split()}
+                    for i, t in enumerate(segments)
+                ],
+            }
+
+    words_per_section = num_words // len(SECTIONS)
+    for section in SECTIONS:
+        t = 0.0
+        words = []
+        for i in range(words_per_section):
+            words.append({"word": f"단어{i}", "start": round(t, 3), "end": round(t + 0.31, 3)})
+            t += 0.35
+        files[f"2_audio/{section}_whisper.json"] = {"text": "...", "words": words}
+
+    files["1_scripts/scenes.json"] = {
+        "meta": {"total_scenes": scene_no},
+        "scenes": [{"scene_id": f"s{i}"} for i in range(1, scene_no + 1)],
+    }
+    return files
+
+
+def bench_backend(backend: str, files: dict, root: Path, pretty_all: bool):
+    json_io.BACKEND = backend
+    paths = [root / name for name in files]
+
+    t0 = time.perf_counter()
+    for path, data in zip(paths, files.values()):
+        json_io.write_json_atomic(path, data, pretty=True if pretty_all else None)
+    save_time = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    for path in paths:
+        json_io.read_json(path)
+    load_time = time.perf_counter() - t0
+
+    size = sum(os.path.getsize(p) for p in paths)
+    return save_time, load_time, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="JSON I/O benchmark")
+    parser.add_argument("--scenes", type=int, default=1000)
+    parser.add_argument("--words", type=int, default=70000, help="전체 Whisper 단어 수")
+    args = parser.parse_args()
+
+    files = make_project(args.scenes, args.words)
+    backends = ["stdlib"]
+    if json_io.ORJSON_AVAILABLE:
+        backends.append("orjson")
+    if json_io.MSGSPEC_AVAILABLE:
+        backends.append("msgspec")
+
+    print(f"합성 프로젝트: {args.scenes} scenes, {args.words} whisper words, {len(files)} files")
+    print(f"{'backend':<10} {'format':<14} {'save(s)':>9} {'load(s)':>9} {'size(MB)':>9}")
+    print("-" * 55)
+
+    for backend in backends:
+        for pretty_all, label in ((True, "all pretty"), (False, "machine compact")):
+            with tempfile.TemporaryDirectory() as tmp:
+                save_time, load_time, size = bench_backend(backend, files, Path(tmp), pretty_all)
+            print(f"{backend:<10} {label:<14} {save_time:>9.3f} {load_time:>9.3f} {size / 1e6:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
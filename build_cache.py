@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Build Cache - 스테이지 입력 내용 기반 빌드 캐시
+
+각 스테이지(tts, whisper, render, composite, section-merge, final)는
+실제 입력의 **내용 해시**로 action key를 만듭니다.
+    - 파일 입력: TSX 소스 + import한 로컬 파일, 타이밍 JSON, 참조 에셋, 오디오/영상
+    - 파라미터: 인코더 인자, 음성/모델, 프레임 수 등
+    - 도구 버전: Remotion, ffmpeg
+
+출력 파일은 내용 해시로 objects/에 저장(content-addressed)되고, action key → object로 기록됩니다.
+같은 key가 다시 나오면 (다른 씬/되돌린 수정 포함) 렌더 없이 복원합니다.
+원격 백엔드(remote_cache)가 설정되어 있으면 로컬에 없는 key를 원격에서 내려받고,
+새로 만든 출력은 원격에도 올립니다.
+
+캐시 구조 (기본: output/.cache, PIPELINE_CACHE_DIR로 변경):
+    objects/ab/abcdef....mp4   출력 파일 (하드링크, 불가능하면 복사)
+    cache.db                   actions(key → object), digests(파일 내용 해시 메모)
+
+용량 관리 (gc):
+    objects 합계가 예산(PIPELINE_CACHE_MAX_BYTES, 기본 20G)을 넘으면 마지막 사용 시각이 오래된
+    object부터 삭제합니다 (LRU). max_age_days를 주면 그보다 오래 안 쓴 object도 삭제합니다.
+    현재 프로젝트 출력이 가리키는 key(pinned)는 삭제하지 않습니다.
+
+⚠️ 출력 파일은 objects와 하드링크를 공유할 수 있으므로, 덮어쓰기 전에
+   반드시 prepare_output()으로 링크를 끊어야 합니다 (ffmpeg -y는 같은 inode에 씀).
+
+사용법:
+    cache = BuildCache(OUTPUT_DIR / ".cache")
+    key = cache.action_key("render", [tsx, timed], {"cmd": cmd, "frames": 90})
+    if not cache.restore(key, output_path):
+        cache.prepare_output(output_path)
+        ...  # 실제 작업
+        cache.store(key, output_path)
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import sqlite3
+import subprocess
+import tempfile
+from contextlib import contextmanager
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from json_io import read_json
+
+
+HASH_CHUNK = 1024 * 1024
+KEY_VERSION = "1"      # key 계산 방식이 바뀌면 올려서 기존 캐시 무효화
+DEFAULT_MAX_BYTES = 20 * 1024 ** 3
+SIZE_UNITS = {"": 1, "K": 1024, "M": 1024 ** 2, "G": 1024 ** 3, "T": 1024 ** 4}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS actions (
+    key         TEXT PRIMARY KEY,
+    stage       TEXT NOT NULL,
+    object      TEXT NOT NULL,
+    suffix      TEXT NOT NULL,
+    size        INTEGER NOT NULL,
+    created_at  TEXT NOT NULL,
+    last_used   TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS digests (
+    path        TEXT PRIMARY KEY,
+    mtime_ns    INTEGER NOT NULL,
+    size        INTEGER NOT NULL,
+    digest      TEXT NOT NULL
+);
+"""
+
+IMPORT_RE = re.compile(r"""(?:from|import)\s+["'](\.{1,2}/[^"']+)["']""")
+STATIC_FILE_RE = re.compile(r"""staticFile\(\s*["'`]([^"'`$]+)["'`]\s*\)""")
+SOURCE_SUFFIXES = ["", ".tsx", ".ts", ".jsx", ".js", "/index.tsx", "/index.ts", "/index.js"]
+
+
+def is_content_key(fingerprint: Optional[str]) -> bool:
+    """build cache key인지 (stat 기반 ledger fingerprint는 16자)"""
+    return bool(fingerprint) and len(fingerprint) == 64
+
+
+def parse_size(text: str) -> int:
+    """'500M', '20G', '1.5T', '123456' → 바이트"""
+    match = re.fullmatch(r"\s*([\d.]+)\s*([KMGT]?)I?B?\s*", str(text).upper())
+    if not match:
+        raise ValueError(f"크기 형식 오류: {text!r} (예: 500M, 20G)")
+    return int(float(match.group(1)) * SIZE_UNITS[match.group(2)])
+
+
+def format_size(size: float) -> str:
+    for unit in ["B", "KB", "MB", "GB"]:
+        if abs(size) < 1024:
+            return f"{size:.1f}{unit}" if unit != "B" else f"{int(size)}B"
+        size /= 1024
+    return f"{size:.1f}TB"
+
+
+# ============================================================
+# 도구 버전
+# ============================================================
+@lru_cache(maxsize=None)
+def ffmpeg_version() -> str:
+    try:
+        result = subprocess.run(["ffmpeg", "-version"], capture_output=True, text=True, timeout=10)
+        return result.stdout.splitlines()[0] if result.stdout else "unknown"
+    except (OSError, subprocess.SubprocessError):
+        return "unknown"
+
+
+@lru_cache(maxsize=None)
+def remotion_version(remotion_dir: Path) -> str:
+    """설치된 remotion 버전 (없으면 package.json 선언 버전)"""
+    installed = Path(remotion_dir) / "node_modules" / "remotion" / "package.json"
+    try:
+        return read_json(installed)["version"]
+    except (OSError, ValueError, KeyError):
+        pass
+    try:
+        return read_json(Path(remotion_dir) / "package.json").get("dependencies", {}).get("remotion", "unknown")
+    except (OSError, ValueError):
+        return "unknown"
+
+
+# ============================================================
+# TSX 의존성
+# ============================================================
+def _resolve_import(base: Path, spec: str) -> Optional[Path]:
+    for suffix in SOURCE_SUFFIXES:
+        candidate = (base.parent / (spec + suffix)).resolve()
+        if candidate.is_file():
+            return candidate
+    return None
+
+
+def tsx_dependencies(entry: Path, public_dir: Path) -> List[Path]:
+    """씬 컴포넌트가 의존하는 파일 (자신 + 상대 경로 import 재귀 + staticFile 에셋)"""
+    sources: List[Path] = []
+    assets: Set[Path] = set()
+    seen: Set[Path] = set()
+    stack = [Path(entry).resolve()]
+
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except OSError:
+            continue
+        sources.append(path)
+        for spec in IMPORT_RE.findall(text):
+            resolved = _resolve_import(path, spec)
+            if resolved is not None:
+                stack.append(resolved)
+        for ref in STATIC_FILE_RE.findall(text):
+            assets.add(Path(public_dir) / ref.lstrip("/"))
+
+    return sorted(sources) + sorted(assets)
+
+
+# ============================================================
+# 캐시
+# ============================================================
+class BuildCache:
+    """content-addressed 빌드 캐시"""
+
+    def __init__(self, root: Path, remote=None, max_bytes: Optional[int] = DEFAULT_MAX_BYTES):
+        self.root = Path(root)
+        self.remote = remote
+        self.max_bytes = max_bytes
+        self.objects_dir = self.root / "objects"
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.root / "cache.db"), timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self._key_inputs: Dict[str, List[Path]] = {}    # 이번 프로세스에서 계산한 key → 입력 파일
+        self.read_only = False      # dry_run() 중: digest 메모 기록, 손상된 object 삭제 안 함
+
+    def close(self):
+        self.conn.close()
+
+    @contextmanager
+    def dry_run(self):
+        """이 블록 안에서는 캐시를 변경하지 않음 (plan)"""
+        previous, self.read_only = self.read_only, True
+        try:
+            yield self
+        finally:
+            self.read_only = previous
+
+    # --------------------------------------------------------
+    # 해시
+    # --------------------------------------------------------
+    def file_digest(self, path: Path) -> Optional[str]:
+        """파일 내용 sha256 (mtime/size가 같으면 메모된 값 사용), 없으면 None"""
+        path = Path(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+
+        key = str(path.resolve())
+        row = self.conn.execute(
+            "SELECT mtime_ns, size, digest FROM digests WHERE path = ?", (key,)
+        ).fetchone()
+        if row and row["mtime_ns"] == st.st_mtime_ns and row["size"] == st.st_size:
+            return row["digest"]
+
+        h = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+                h.update(chunk)
+        digest = h.hexdigest()
+        if not self.read_only:
+            self._remember_digest(key, st, digest)
+        return digest
+
+    def _remember_digest(self, key: str, st: os.stat_result, digest: str):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO digests(path, mtime_ns, size, digest) VALUES (?, ?, ?, ?)",
+                (key, st.st_mtime_ns, st.st_size, digest)
+            )
+
+    def action_key(self, stage: str, inputs: Iterable[Path], params: Optional[Dict] = None) -> str:
+        """스테이지 입력 파일 내용 + 파라미터 → action key (sha256 hex)"""
+        h = hashlib.sha256()
+        h.update(f"v{KEY_VERSION}:{stage};".encode("utf-8"))
+        inputs = [Path(path) for path in inputs]
+        for path in inputs:
+            h.update(f"{path.name}={self.file_digest(path) or 'missing'};".encode("utf-8"))
+        canonical = json.dumps(params or {}, ensure_ascii=False, sort_keys=True, default=str)
+        h.update(canonical.encode("utf-8"))
+        key = h.hexdigest()
+        self._key_inputs[key] = inputs
+        return key
+
+    def inputs_of(self, key: str) -> Optional[List[Path]]:
+        """action_key로 key를 계산할 때 사용한 입력 파일 (이번 프로세스에서 계산하지 않았으면 None)"""
+        return self._key_inputs.get(key)
+
+    # --------------------------------------------------------
+    # 저장 / 복원
+    # --------------------------------------------------------
+    def _object_path(self, digest: str, suffix: str) -> Path:
+        return self.objects_dir / digest[:2] / f"{digest}{suffix}"
+
+    @staticmethod
+    def _link_or_copy(src: Path, dst: Path):
+        """dst에 src를 하드링크 (다른 파일시스템이면 복사) - 임시 파일 후 교체"""
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{dst.name}.", suffix=".tmp", dir=str(dst.parent))
+        os.close(fd)
+        os.unlink(tmp_name)
+        try:
+            try:
+                os.link(src, tmp_name)
+            except OSError:
+                shutil.copy2(src, tmp_name)
+            os.replace(tmp_name, dst)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+
+    def lookup(self, key: str) -> Optional[Path]:
+        """key에 해당하는 object 경로 (없거나 파일이 사라졌거나 크기가 다르면 None)"""
+        row = self.conn.execute("SELECT object, suffix, size FROM actions WHERE key = ?", (key,)).fetchone()
+        if not row:
+            return None
+        path = self._object_path(row["object"], row["suffix"])
+        try:
+            size = os.stat(path).st_size
+        except OSError:
+            return None
+        if size != row["size"]:
+            # 하드링크된 출력이 제자리에서 잘리거나 덮어써진 경우 → 손상된 object 폐기 (dry_run이면 유지)
+            if not self.read_only:
+                os.unlink(path)
+            return None
+        return path
+
+    def _fetch_remote(self, key: str) -> Optional[Path]:
+        """원격 캐시에서 key를 내려받아 로컬 objects에 등록"""
+        if self.remote is None:
+            return None
+        fd, tmp_name = tempfile.mkstemp(prefix=".remote.", suffix=".tmp", dir=str(self.objects_dir))
+        os.close(fd)
+        try:
+            try:
+                meta = self.remote.get(key, Path(tmp_name))
+            except OSError as e:
+                print(f"  [WARN] 원격 캐시 읽기 실패 ({self.remote}): {e}")
+                meta = None
+            if meta is None:
+                return None
+
+            h = hashlib.sha256()
+            with open(tmp_name, "rb") as f:
+                for chunk in iter(lambda: f.read(HASH_CHUNK), b""):
+                    h.update(chunk)
+            digest = h.hexdigest()
+            if meta.get("size") is not None and meta["size"] != os.path.getsize(tmp_name):
+                print(f"  [WARN] 원격 캐시 객체 크기 불일치 (잘린 전송), 무시: {key[:12]}")
+                return None
+            if meta.get("digest") and meta["digest"] != digest:
+                print(f"  [WARN] 원격 캐시 객체 손상 (digest 불일치), 무시: {key[:12]}")
+                return None
+
+            suffix = meta.get("suffix", "")
+            obj = self._object_path(digest, suffix)
+            obj.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp_name, obj)
+            now = datetime.now().isoformat()
+            with self.conn:
+                self.conn.execute(
+                    "INSERT OR REPLACE INTO actions(key, stage, object, suffix, size, created_at, last_used) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, meta.get("stage", ""), digest, suffix, os.stat(obj).st_size, now, now)
+                )
+            return obj
+        finally:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+
+    def available(self, key: str) -> Optional[str]:
+        """key의 출력이 어디 있는지 ("local" / "remote" / None) - 내려받지 않음"""
+        if self.lookup(key) is not None:
+            return "local"
+        if self.remote is not None:
+            try:
+                if self.remote.exists(key):
+                    return "remote"
+            except OSError:
+                pass
+        return None
+
+    def restore(self, key: str, output_path: Path) -> bool:
+        """캐시된 출력을 output_path로 복원 (로컬에 없으면 원격 조회, 성공 여부)"""
+        obj = self.lookup(key) or self._fetch_remote(key)
+        if obj is None:
+            return False
+        output_path = Path(output_path)
+        self._link_or_copy(obj, output_path)
+        # 복원된 파일이 상위 산출물보다 새로워야 mtime 기반 판단(.wcol, status)이 맞음
+        os.utime(output_path)
+        self._remember_digest(str(output_path.resolve()), os.stat(output_path), obj.name[:64])
+        with self.conn:
+            self.conn.execute(
+                "UPDATE actions SET last_used = ? WHERE key = ?", (datetime.now().isoformat(), key)
+            )
+        return True
+
+    def store(self, key: str, stage: str, output_path: Path) -> Optional[str]:
+        """출력 파일을 objects에 등록하고 key → object 기록 (object digest 반환)"""
+        output_path = Path(output_path)
+        digest = self.file_digest(output_path)
+        if digest is None:
+            return None
+        suffix = output_path.suffix
+        obj = self._object_path(digest, suffix)
+        if not obj.exists():
+            self._link_or_copy(output_path, obj)
+        now = datetime.now().isoformat()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO actions(key, stage, object, suffix, size, created_at, last_used) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, stage, digest, suffix, os.stat(obj).st_size, now, now)
+            )
+
+        if self.remote is not None:
+            meta = {"stage": stage, "suffix": suffix, "size": os.stat(obj).st_size, "digest": digest}
+            try:
+                self.remote.put(key, obj, meta)
+            except OSError as e:
+                print(f"  [WARN] 원격 캐시 업로드 실패 ({self.remote}): {e}")
+        return digest
+
+    def forget(self, key: str):
+        """key 기록 삭제 (손상된 출력) - 다른 key가 쓰지 않는 object는 파일도 삭제"""
+        row = self.conn.execute("SELECT object, suffix FROM actions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return
+        with self.conn:
+            self.conn.execute("DELETE FROM actions WHERE key = ?", (key,))
+        shared = self.conn.execute("SELECT 1 FROM actions WHERE object = ? LIMIT 1", (row["object"],)).fetchone()
+        if shared is None:
+            try:
+                os.unlink(self._object_path(row["object"], row["suffix"]))
+            except FileNotFoundError:
+                pass
+
+    @staticmethod
+    def prepare_output(output_path: Path):
+        """작업 전 기존 출력 제거 (objects와 공유하는 하드링크에 덮어쓰지 않도록)"""
+        try:
+            os.unlink(output_path)
+        except FileNotFoundError:
+            pass
+
+    def stats(self) -> Dict[str, int]:
+        row = self.conn.execute("SELECT COUNT(*) AS n FROM actions").fetchone()
+        return {"actions": row["n"], "bytes": self.usage()}
+
+    # --------------------------------------------------------
+    # 용량 관리
+    # --------------------------------------------------------
+    def usage(self) -> int:
+        """objects 합계 바이트 (같은 object를 가리키는 key는 한 번만)"""
+        row = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) AS bytes FROM (SELECT MAX(size) AS size FROM actions GROUP BY object)"
+        ).fetchone()
+        return row["bytes"]
+
+    def over_budget(self) -> bool:
+        return bool(self.max_bytes) and self.usage() > self.max_bytes
+
+    def gc(self, pinned_keys: Iterable[str] = (), max_bytes: Optional[int] = None,
+           max_age_days: Optional[float] = None, dry_run: bool = False) -> Dict[str, int]:
+        """LRU/오래된 object 삭제
+
+        Args:
+            pinned_keys: 삭제하지 않을 action key (현재 프로젝트 출력)
+            max_bytes: 예산 (생략 시 self.max_bytes, 0/None이면 용량 제한 없음)
+            max_age_days: 이 기간 동안 사용되지 않은 object는 예산과 무관하게 삭제
+            dry_run: 삭제하지 않고 결과만 계산
+
+        Returns:
+            {removed, removed_bytes, freed_bytes, kept, kept_bytes, pinned}
+            freed_bytes: 실제로 디스크에서 해제된 바이트 (출력 파일과 하드링크를 공유하지 않던 object)
+        """
+        budget = self.max_bytes if max_bytes is None else max_bytes
+        pinned_keys = set(pinned_keys)
+        cutoff = None
+        if max_age_days is not None:
+            cutoff = datetime.fromtimestamp(datetime.now().timestamp() - max_age_days * 86400).isoformat()
+
+        objects: Dict[tuple, Dict] = {}
+        for row in self.conn.execute("SELECT key, object, suffix, size, last_used FROM actions"):
+            obj = objects.setdefault((row["object"], row["suffix"]), {
+                "size": row["size"], "last_used": row["last_used"], "pinned": False,
+            })
+            obj["last_used"] = max(obj["last_used"], row["last_used"])
+            obj["pinned"] = obj["pinned"] or row["key"] in pinned_keys
+
+        total = sum(obj["size"] for obj in objects.values())
+        result = {"removed": 0, "removed_bytes": 0, "freed_bytes": 0, "kept": 0, "kept_bytes": 0,
+                  "pinned": sum(1 for obj in objects.values() if obj["pinned"])}
+
+        # 오래 안 쓴 것부터
+        for (digest, suffix), obj in sorted(objects.items(), key=lambda item: item[1]["last_used"]):
+            path = self._object_path(digest, suffix)
+            expired = cutoff is not None and obj["last_used"] < cutoff
+            missing = not path.exists()
+            if not missing and (obj["pinned"] or not (expired or (budget and total > budget))):
+                result["kept"] += 1
+                result["kept_bytes"] += obj["size"]
+                continue
+
+            total -= obj["size"]
+            if missing:
+                # 수동 삭제 등으로 파일이 사라진 기록 정리
+                if not dry_run:
+                    with self.conn:
+                        self.conn.execute("DELETE FROM actions WHERE object = ?", (digest,))
+                continue
+
+            result["removed"] += 1
+            result["removed_bytes"] += obj["size"]
+            try:
+                if os.stat(path).st_nlink <= 1:
+                    result["freed_bytes"] += obj["size"]
+                if not dry_run:
+                    os.unlink(path)
+            except OSError:
+                pass
+            if not dry_run:
+                with self.conn:
+                    self.conn.execute("DELETE FROM actions WHERE object = ?", (digest,))
+
+        if not dry_run:
+            self._prune()
+        return result
+
+    def _prune(self):
+        """빈 objects 하위 폴더, 사라진 파일의 digest 메모 정리"""
+        for sub in self.objects_dir.iterdir():
+            if sub.is_dir():
+                try:
+                    sub.rmdir()
+                except OSError:
+                    pass
+        stale = [row["path"] for row in self.conn.execute("SELECT path FROM digests")
+                 if not os.path.exists(row["path"])]
+        if stale:
+            with self.conn:
+                self.conn.executemany("DELETE FROM digests WHERE path = ?", [(p,) for p in stale])
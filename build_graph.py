@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Build Graph - 스테이지 의존성 그래프(DAG) 실행기
+
+render → composite → section-merge → final을 명령 단위 장벽 없이 실행합니다.
+각 씬 렌더/합성, 섹션 합성, 최종 병합이 하나의 노드이고, 의존 노드가 모두 끝나면 바로 시작합니다.
+(hook 섹션의 씬이 끝나면 core1 렌더 중에도 hook 섹션 합성이 진행됨)
+
+노드는 pool에 속하고 pool마다 동시 실행 수를 제한합니다.
+    render   Remotion 렌더 (자체적으로 --concurrency만큼 병렬이므로 보통 1)
+    ffmpeg   합성/섹션/최종 인코딩
+준비된 노드는 priority가 큰 것부터, 같으면 추가한 순서대로 시작합니다.
+(렌더 노드에 예상 비용을 priority로 주면 longest-job-first → 마지막에 긴 씬 하나만 남는 일 방지)
+
+노드 함수는 bool을 반환합니다. False 또는 예외 → 실패, 이 노드에 의존하는 노드는 모두 skipped.
+
+사용법:
+    graph = BuildGraph()
+    graph.add("render:s1", lambda: render_scene("s1"), pool="render")
+    graph.add("section:hook", lambda: merge_section("hook"), deps=["render:s1"], pool="ffmpeg")
+    result = graph.run({"render": 1, "ffmpeg": 4})
+"""
+
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+class BuildGraph:
+    """노드: {func, deps, pool, priority}"""
+
+    def __init__(self):
+        self.nodes: Dict[str, Dict] = {}
+
+    def add(self, name: str, func: Callable[[], bool], deps: Iterable[str] = (), pool: str = "default",
+            priority: float = 0.0):
+        if name in self.nodes:
+            raise ValueError(f"중복 노드: {name}")
+        self.nodes[name] = {"func": func, "deps": list(deps), "pool": pool, "priority": priority,
+                            "order": len(self.nodes)}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.nodes
+
+    def validate(self):
+        """없는 의존성 / 순환 확인 (ValueError)"""
+        for name, node in self.nodes.items():
+            for dep in node["deps"]:
+                if dep not in self.nodes:
+                    raise ValueError(f"{name}: 알 수 없는 의존 노드 {dep}")
+
+        visiting, visited = set(), set()
+        for root in self.nodes:
+            stack = [(root, iter(self.nodes[root]["deps"]))]
+            visiting.add(root)
+            while stack:
+                name, deps = stack[-1]
+                dep = next(deps, None)
+                if dep is None:
+                    stack.pop()
+                    visiting.discard(name)
+                    visited.add(name)
+                elif dep in visiting:
+                    raise ValueError(f"순환 의존성: {dep} ↔ {name}")
+                elif dep not in visited:
+                    visiting.add(dep)
+                    stack.append((dep, iter(self.nodes[dep]["deps"])))
+
+    def run(self, pools: Optional[Dict[str, int]] = None,
+            on_finish: Optional[Callable[[str, str, float], None]] = None) -> Dict:
+        """그래프 실행
+
+        Args:
+            pools: {pool 이름: 동시 실행 수} (없는 pool은 1)
+            on_finish: (노드, "done"|"failed"|"skipped", 소요 초) 콜백
+
+        Returns:
+            {done, failed, skipped, timings, elapsed}
+        """
+        self.validate()
+        pools = dict(pools or {})
+        started = time.monotonic()
+
+        waiting = {name: set(node["deps"]) for name, node in self.nodes.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.nodes}
+        for name, node in self.nodes.items():
+            for dep in node["deps"]:
+                dependents[dep].append(name)
+
+        running: Dict[str, int] = {}
+        result = {"done": [], "failed": [], "skipped": [], "timings": {}, "elapsed": 0.0}
+
+        def skip_dependents(name: str):
+            stack = list(dependents[name])
+            while stack:
+                dependent = stack.pop()
+                if dependent in waiting:
+                    del waiting[dependent]
+                    result["skipped"].append(dependent)
+                    if on_finish:
+                        on_finish(dependent, "skipped", 0.0)
+                    stack.extend(dependents[dependent])
+
+        workers = max(1, sum(pools.get(pool, 1) for pool in {n["pool"] for n in self.nodes.values()}))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            while waiting or futures:
+                # 준비된 노드를 priority 순서로, pool 여유가 있는 만큼 시작
+                ready = sorted((name for name, deps in waiting.items() if not deps),
+                               key=lambda n: (-self.nodes[n]["priority"], self.nodes[n]["order"]))
+                for name in ready:
+                    pool = self.nodes[name]["pool"]
+                    if running.get(pool, 0) >= pools.get(pool, 1):
+                        continue
+                    del waiting[name]
+                    running[pool] = running.get(pool, 0) + 1
+                    futures[executor.submit(self._call, name)] = name
+
+                if not futures:
+                    break
+                finished, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = futures.pop(future)
+                    running[self.nodes[name]["pool"]] -= 1
+                    ok, elapsed = future.result()
+                    result["timings"][name] = round(elapsed, 2)
+                    if on_finish:
+                        on_finish(name, "done" if ok else "failed", elapsed)
+                    if ok:
+                        result["done"].append(name)
+                        for dependent in dependents[name]:
+                            if dependent in waiting:
+                                waiting[dependent].discard(name)
+                    else:
+                        result["failed"].append(name)
+                        skip_dependents(name)
+
+        result["elapsed"] = round(time.monotonic() - started, 2)
+        return result
+
+    def _call(self, name: str) -> tuple:
+        started = time.monotonic()
+        try:
+            ok = bool(self.nodes[name]["func"]())
+        except Exception as e:
+            print(f"  [ERROR] {name}: {type(e).__name__}: {e}")
+            traceback.print_exc()
+            ok = False
+        return ok, time.monotonic() - started
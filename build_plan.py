@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Build Plan - 실행 전 작업 목록 + 소요 시간 추정 (dry-run)
+
+render / section-merge / final을 시작하기 전에 어떤 씬/섹션이 다시 빌드되어야 하는지,
+얼마나 걸릴지 보여줍니다. 실제 판단은 각 스테이지와 같은 입력 key(build_cache)를 사용합니다.
+
+작업 종류:
+    skip      출력이 최신 (ledger done + 같은 입력 key)
+    restore   빌드 캐시(로컬/원격)에 같은 key의 출력이 있음 → 복원만
+    build     실제로 렌더/인코딩 필요
+
+시간 추정 (CostModel):
+    1) 같은 unit의 이전 실행 기록이 있으면 그 시간
+    2) 스테이지의 과거 기록에서 구한 프레임당 평균 시간 × 프레임 수
+    3) 기록이 없으면 DEFAULT_SECONDS_PER_FRAME × 프레임 수
+    CPU 시간 ≈ wall 시간 × 병렬도 (render: --concurrency, ffmpeg: CPU 코어 수)
+"""
+
+import os
+from typing import Dict, List, Optional
+
+
+ACTION_SKIP = "skip"
+ACTION_RESTORE = "restore"
+ACTION_BUILD = "build"
+
+# 기록이 없을 때 사용할 프레임당 wall 시간 (초) - 1080p 기준 대략값
+DEFAULT_SECONDS_PER_FRAME = {
+    "render": 0.15,
+    "composite": 0.02,
+    "section-merge": 0.01,
+    "final": 0.01,
+}
+
+# 캐시 복원 1건 예상 시간 (초)
+RESTORE_SECONDS = 0.5
+
+
+class BuildPlan:
+    """작업 목록 - 항목: {stage, unit, action, frames, wall, cpu, reason}"""
+
+    def __init__(self, cost: "CostModel"):
+        self.cost = cost
+        self.items: List[Dict] = []
+        self._actions: Dict[tuple, str] = {}
+
+    def add(self, stage: str, unit: str, action: str, frames: int = 0, reason: str = "") -> str:
+        wall, cpu = self.cost.estimate(stage, unit, frames, action)
+        self.items.append({
+            "stage": stage, "unit": unit, "action": action, "frames": frames,
+            "wall": round(wall, 2), "cpu": round(cpu, 2), "reason": reason,
+        })
+        self._actions[(stage, unit)] = action
+        return action
+
+    def action_of(self, stage: str, unit: str) -> Optional[str]:
+        return self._actions.get((stage, unit))
+
+    def totals(self) -> Dict[str, Dict]:
+        """{stage: {build, restore, skip, wall, cpu}}"""
+        result: Dict[str, Dict] = {}
+        for item in self.items:
+            t = result.setdefault(item["stage"], {ACTION_BUILD: 0, ACTION_RESTORE: 0, ACTION_SKIP: 0,
+                                                  "wall": 0.0, "cpu": 0.0})
+            t[item["action"]] += 1
+            t["wall"] += item["wall"]
+            t["cpu"] += item["cpu"]
+        return result
+
+    def to_dict(self) -> Dict:
+        totals = self.totals()
+        return {
+            "items": self.items,
+            "totals": totals,
+            "wall": sum(t["wall"] for t in totals.values()),
+            "cpu": sum(t["cpu"] for t in totals.values()),
+        }
+
+
+class CostModel:
+    """ledger 기록 기반 소요 시간 추정"""
+
+    def __init__(self, entries: List[Dict], frames_of: Dict[tuple, int],
+                 render_parallelism: int = 4, ffmpeg_parallelism: Optional[int] = None):
+        """
+        Args:
+            entries: StageLedger.entries() (duration이 기록된 done 항목 사용)
+            frames_of: {(stage, unit): 현재 프레임 수}
+        """
+        self.render_parallelism = render_parallelism
+        self.ffmpeg_parallelism = ffmpeg_parallelism or os.cpu_count() or 1
+        self._unit_seconds: Dict[tuple, float] = {}
+        totals: Dict[str, List[float]] = {}
+
+        for entry in entries:
+            if entry.get("status") != "done" or not entry.get("duration"):
+                continue
+            key = (entry["stage"], entry["unit"])
+            frames = frames_of.get(key)
+            self._unit_seconds[key] = entry["duration"]
+            if frames:
+                acc = totals.setdefault(entry["stage"], [0.0, 0])
+                acc[0] += entry["duration"]
+                acc[1] += frames
+
+        self.seconds_per_frame = dict(DEFAULT_SECONDS_PER_FRAME)
+        self.history_based = set()
+        for stage, (seconds, frames) in totals.items():
+            if frames:
+                self.seconds_per_frame[stage] = seconds / frames
+                self.history_based.add(stage)
+
+    def parallelism(self, stage: str) -> int:
+        return self.render_parallelism if stage == "render" else self.ffmpeg_parallelism
+
+    def estimate(self, stage: str, unit: str, frames: int, action: str) -> tuple:
+        """(wall 초, CPU 초)"""
+        if action == ACTION_SKIP:
+            return 0.0, 0.0
+        if action == ACTION_RESTORE:
+            return RESTORE_SECONDS, RESTORE_SECONDS
+
+        previous = self._unit_seconds.get((stage, unit))
+        if previous is not None:
+            wall = previous
+        else:
+            wall = frames * self.seconds_per_frame.get(stage, 0.05)
+        return wall, wall * self.parallelism(stage)
+
+
+def format_duration(seconds: float) -> str:
+    seconds = int(round(seconds))
+    if seconds >= 3600:
+        return f"{seconds // 3600}h{(seconds % 3600) // 60:02d}m"
+    if seconds >= 60:
+        return f"{seconds // 60}m{seconds % 60:02d}s"
+    return f"{seconds}s"
+
+
+def print_plan(plan: BuildPlan, show_skipped: bool = False):
+    """작업 목록 + 스테이지별 합계 출력"""
+    symbols = {ACTION_BUILD: "🔨", ACTION_RESTORE: "📦", ACTION_SKIP: "✓"}
+
+    for item in plan.items:
+        if item["action"] == ACTION_SKIP and not show_skipped:
+            continue
+        detail = f" ({item['reason']})" if item["reason"] else ""
+        print(f"  {symbols[item['action']]} {item['stage']:<14}{item['unit']:<10}{item['action']:<8}"
+              f"{item['frames']:>7}f {format_duration(item['wall']):>8}{detail}")
+
+    totals = plan.totals()
+    print("\n📋 요약:")
+    print(f"  {'stage':<14}{'build':>7}{'restore':>9}{'skip':>7}{'wall':>10}{'cpu':>10}")
+    for stage, t in totals.items():
+        print(f"  {stage:<14}{t[ACTION_BUILD]:>7}{t[ACTION_RESTORE]:>9}{t[ACTION_SKIP]:>7}"
+              f"{format_duration(t['wall']):>10}{format_duration(t['cpu']):>10}")
+    summary = plan.to_dict()
+    print(f"\n  예상 소요: wall {format_duration(summary['wall'])}, CPU {format_duration(summary['cpu'])}")
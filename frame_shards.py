@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Frame Shards - 긴 씬을 프레임 구간으로 나눠 병렬 렌더 후 무손실 연결
+
+긴 씬 하나는 `npx remotion render` 프로세스 하나가 처음부터 끝까지 렌더하므로
+전체 배치의 critical path가 되고, 900프레임 중 800에서 죽으면 전부 다시 렌더해야 했습니다.
+
+    1) 구간 분할 (plan_shards): 0-299, 300-599, 600-899 (구간당 최소 MIN_SHARD_FRAMES)
+    2) 구간마다 별도 프로세스로 렌더 (--frames=a-b), 동시에 jobs개
+    3) 실패한 구간만 재시도 (최대 retries회) - 완료된 구간 파일은 작업 폴더에 남아 다음 실행에서도 재사용
+    4) ffmpeg concat demuxer + -c copy로 재인코딩 없이 연결
+       (구간마다 키프레임으로 시작하고 인코더 설정이 같으므로 무손실, 씬 영상에는 오디오 없음)
+
+작업 폴더는 렌더 입력 key로 구분하므로 입력이 바뀌면 이전 구간 파일은 재사용하지 않습니다.
+구간 렌더 함수는 호출자가 넘기므로 (로컬 프로세스, 원격 머신 등) 실행 방식과 무관합니다.
+
+사용법:
+    sharder = ShardedRender(work_dir, render_shard, jobs=3)
+    result = sharder.run(plan_shards(900, 3), suffix=".mp4")
+    if result["ok"]:
+        ok, error = concat_shards(result["paths"], output_path)
+"""
+
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from media_integrity import atomic_output, commit_output
+
+
+MIN_SHARD_FRAMES = 60     # 구간이 너무 짧으면 프로세스/브라우저 시작 비용이 더 큼
+SHARD_RETRIES = 2
+
+
+def plan_shards(frames: int, shards: int, min_frames: int = MIN_SHARD_FRAMES) -> List[Tuple[int, int]]:
+    """[0, frames)를 최대 shards개의 연속 구간 (시작, 끝 포함)으로 균등 분할"""
+    if frames <= 0:
+        return []
+    count = max(1, min(shards, frames // max(1, min_frames)))
+    bounds = [round(i * frames / count) for i in range(count + 1)]
+    return [(bounds[i], bounds[i + 1] - 1) for i in range(count)]
+
+
+def shard_name(start: int, end: int, suffix: str) -> str:
+    return f"{start:06d}-{end:06d}{suffix}"
+
+
+class ShardedRender:
+    """구간 병렬 렌더 + 실패 구간 재시도"""
+
+    def __init__(self, work_dir: Path, render_shard: Callable[[int, int, Path], Tuple[bool, str]],
+                 jobs: int, retries: int = SHARD_RETRIES):
+        """
+        Args:
+            work_dir: 구간 파일 폴더 (입력 key별)
+            render_shard: (시작, 끝, 출력 경로) → (성공 여부, 오류 메시지)
+            jobs: 동시에 렌더할 구간 수
+            retries: 실패한 구간 재시도 횟수
+        """
+        self.work_dir = Path(work_dir)
+        self.render_shard = render_shard
+        self.jobs = max(1, jobs)
+        self.retries = retries
+
+    def run(self, ranges: List[Tuple[int, int]], suffix: str) -> Dict:
+        """모든 구간 렌더 → {ok, paths, reused, rendered, failed: [(시작, 끝, 오류)]}"""
+        self.work_dir.mkdir(parents=True, exist_ok=True)
+        paths = [self.work_dir / shard_name(start, end, suffix) for start, end in ranges]
+        # 이전 실행에서 완료된 구간 (임시 이름으로 쓰고 rename하므로 존재하면 완성본)
+        pending = [i for i, path in enumerate(paths) if not (path.exists() and path.stat().st_size > 0)]
+        reused = len(ranges) - len(pending)
+        rendered = 0
+        errors: Dict[int, str] = {}
+
+        def render(index: int) -> Tuple[int, bool, str]:
+            start, end = ranges[index]
+            with atomic_output(paths[index]) as partial:
+                ok, error = self.render_shard(start, end, partial)
+                ok = ok and commit_output(partial, paths[index])
+            return index, ok, error or ("" if ok else "출력 파일 없음")
+
+        for attempt in range(self.retries + 1):
+            if not pending:
+                break
+            if attempt:
+                print(f"  [RETRY] 실패한 구간 {len(pending)}개 재시도 ({attempt}/{self.retries})")
+            with ThreadPoolExecutor(max_workers=min(self.jobs, len(pending))) as executor:
+                outcomes = list(executor.map(render, pending))
+            pending = []
+            for index, ok, error in outcomes:
+                if ok:
+                    rendered += 1
+                    errors.pop(index, None)
+                else:
+                    pending.append(index)
+                    errors[index] = error
+
+        failed = [(ranges[i][0], ranges[i][1], errors[i]) for i in pending]
+        return {"ok": not failed, "paths": paths, "reused": reused, "rendered": rendered, "failed": failed}
+
+    def cleanup(self):
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+
+def concat_shards(paths: List[Path], output: Path) -> Tuple[bool, str]:
+    """구간 파일을 재인코딩 없이 연결 (ffmpeg concat demuxer, -c copy)"""
+    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
+        for path in paths:
+            f.write(f"file '{path}'\n")
+        list_file = f.name
+    try:
+        cmd = ["ffmpeg", "-y", "-v", "error", "-f", "concat", "-safe", "0", "-i", list_file, "-c", "copy", str(output)]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    finally:
+        os.unlink(list_file)
+    if result.returncode != 0:
+        return False, result.stderr[:500] or "concat 실패"
+    return True, ""
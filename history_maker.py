@@ -30,7 +30,6 @@ History Video Maker - 메인 유틸리티 모듈
     python history_maker.py tts-pipeline
 """
 
-import json
 import sys
 import argparse
 import os
@@ -40,6 +39,9 @@ from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+from json_io import file_lock, read_json, update_json, write_json_atomic
+from project_index import ProjectIndex
+
 # .env 로드
 try:
     from dotenv import load_dotenv
@@ -90,6 +92,9 @@ REMOTION_DIR = BASE_DIR / "remotion"
 REMOTION_SCENES_DIR = REMOTION_DIR / "src" / "scenes"
 REMOTION_ASSETS_DIR = REMOTION_DIR / "public" / "assets"
 
+# 프로젝트 문서 캐시 (scenes.json, s#.json 등 한 번만 파싱)
+PROJECT = ProjectIndex(SCRIPTS_DIR, AUDIO_DIR)
+
 # 에셋 카테고리 디렉토리
 ASSET_CATEGORIES = {
     "maps": ASSETS_DIR / "maps",
@@ -125,15 +130,13 @@ STORAGE_BUCKET = "history-assets"
 # ============================================================
 def load_json(filepath: Path) -> dict:
     """JSON 파일 로드"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    return read_json(filepath)
 
 
 def save_json(data: dict, filepath: Path, quiet: bool = False):
-    """JSON 파일 저장 (들여쓰기 2칸)"""
-    filepath.parent.mkdir(parents=True, exist_ok=True)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    """JSON 파일 저장 (들여쓰기 2칸, 임시 파일 + rename으로 원자적 교체)"""
+    write_json_atomic(filepath, data)
+    PROJECT.invalidate(filepath)
     if not quiet:
         print(f"  -> {filepath.name}")
 
@@ -165,11 +168,14 @@ def get_project_info() -> dict:
 
 
 def update_state(updates: dict):
-    """state.json 업데이트"""
-    state = get_project_info()
-    state.update(updates)
-    state["updated_at"] = datetime.now().isoformat()
-    save_json(state, STATE_FILE, quiet=True)
+    """state.json 업데이트 (잠금 + 최신 state에 병합 - 동시 실행 워커 간 유실 방지)"""
+    def apply(state: dict):
+        if not state:
+            state.update(get_project_info())
+        state.update(updates)
+        state["updated_at"] = datetime.now().isoformat()
+
+    update_json(STATE_FILE, apply)
 
 
 # ============================================================
@@ -497,7 +503,8 @@ def cmd_clean(phase: Optional[int] = None, keep_assets: bool = False):
             "created_at": datetime.now().isoformat(),
             "updated_at": datetime.now().isoformat()
         }
-        save_json(initial_state, STATE_FILE, quiet=True)
+        with file_lock(STATE_FILE):
+            save_json(initial_state, STATE_FILE, quiet=True)
         print("  -> phase: initialized, step: 1")
 
     # 결과 요약
@@ -555,12 +562,11 @@ def get_image_info(filepath: Path) -> Dict[str, Any]:
 
 def extract_required_assets() -> List[Dict[str, Any]]:
     """scenes.json에서 필요한 에셋 목록 추출"""
-    scenes_file = SCRIPTS_DIR / "scenes.json"
-    if not scenes_file.exists():
+    data = PROJECT.scenes_doc()
+    if data is None:
         print("오류: scenes.json 파일이 없습니다.")
         return []
 
-    data = load_json(scenes_file)
     assets = []
     seen = set()
 
@@ -1287,7 +1293,7 @@ def cmd_tts_generate(voice: str = "nova"):
         print(f"\n[{section}] TTS 생성 중...")
 
         # narration_tts 합치기
-        data = load_json(scene_file)
+        data = PROJECT.load(scene_file)
         scenes = data.get("scenes", [])
         full_text = " ".join([s.get("narration_tts", "") for s in scenes])
 
@@ -1384,7 +1390,7 @@ def cmd_tts_split():
     timing_count = 0
 
     for split_file in split_files:
-        data = load_json(split_file)
+        data = PROJECT.load(split_file)
 
         # 단일 파일인 경우 (split_points.json)
         if "sections" in data:
@@ -0,0 +1,168 @@
+#!/usr/bin/env python3
+"""
+Intermediates - 중간 파일 수명 관리 (참조 카운트)
+
+투명 렌더(5_renders/*_raw.webm)처럼 다음 스테이지에서만 쓰이는 파일은
+생산할 때 소비자 목록을 등록하고, 마지막 소비자가 끝나면 바로 삭제합니다.
+한 단계 안에서만 쓰는 임시 파일(_padded.mp4, _extended.mp4)은 path()로 위치를 받고
+사용 직후 discard()로 삭제합니다.
+
+소비자 이름은 "stage:unit" (예: "composite:s3").
+삭제된 중간 파일은 build_cache에 남아 있으므로 (gc에서 보호), 소비자 입력이 바뀌어 다시 필요해지면
+생산 스테이지의 key로 복원할 수 있습니다. 캐시에서도 사라졌으면 consumed()가 False가 되어 다시 생산합니다.
+
+scratch 폴더 (PIPELINE_SCRATCH_DIR):
+    중간 파일을 tmpfs / 빠른 NVMe 등 별도 경로에 둡니다 (프로젝트 디스크 I/O 경합 감소).
+    설정하지 않으면 기존 위치(output 하위 폴더)를 그대로 사용합니다.
+
+환경 변수:
+    PIPELINE_SCRATCH_DIR          중간 파일 위치
+    PIPELINE_KEEP_INTERMEDIATES   1이면 삭제하지 않음 (디버깅용)
+
+사용법:
+    tracker = Intermediates(OUTPUT_DIR / "ledger.db")
+    tracker.register(raw_path, ["composite:s3"], fingerprint)
+    ...
+    tracker.release(raw_path, "composite:s3")      # 마지막 소비자 → 파일 삭제
+
+    padded = tracker.path(COMPOSITE_DIR, "s3_padded.mp4")   # scratch 또는 6_scenes/
+    ...
+    tracker.discard([padded])
+"""
+
+import json
+import os
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS intermediates (
+    path         TEXT PRIMARY KEY,
+    fingerprint  TEXT,
+    remaining    TEXT NOT NULL,
+    created_at   TEXT NOT NULL,
+    released_at  TEXT
+);
+"""
+
+
+def scratch_dir() -> Optional[Path]:
+    """PIPELINE_SCRATCH_DIR (없으면 None)"""
+    location = os.environ.get("PIPELINE_SCRATCH_DIR", "").strip()
+    return Path(location) if location else None
+
+
+def keep_intermediates() -> bool:
+    return os.environ.get("PIPELINE_KEEP_INTERMEDIATES") == "1"
+
+
+class Intermediates:
+    """중간 파일 참조 카운트"""
+
+    def __init__(self, db_path: Path, scratch: Optional[Path] = None, keep: Optional[bool] = None):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.scratch = scratch if scratch is not None else scratch_dir()
+        self.keep = keep_intermediates() if keep is None else keep
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    # --------------------------------------------------------
+    # 위치
+    # --------------------------------------------------------
+    def path(self, default_dir: Path, name: str) -> Path:
+        """중간 파일 경로 (scratch가 있으면 scratch/{폴더명}/name)"""
+        base = self.scratch / Path(default_dir).name if self.scratch else Path(default_dir)
+        base.mkdir(parents=True, exist_ok=True)
+        return base / name
+
+    def discard(self, paths: Iterable[Path]) -> int:
+        """한 단계 안에서만 쓰는 임시 중간 파일 삭제 (삭제 개수)"""
+        if self.keep:
+            return 0
+        return sum(_unlink(Path(p)) for p in paths)
+
+    # --------------------------------------------------------
+    # 참조 카운트
+    # --------------------------------------------------------
+    def register(self, path: Path, consumers: Iterable[str], fingerprint: Optional[str] = None):
+        """새로 만든 중간 파일과 이를 사용할 소비자 등록 (기존 기록은 덮어씀)"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO intermediates(path, fingerprint, remaining, created_at, released_at) "
+                "VALUES (?, ?, ?, ?, NULL)",
+                (str(Path(path).resolve()), fingerprint, json.dumps(sorted(set(consumers))),
+                 datetime.now().isoformat())
+            )
+
+    def release(self, path: Path, consumer: str) -> bool:
+        """소비자 완료 표시 - 남은 소비자가 없으면 파일 삭제 (삭제했으면 True)"""
+        key = str(Path(path).resolve())
+        row = self.conn.execute("SELECT remaining FROM intermediates WHERE path = ?", (key,)).fetchone()
+        if row is None:
+            return False
+        remaining = [c for c in json.loads(row["remaining"]) if c != consumer]
+        released_at = datetime.now().isoformat() if not remaining else None
+        with self.conn:
+            self.conn.execute(
+                "UPDATE intermediates SET remaining = ?, released_at = ? WHERE path = ?",
+                (json.dumps(remaining), released_at, key)
+            )
+        if remaining or self.keep:
+            return False
+        return _unlink(Path(path))
+
+    def consumed(self, path: Path, fingerprint: Optional[str] = None,
+                 available: Optional[Callable[[str], bool]] = None) -> bool:
+        """같은 입력으로 만든 중간 파일이 모든 소비자에게 사용된 뒤 삭제되었는지
+
+        available(fingerprint)를 주면 삭제된 파일을 다시 복원할 수 있을 때만 True
+        (캐시에서 사라졌으면 생산 스테이지를 다시 실행해야 함).
+        """
+        row = self.conn.execute(
+            "SELECT fingerprint, released_at FROM intermediates WHERE path = ?", (str(Path(path).resolve()),)
+        ).fetchone()
+        if row is None or row["released_at"] is None:
+            return False
+        if fingerprint is not None and row["fingerprint"] != fingerprint:
+            return False
+        return available is None or (bool(row["fingerprint"]) and available(row["fingerprint"]))
+
+    def released_keys(self) -> Set[str]:
+        """삭제된 중간 파일의 key (캐시 gc에서 보호 - 소비자 입력이 바뀌면 복원해야 함)"""
+        return {row["fingerprint"] for row in self.conn.execute(
+            "SELECT fingerprint FROM intermediates WHERE released_at IS NOT NULL AND fingerprint IS NOT NULL"
+        )}
+
+    def forget(self, path: Optional[Path] = None) -> int:
+        """기록 삭제 (path 생략 시 전체) - ledger 초기화/clean 후 생산 스테이지를 다시 실행하도록"""
+        with self.conn:
+            if path is None:
+                cursor = self.conn.execute("DELETE FROM intermediates")
+            else:
+                cursor = self.conn.execute("DELETE FROM intermediates WHERE path = ?", (str(Path(path).resolve()),))
+        return cursor.rowcount
+
+    def pending(self) -> List[Dict]:
+        """아직 소비자가 남은 중간 파일 [{path, remaining, exists}]"""
+        result = []
+        for row in self.conn.execute("SELECT path, remaining FROM intermediates WHERE released_at IS NULL"):
+            result.append({"path": row["path"], "remaining": json.loads(row["remaining"]),
+                           "exists": os.path.exists(row["path"])})
+        return result
+
+
+def _unlink(path: Path) -> bool:
+    try:
+        os.unlink(path)
+        return True
+    except FileNotFoundError:
+        return False
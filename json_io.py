@@ -0,0 +1,276 @@
+#!/usr/bin/env python3
+"""
+JSON I/O - 직렬화 백엔드 + 원자적 파일 쓰기 + 파일 잠금
+
+여러 워커 프로세스(렌더, TTS, 타이밍)가 같은 프로젝트 폴더를 공유해도
+파일이 잘리거나(truncate) 업데이트가 유실되지 않도록 합니다.
+
+- read_json / dumps / loads: orjson > msgspec > 표준 json 순으로 사용 가능한 백엔드 선택
+  (PIPELINE_JSON_BACKEND=stdlib|orjson|msgspec 으로 강제 가능)
+- write_json_atomic: 에이전트가 읽는 파일은 들여쓰기 2칸, 기계만 읽는 파일
+  (*_whisper.json, *_timed.json 등)은 compact 형식으로 저장
+  (PIPELINE_PRETTY_JSON=1 이면 모두 들여쓰기)
+- atomic_write_text: 같은 폴더의 임시 파일에 쓴 뒤 os.replace()
+  → 읽는 쪽은 항상 이전 내용 또는 새 내용 전체만 보게 됨
+- file_lock: <파일>.lock 에 대한 advisory 잠금 (POSIX flock / Windows msvcrt)
+- update_json: 잠금 상태에서 최신 내용을 읽고 → 수정 → 원자적 저장
+
+벤치마크: python benchmarks/bench_json_io.py
+"""
+
+import fnmatch
+import json
+import os
+import stat
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# 빠른 JSON 파서 (선택)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
+
+
+# ============================================================
+# 직렬화 백엔드
+# ============================================================
+# 기계만 읽는 파일 (compact JSON으로 저장)
+MACHINE_ONLY_PATTERNS = [
+    "*_whisper.json",
+    "*_timestamps.json",
+    "*_timed.json",
+    "*_timing.json",
+]
+
+
+def _select_backend() -> str:
+    forced = os.environ.get("PIPELINE_JSON_BACKEND", "").strip().lower()
+    if forced == "orjson" and ORJSON_AVAILABLE:
+        return "orjson"
+    if forced == "msgspec" and MSGSPEC_AVAILABLE:
+        return "msgspec"
+    if forced == "stdlib":
+        return "stdlib"
+    if ORJSON_AVAILABLE:
+        return "orjson"
+    if MSGSPEC_AVAILABLE:
+        return "msgspec"
+    return "stdlib"
+
+
+BACKEND = _select_backend()
+
+
+def loads(data, backend: Optional[str] = None) -> Any:
+    """bytes/str → 객체"""
+    backend = backend or BACKEND
+    if backend == "orjson":
+        return orjson.loads(data)
+    if backend == "msgspec":
+        return msgspec.json.decode(data.encode("utf-8") if isinstance(data, str) else data)
+    return json.loads(data)
+
+
+def dumps(data: Any, pretty: bool = True, backend: Optional[str] = None) -> bytes:
+    """객체 → UTF-8 bytes (pretty: 들여쓰기 2칸, 아니면 compact)
+
+    모든 백엔드가 ensure_ascii=False와 같은 결과(한글 그대로)를 냅니다.
+    """
+    backend = backend or BACKEND
+    if backend == "orjson":
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if backend == "msgspec":
+        encoded = msgspec.json.encode(data)
+        return msgspec.json.format(encoded, indent=2) if pretty else encoded
+    if pretty:
+        return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def read_json(path: Path) -> Any:
+    """JSON 파일 로드 (선택된 백엔드 사용)"""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def is_machine_only(path: Path) -> bool:
+    """기계만 읽는 파일인지 (compact 저장 대상)"""
+    if os.environ.get("PIPELINE_PRETTY_JSON") == "1":
+        return False
+    name = Path(path).name
+    return any(fnmatch.fnmatch(name, pattern) for pattern in MACHINE_ONLY_PATTERNS)
+
+
+# ============================================================
+# 원자적 쓰기
+# ============================================================
+def atomic_write_bytes(path: Path, data: bytes):
+    """임시 파일에 쓰고 rename (같은 파일시스템 내 원자적 교체)"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp는 0600으로 만듦 → 기존 파일 권한 유지 (새 파일은 umask 기준 기본 권한)
+        os.chmod(tmp_name, _target_mode(path))
+        _replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
+
+# 프로세스 umask (os.umask는 조회만 할 수 없으므로 import 시 한 번 읽음 - 스레드에서 바꾸지 않도록)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _target_mode(path: Path) -> int:
+    """교체 후 파일 권한 - 기존 파일 권한, 새 파일은 0666 & ~umask"""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8"):
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+def write_json_atomic(path: Path, data: Any, pretty: Optional[bool] = None):
+    """JSON 원자적 저장
+
+    Args:
+        pretty: None이면 파일명으로 결정 (에이전트용 → 들여쓰기, 기계용 → compact)
+    """
+    if pretty is None:
+        pretty = not is_machine_only(path)
+    atomic_write_bytes(path, dumps(data, pretty=pretty))
+
+
+def write_json_if_changed(path: Path, data: Any, pretty: Optional[bool] = None) -> bool:
+    """직렬화 결과가 기존 파일과 다를 때만 원자적 저장
+
+    Returns:
+        실제로 저장했는지 여부
+    """
+    path = Path(path)
+    if pretty is None:
+        pretty = not is_machine_only(path)
+    encoded = dumps(data, pretty=pretty)
+    try:
+        with open(path, "rb") as f:
+            if f.read() == encoded:
+                return False
+    except OSError:
+        pass
+    atomic_write_bytes(path, encoded)
+    return True
+
+
+def _replace(src: str, dst: Path, retries: int = 10):
+    """os.replace - Windows에서 다른 프로세스가 대상 파일을 열고 있으면 잠시 재시도"""
+    for attempt in range(retries):
+        try:
+            os.replace(src, dst)
+            return
+        except PermissionError:
+            if attempt == retries - 1:
+                raise
+            time.sleep(0.05 * (attempt + 1))
+
+
+# ============================================================
+# 파일 잠금
+# ============================================================
+def _try_lock(fd: int):
+    if os.name == "nt":
+        msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+
+def _unlock(fd: int):
+    if os.name == "nt":
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float = 30.0):
+    """<path>.lock 파일로 프로세스 간 배타 잠금
+
+    Raises:
+        TimeoutError: timeout 초 안에 잠금을 얻지 못한 경우
+    """
+    lock_path = Path(str(path) + ".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                _try_lock(fd)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"lock timeout: {lock_path}")
+                time.sleep(0.05)
+        try:
+            yield
+        finally:
+            _unlock(fd)
+    finally:
+        os.close(fd)
+
+
+def update_json(path: Path, mutate: Callable[[Any], Any], default: Callable[[], Any] = dict,
+                pretty: Optional[bool] = None) -> Any:
+    """잠금 → 최신 내용 읽기 → mutate → 원자적 저장
+
+    Args:
+        mutate: 현재 데이터를 받아 수정. 새 객체를 반환하면 그것을 저장, None이면 인자를 저장
+        default: 파일이 없거나 비어 있을 때 사용할 초기값 생성 함수
+    Returns:
+        저장된 데이터
+    """
+    path = Path(path)
+    with file_lock(path):
+        data = None
+        if path.exists():
+            with open(path, "rb") as f:
+                raw = f.read()
+            if raw.strip():
+                data = loads(raw)
+        if data is None:
+            data = default()
+
+        result = mutate(data)
+        if result is not None:
+            data = result
+
+        write_json_atomic(path, data, pretty=pretty)
+        return data
@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+Media Integrity - 원자적 영상 출력 + 무결성 인덱스
+
+Remotion/ffmpeg가 쓰는 도중 중단되면 잘린 MP4가 남고, 다음 실행은 "이미 있음"으로 보고
+스킵해 최종 영상에 깨진 씬이 들어갈 수 있었습니다.
+
+1) 원자적 출력
+    모든 영상 출력은 같은 폴더의 임시 이름(.s1.partial.mp4)에 쓰고, 성공하면 rename합니다.
+    확장자를 유지하므로 ffmpeg/Remotion의 포맷 추정은 그대로입니다.
+
+2) 무결성 인덱스 (SQLite media 테이블)
+    완성된 출력마다 크기, mtime, 길이, 스트림 구성, 체크섬을 기록합니다.
+    재사용 시 검증 (verify):
+        크기 다름                  → 손상
+        크기/mtime 같음            → 정상 (stat 1회)
+        mtime만 다름               → 체크섬 비교 (앞/뒤 1MB 샘플, 캐시 복원/touch 대응)
+        기록 없음 (이전 산출물)    → ffprobe로 확인 후 기록
+        deep=True                  → ffprobe 길이/스트림까지 재확인
+
+사용법:
+    with atomic_output(output_path) as partial:
+        run(f'ffmpeg ... "{partial}"')
+        if ok:
+            commit_output(partial, output_path)
+    index = MediaIndex(OUTPUT_DIR / "ledger.db")
+    index.record(output_path)
+    index.verify(output_path)    # True / False
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import subprocess
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+
+MEDIA_SUFFIXES = {".mp4", ".webm", ".mov", ".mkv", ".mp3", ".wav", ".m4a"}
+SAMPLE_BYTES = 1024 * 1024
+DURATION_TOLERANCE = 0.1   # deep 검증 시 허용 길이 오차 (초)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS media (
+    path         TEXT PRIMARY KEY,
+    size         INTEGER NOT NULL,
+    mtime_ns     INTEGER NOT NULL,
+    duration     REAL,
+    streams      TEXT NOT NULL,
+    checksum     TEXT NOT NULL,
+    recorded_at  TEXT NOT NULL
+);
+"""
+
+
+# ============================================================
+# 원자적 출력
+# ============================================================
+def partial_path(path: Path) -> Path:
+    """작업 중 임시 이름 (s1.mp4 → .s1.partial.mp4)"""
+    path = Path(path)
+    return path.with_name(f".{path.stem}.partial{path.suffix}")
+
+
+@contextmanager
+def atomic_output(path: Path):
+    """임시 출력 경로 제공 - commit_output()하지 않고 블록을 벗어나면 임시 파일 삭제"""
+    partial = partial_path(path)
+    partial.parent.mkdir(parents=True, exist_ok=True)
+    _unlink(partial)   # 이전에 중단된 작업의 잔여물
+    try:
+        yield partial
+    finally:
+        _unlink(partial)
+
+
+def commit_output(partial: Path, path: Path) -> bool:
+    """임시 출력을 최종 이름으로 교체 (임시 파일이 비어 있거나 없으면 False)"""
+    try:
+        if os.path.getsize(partial) == 0:
+            return False
+    except OSError:
+        return False
+    os.replace(partial, path)
+    return True
+
+
+def _unlink(path: Path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+# ============================================================
+# 검사
+# ============================================================
+def is_media(path: Path) -> bool:
+    return Path(path).suffix.lower() in MEDIA_SUFFIXES
+
+
+def sample_checksum(path: Path, size: int) -> str:
+    """크기 + 앞/뒤 1MB의 sha256 (잘림/덮어쓰기 감지용, 큰 영상도 빠름)"""
+    h = hashlib.sha256(str(size).encode("ascii"))
+    with open(path, "rb") as f:
+        h.update(f.read(SAMPLE_BYTES))
+        if size > SAMPLE_BYTES:
+            f.seek(max(SAMPLE_BYTES, size - SAMPLE_BYTES))
+            h.update(f.read(SAMPLE_BYTES))
+    return h.hexdigest()
+
+
+def probe(path: Path) -> Optional[Dict]:
+    """ffprobe → {duration, streams: [{type, codec, width, height}]} (읽을 수 없으면 None)"""
+    cmd = ["ffprobe", "-v", "error", "-show_entries",
+           "format=duration:stream=codec_type,codec_name,width,height", "-of", "json", str(path)]
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60)
+        data = json.loads(result.stdout) if result.returncode == 0 else None
+    except (OSError, subprocess.SubprocessError, ValueError):
+        return None
+    if not data:
+        return None
+
+    streams = [
+        {k: v for k, v in (("type", s.get("codec_type")), ("codec", s.get("codec_name")),
+                           ("width", s.get("width")), ("height", s.get("height"))) if v is not None}
+        for s in data.get("streams", [])
+    ]
+    try:
+        duration = float(data.get("format", {}).get("duration"))
+    except (TypeError, ValueError):
+        duration = None
+    if not streams or not duration:
+        return None
+    return {"duration": duration, "streams": streams}
+
+
+class MediaIndex:
+    """영상/오디오 출력 무결성 인덱스"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def _key(path: Path) -> str:
+        return str(Path(path).resolve())
+
+    def get(self, path: Path) -> Optional[Dict]:
+        row = self.conn.execute("SELECT * FROM media WHERE path = ?", (self._key(path),)).fetchone()
+        if row is None:
+            return None
+        entry = dict(row)
+        entry["streams"] = json.loads(entry["streams"])
+        return entry
+
+    def record(self, path: Path, info: Optional[Dict] = None) -> Optional[Dict]:
+        """완성된 출력 기록 (ffprobe로 읽을 수 없으면 이전 기록도 지우고 None)"""
+        path = Path(path)
+        info = info or probe(path)
+        if info is None:
+            self.forget(path)
+            return None
+        st = os.stat(path)
+        entry = {
+            "size": st.st_size, "mtime_ns": st.st_mtime_ns, "duration": info["duration"],
+            "streams": info["streams"], "checksum": sample_checksum(path, st.st_size),
+        }
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO media(path, size, mtime_ns, duration, streams, checksum, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (self._key(path), entry["size"], entry["mtime_ns"], entry["duration"],
+                 json.dumps(entry["streams"]), entry["checksum"], datetime.now().isoformat())
+            )
+        return entry
+
+    def forget(self, path: Path):
+        with self.conn:
+            self.conn.execute("DELETE FROM media WHERE path = ?", (self._key(path),))
+
+    def verify(self, path: Path, deep: bool = False, record: bool = True) -> bool:
+        """출력이 기록된 그대로인지 (없거나 손상이면 False)
+
+        record=False면 인덱스를 쓰지 않음 (인덱스에 없는 출력은 ffprobe만, mtime 갱신 생략 - plan dry-run)
+        """
+        path = Path(path)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+
+        entry = self.get(path)
+        if entry is None:
+            # 인덱스 도입 이전 산출물: 한 번 ffprobe로 확인 후 기록
+            if not record:
+                return probe(path) is not None
+            return self.record(path) is not None
+        if st.st_size != entry["size"]:
+            return False
+        if st.st_mtime_ns != entry["mtime_ns"]:
+            if sample_checksum(path, st.st_size) != entry["checksum"]:
+                return False
+            if record:
+                with self.conn:
+                    self.conn.execute("UPDATE media SET mtime_ns = ? WHERE path = ?", (st.st_mtime_ns, self._key(path)))
+        if deep:
+            info = probe(path)
+            if info is None or abs(info["duration"] - (entry["duration"] or 0)) > DURATION_TOLERANCE:
+                return False
+            if [s.get("type") for s in info["streams"]] != [s.get("type") for s in entry["streams"]]:
+                return False
+        return True
+
+    def entries(self) -> List[Dict]:
+        rows = self.conn.execute("SELECT path FROM media ORDER BY path").fetchall()
+        return [self.get(Path(row["path"])) for row in rows]
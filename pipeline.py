@@ -28,9 +28,17 @@ Phase 6: FINAL
 
 유틸리티:
     sync-assets     에셋 동기화 (assets/ → remotion/public/assets/)
+    store           SQLite 프로젝트 저장소 (import / export / query)
+    ledger          스테이지별 진행 현황 (중단된 작업 확인 / --reset)
+    build (all)     render → composite → section-merge → final 의존성 그래프 실행
+    watch           변경 감지 → 영향받는 씬/섹션만 재빌드 → final 갱신
+    plan            빌드 계획 (다시 만들 씬/섹션 + 예상 소요 시간, dry-run)
+    preflight       렌더/합성/최종 병합 전 사전 검증 (render/composite/final 실행 시 자동)
     status          프로젝트 상태 확인
     clean           output 폴더 초기화 (에셋 유지)
     init            프로젝트 완전 초기화 (에셋 포함)
+    gc              빌드 캐시 정리 (LRU/기간, 현재 프로젝트 출력 보호)
+    tune-render     샘플 렌더로 머신별 최적 concurrency / 동시 렌더 수 측정 (render/build 기본값)
     asset-catalog   에셋 카탈로그 생성
 
 예시:
@@ -38,6 +46,9 @@ Phase 6: FINAL
     python pipeline.py render                    # 배경 포함 렌더링 (기본)
     python pipeline.py render --transparent      # 투명 렌더링 (FFmpeg 합성 필요)
     python pipeline.py render --section hook
+    python pipeline.py render --jobs 4 --cores 32  # 씬 4개 동시 렌더 (코어 32개를 예상 비용 비례로 분배)
+    python pipeline.py render --backend server   # 상주 Node 렌더 서버 (씬마다 Chrome을 새로 띄우지 않음)
+    python pipeline.py render --scene s3 --shards 4  # 긴 씬을 프레임 구간 4개로 나눠 병렬 렌더
     python pipeline.py final --bgm-volume 0.08
 """
 
@@ -45,11 +56,45 @@ import json
 import sys
 import io
 import argparse
+import atexit
+import contextlib
+import hashlib
 import os
+import re
 import subprocess
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set
+
+from build_graph import BuildGraph
+from build_cache import (
+    BuildCache, DEFAULT_MAX_BYTES, ffmpeg_version, format_size, is_content_key, parse_size,
+    remotion_version, tsx_dependencies,
+)
+from build_plan import ACTION_BUILD, ACTION_RESTORE, ACTION_SKIP, BuildPlan, CostModel, print_plan
+from intermediates import Intermediates, scratch_dir
+from media_integrity import MediaIndex, atomic_output, commit_output, is_media, partial_path
+from json_io import (
+    atomic_write_text, file_lock, read_json, update_json, write_json_atomic, write_json_if_changed
+)
+from preflight import Preflight, print_report as print_preflight_report, scene_assets
+from project_index import ProjectIndex
+from project_store import ProjectStore, scene_summary, scene_minimal
+from remote_cache import open_remote
+from render_cost import RenderCostModel, longest_first, scene_features
+from frame_shards import ShardedRender, concat_shards, plan_shards
+from render_pool import RenderPool
+from remotion_bundle import ENTRY_POINT, RemotionBundler, bundle_enabled
+from render_server import RenderServer, cli_options
+from render_tuner import RenderTuner, candidate_settings, load_profile, save_profile
+from resource_governor import FFMPEG_THREADS, ResourceGovernor
+from stage_ledger import StageLedger, STAGES, STATUS_FORCED, fingerprint_files
+from status_report import StatusScanner, build_report, print_matrix
+from timeline import Timeline, FPS
+from watcher import Watcher
+from whisper_words import load_section_words, save_words, wcol_path
 
 # Windows 콘솔 UTF-8 인코딩 설정
 if sys.platform == 'win32':
@@ -76,6 +121,11 @@ except ImportError:
 BASE_DIR = Path(__file__).parent
 STATE_FILE = BASE_DIR / "output" / "state.json"
 OUTPUT_DIR = BASE_DIR / "output"
+STORE_FILE = OUTPUT_DIR / "project.db"       # 선택: SQLite 프로젝트 저장소
+LEDGER_FILE = OUTPUT_DIR / "ledger.db"       # 씬/스테이지별 작업 기록
+CACHE_DIR = Path(os.environ.get("PIPELINE_CACHE_DIR", OUTPUT_DIR / ".cache"))  # 빌드 캐시
+RENDER_PROFILE_FILE = Path(os.environ.get("PIPELINE_RENDER_PROFILE", OUTPUT_DIR / "render_profile.json"))  # tune-render 결과
+CACHE_MAX_BYTES = parse_size(os.environ.get("PIPELINE_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES))  # 0 = 제한 없음
 ASSETS_DIR = BASE_DIR / "assets"
 BGM_DIR = BASE_DIR / "BGM"
 TRANSITION_ASSETS_DIR = BASE_DIR / "Transition"
@@ -86,11 +136,14 @@ AUDIO_DIR = OUTPUT_DIR / "2_audio"
 BACKGROUNDS_DIR = OUTPUT_DIR / "3_backgrounds"
 IMAGES_DIR = OUTPUT_DIR / "3_images"
 VISUAL_DIR = OUTPUT_DIR / "4_visual"
-RENDERS_DIR = OUTPUT_DIR / "5_renders"
+RENDERS_DIR = (scratch_dir() or OUTPUT_DIR) / "5_renders"   # 투명 렌더 (중간 파일, PIPELINE_SCRATCH_DIR)
 COMPOSITE_DIR = OUTPUT_DIR / "6_scenes"      # 배경 합성된 씬
 SCENES_DIR = OUTPUT_DIR / "1_scripts"        # scenes.json 위치
 SECTIONS_DIR = OUTPUT_DIR / "6_sections"
+MERGE_MANIFEST_FILE = SCRIPTS_DIR / "merge_manifest.json"   # 씬 ID ↔ 내용 해시
+MERGE_REPORT_FILE = SCRIPTS_DIR / "merge_report.json"       # 마지막 merge 변경 내역
 TRANSITIONS_DIR = OUTPUT_DIR / "7_transitions"
+LOGS_DIR = OUTPUT_DIR / "logs"                 # render --jobs 씬별 Remotion 로그
 
 # Remotion 디렉토리
 REMOTION_DIR = BASE_DIR / "remotion"
@@ -98,6 +151,9 @@ REMOTION_SCENES_DIR = REMOTION_DIR / "src" / "scenes"
 REMOTION_TRANSITIONS_DIR = REMOTION_DIR / "src" / "transitions"
 REMOTION_ASSETS_DIR = REMOTION_DIR / "public" / "assets"
 
+# 프로젝트 문서 캐시 (scenes.json, s#.json, s#_timed.json 한 번만 파싱)
+PROJECT = ProjectIndex(SCRIPTS_DIR, AUDIO_DIR)
+
 # ============================================================
 # 섹션 정보 동적 로드
 # ============================================================
@@ -110,35 +166,24 @@ def get_sections() -> List[str]:
     우선순위: scenes.json > reading_script.json > 기본값
     """
     # 1. scenes.json에서 로드 (가장 정확)
-    scenes_path = SCRIPTS_DIR / "scenes.json"
-    if scenes_path.exists():
-        try:
-            with open(scenes_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                sections_info = data.get("meta", {}).get("sections", {})
-                if sections_info:
-                    # 섹션 순서 보장을 위해 scenes 배열에서 순서 추출
-                    seen = []
-                    for scene in data.get("scenes", []):
-                        section = scene.get("section")
-                        if section and section not in seen:
-                            seen.append(section)
-                    if seen:
-                        return seen
-        except Exception as e:
-            print(f"[WARN] Failed to load scenes.json: {e}")
+    try:
+        if PROJECT.has_section_meta():
+            # 섹션 순서 보장을 위해 scenes 배열에서 순서 추출
+            seen = PROJECT.sections()
+            if seen:
+                return seen
+    except Exception as e:
+        print(f"[WARN] Failed to load scenes.json: {e}")
 
     # 2. reading_script.json에서 로드
-    script_path = SCRIPTS_DIR / "reading_script.json"
-    if script_path.exists():
-        try:
-            with open(script_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                sections = [s["id"] for s in data.get("sections", [])]
-                if sections:
-                    return sections
-        except Exception as e:
-            print(f"[WARN] Failed to load reading_script.json: {e}")
+    try:
+        data = PROJECT.load(SCRIPTS_DIR / "reading_script.json")
+        if data:
+            sections = [s["id"] for s in data.get("sections", [])]
+            if sections:
+                return sections
+    except Exception as e:
+        print(f"[WARN] Failed to load reading_script.json: {e}")
 
     # 3. 기본값 (fallback)
     print("[WARN] Using default sections - no script files found")
@@ -147,29 +192,18 @@ def get_sections() -> List[str]:
 
 def get_section_scenes(section: str) -> List[str]:
     """특정 섹션의 씬 ID 목록 반환"""
-    scenes_path = SCRIPTS_DIR / "scenes.json"
-    if scenes_path.exists():
-        try:
-            with open(scenes_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                sections_info = data.get("meta", {}).get("sections", {})
-                return sections_info.get(section, {}).get("scenes", [])
-        except:
-            pass
-    return []
+    try:
+        return PROJECT.section_scenes(section)
+    except:
+        return []
 
 
 def get_all_scenes() -> List[str]:
     """모든 씬 ID 목록 반환 (순서대로)"""
-    scenes_path = SCRIPTS_DIR / "scenes.json"
-    if scenes_path.exists():
-        try:
-            with open(scenes_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return [s["scene_id"] for s in data.get("scenes", [])]
-        except:
-            pass
-    return []
+    try:
+        return PROJECT.all_scenes()
+    except:
+        return []
 
 
 def validate_parts_info() -> Dict[str, Any]:
@@ -294,24 +328,24 @@ SECTIONS = None  # Deprecated: use get_sections() instead
 def load_json(path: Path) -> Optional[Dict]:
     """JSON 파일 로드"""
     if path.exists():
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return read_json(path)
     return None
 
 
+# 파이프라인이 쓴 JSON 경로 (watch: 재빌드가 쓴 파일만 변경 기준에 반영)
+WRITTEN_PATHS: set = set()
+
+
 def save_json(path: Path, data: Dict, silent: bool = False):
-    """JSON 파일 저장"""
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with open(path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    """JSON 파일 저장 (임시 파일 + rename으로 원자적 교체)"""
+    write_json_atomic(path, data)
+    PROJECT.invalidate(path)
+    WRITTEN_PATHS.add(Path(path))
     if not silent:
         print(f"[OK] Saved: {path}")
 
 
-def load_state() -> Dict:
-    """state.json 로드"""
-    if STATE_FILE.exists():
-        return load_json(STATE_FILE)
+def _default_state() -> Dict:
     return {
         "project_id": None,
         "category": None,
@@ -323,10 +357,378 @@ def load_state() -> Dict:
     }
 
 
+def save_json_if_changed(path: Path, data: Dict) -> bool:
+    """내용이 달라졌을 때만 저장 (mtime을 바꾸지 않아 downstream 무효화 방지)"""
+    changed = write_json_if_changed(path, data)
+    if changed:
+        PROJECT.invalidate(path)
+        WRITTEN_PATHS.add(Path(path))
+    return changed
+
+
+def load_state() -> Dict:
+    """state.json 로드"""
+    if STATE_FILE.exists():
+        return load_json(STATE_FILE)
+    return _default_state()
+
+
+def update_state(updates: Dict) -> Dict:
+    """state.json 부분 업데이트 (다른 워커와 동시에 실행돼도 안전)
+
+    잠금 상태에서 디스크의 최신 state를 읽어 updates 키만 덮어쓰므로
+    다른 프로세스가 그 사이에 바꾼 키는 유실되지 않습니다.
+    """
+    def apply(state: Dict):
+        state.update(updates)
+        state["updated_at"] = datetime.now().isoformat()
+
+    state = update_json(STATE_FILE, apply, default=_default_state)
+    print(f"[OK] Saved: {STATE_FILE}")
+    return state
+
+
 def save_state(state: Dict):
-    """state.json 저장"""
-    state["updated_at"] = datetime.now().isoformat()
-    save_json(STATE_FILE, state)
+    """state.json 저장 (state의 키를 최신 state에 병합 - update_state 참고)"""
+    update_state(state)
+
+
+def open_store() -> Optional[ProjectStore]:
+    """project.db가 있으면 ProjectStore 반환 (없으면 None - 파일만 사용)"""
+    if STORE_FILE.exists():
+        return ProjectStore(STORE_FILE)
+    return None
+
+
+# CPU/메모리 기준 작업 허용 (프로세스 전체 공유 - build의 병렬 노드가 함께 사용)
+GOVERNOR = ResourceGovernor()
+
+
+def run_ffmpeg(cmd: str, output: Path, label: str = "") -> subprocess.CompletedProcess:
+    """ffmpeg 인코딩 실행 - cmd(출력 파일 제외) 뒤에 governor가 허용한 -threads와 출력 파일을 붙임"""
+    with GOVERNOR.job("ffmpeg", FFMPEG_THREADS, label=label) as grant:
+        cmd = f'{cmd} -threads {grant["size"]} "{output}"'
+        return subprocess.run(cmd, capture_output=True, text=True, shell=True)
+
+
+# Remotion 번들 (src/public 내용 해시 key - 씬마다 다시 번들링하지 않음)
+BUNDLER = RemotionBundler(REMOTION_DIR, CACHE_DIR / "bundles")
+
+
+def remotion_serve_url() -> str:
+    """렌더에 넘길 번들 폴더 (비활성화/생성 실패 시 src/index.ts)"""
+    if not bundle_enabled():
+        return ENTRY_POINT
+    bundle = BUNDLER.ensure(get_cache())
+    return str(bundle) if bundle else ENTRY_POINT
+
+
+# 렌더 backend: cli (씬마다 npx remotion render) / server (상주 Node 렌더 서버, 브라우저 재사용)
+RENDER_BACKEND = os.environ.get("PIPELINE_RENDER_BACKEND", "cli")
+_render_server: Dict[str, Optional[RenderServer]] = {}
+_render_server_lock = threading.Lock()
+
+
+def get_render_server() -> Optional[RenderServer]:
+    """상주 렌더 서버 (처음 사용할 때 실행, 시작할 수 없으면 None → CLI로 렌더)"""
+    with _render_server_lock:
+        server = _render_server.get("server")
+        if "server" not in _render_server or (server is not None and not server.alive):
+            server = RenderServer(REMOTION_DIR, log_path=LOGS_DIR / "render_server.log")
+            if server.start():
+                print("  [OK] 렌더 서버 시작 (브라우저/composition 재사용)")
+                atexit.register(server.close)
+            else:
+                print(f"  [WARN] 렌더 서버를 시작할 수 없어 npx remotion render 사용 (로그: {server.log_path})")
+                server = None
+            _render_server["server"] = server
+        return server
+
+
+def render_with_server(server: RenderServer, serve_url: str, comp_id: str, output: Path, encoder_args: str,
+                       concurrency: int, log_path: Optional[Path] = None) -> tuple:
+    """렌더 서버로 렌더 → (returncode, 오류 메시지) - 진행률은 log_path에 기록"""
+    log = open(log_path, "w", encoding="utf-8") if log_path else None
+
+    def on_progress(event: Dict):
+        if log:
+            log.write(f"{event['progress'] * 100:.0f}% rendered={event.get('renderedFrames')} "
+                      f"encoded={event.get('encodedFrames')}\n")
+            log.flush()
+
+    try:
+        result = server.render(serve_url, comp_id, output, cli_options(encoder_args), concurrency, on_progress)
+        if log:
+            log.write(("done" if result["ok"] else f"error: {result['error']}") + "\n")
+    finally:
+        if log:
+            log.close()
+    return (0 if result["ok"] else 1), result["error"][:500]
+
+
+# SQLite 연결은 스레드 간 공유할 수 없으므로 스레드마다 따로 연결 (build 명령의 병렬 노드)
+_connections = threading.local()
+
+
+def get_ledger() -> StageLedger:
+    """스테이지 ledger (처음 사용할 때 연결)"""
+    if getattr(_connections, "ledger", None) is None:
+        _connections.ledger = StageLedger(LEDGER_FILE)
+    return _connections.ledger
+
+
+def get_cache() -> BuildCache:
+    """빌드 캐시 (lazy, PIPELINE_REMOTE_CACHE가 있으면 공유 캐시 연결)"""
+    if getattr(_connections, "cache", None) is None:
+        _connections.cache = BuildCache(CACHE_DIR, remote=open_remote(), max_bytes=CACHE_MAX_BYTES)
+    return _connections.cache
+
+
+def get_intermediates() -> Intermediates:
+    """중간 파일 참조 카운트 (ledger.db에 기록)"""
+    if getattr(_connections, "intermediates", None) is None:
+        _connections.intermediates = Intermediates(LEDGER_FILE)
+    return _connections.intermediates
+
+
+def get_render_costs() -> RenderCostModel:
+    """렌더 비용 기록/예측 모델 (ledger.db에 기록)"""
+    if getattr(_connections, "render_costs", None) is None:
+        _connections.render_costs = RenderCostModel(LEDGER_FILE)
+    return _connections.render_costs
+
+
+def render_features(unit: str) -> Dict[str, float]:
+    return scene_features(PROJECT.scene(unit), REMOTION_SCENES_DIR / f"{unit.upper()}.tsx")
+
+
+def estimate_render_costs(scene_ids: List[str]) -> Dict[str, float]:
+    """씬별 예상 렌더 비용 (CPU 초) - 과거 기록으로 학습한 모델"""
+    model = get_render_costs().fit()
+    timeline = get_timeline()
+    costs = {}
+    for scene_id in scene_ids:
+        unit = scene_id.lower()
+        frames = timeline.duration_frames(unit) if unit in timeline else 0
+        costs[scene_id] = model.predict(frames, render_features(unit))
+    return costs
+
+
+def get_media_index() -> MediaIndex:
+    """영상/오디오 출력 무결성 인덱스 (ledger.db에 기록)"""
+    if getattr(_connections, "media_index", None) is None:
+        _connections.media_index = MediaIndex(LEDGER_FILE)
+    return _connections.media_index
+
+
+def output_intact(output_path: Path, record: bool = True) -> bool:
+    """출력이 존재하고 (영상/오디오면) 무결성 인덱스 기록과 일치하는지 (record=False면 인덱스를 갱신하지 않음)"""
+    if not output_path.exists():
+        return False
+    return not is_media(output_path) or get_media_index().verify(output_path, record=record)
+
+
+def is_stage_done(stage: str, unit: str, output_path: Path, fingerprint: Optional[str] = None) -> bool:
+    """ledger + 빌드 캐시 기준 완료 여부
+
+    - ledger done + 같은 입력 key + 출력 파일 존재 → 완료
+    - running/failed/pending 기록 → 중단(또는 reset)된 작업이므로 다시 실행 (잘린 출력 파일 무시)
+    - 기록 없음(또는 stat 기반 fingerprint) + 출력 파일 존재 → 빌드 캐시 도입 이전 산출물
+      현재 입력 파일보다 새로우면 (make 기준) 완료로 등록, 아니면 다시 실행
+    - 입력 key가 캐시에 있으면 → 출력 복원 후 완료 (ledger --reset으로 forced 표시된 작업은 제외)
+    """
+    ledger = get_ledger()
+    state, reason = stage_state(stage, unit, output_path, fingerprint, record=True)
+    if state == ACTION_SKIP:
+        if reason == "legacy":
+            ledger.mark_done(stage, unit, fingerprint, output_path)
+        return True
+
+    if state == ACTION_RESTORE and get_cache().restore(fingerprint, output_path):
+        if is_media(output_path) and get_media_index().record(output_path) is None:
+            # 캐시에 손상된 출력이 들어 있음 → 기록을 지우고 다시 생성
+            print(f"  [WARN] {output_path.name} 캐시 항목 손상 (ffprobe 실패), 캐시에서 삭제 후 다시 생성")
+            get_cache().forget(fingerprint)
+            get_cache().prepare_output(output_path)
+            return False
+        ledger.mark_done(stage, unit, fingerprint, output_path)
+        print(f"  [CACHE] {output_path.name} 캐시에서 복원")
+        return True
+    return False
+
+
+def stage_state(stage: str, unit: str, output_path: Path, fingerprint: Optional[str] = None,
+                record: bool = False) -> tuple:
+    """(skip | restore | build, 이유) - plan과 is_stage_done 공용
+
+    기본은 무결성 인덱스를 갱신하지 않음 (record=True: 인덱스에 없는 출력을 확인 후 기록, is_stage_done).
+    fingerprint 계산과 캐시 조회의 기록/정리는 BuildCache.dry_run()으로 막습니다 (plan).
+    """
+    entry = get_ledger().get(stage, unit)
+    if entry and entry["status"] == STATUS_FORCED:
+        # ledger --reset: 같은 산출물을 캐시에서 되살리지 않고 다시 실행
+        return ACTION_BUILD, "초기화됨"
+
+    exists = output_path.exists()
+    intact = exists and output_intact(output_path, record)
+    legacy = entry is None or (entry["status"] == "done" and not is_content_key(entry["fingerprint"]))
+    if intact:
+        if entry and entry["status"] == "done" and (fingerprint is None or entry["fingerprint"] == fingerprint):
+            return ACTION_SKIP, ""
+        if legacy and newer_than_inputs(output_path, fingerprint):
+            return ACTION_SKIP, "legacy"
+
+    if fingerprint and get_cache().available(fingerprint):
+        return ACTION_RESTORE, ""
+
+    if not exists:
+        return ACTION_BUILD, "출력 없음"
+    if not intact:
+        return ACTION_BUILD, "손상된 출력"
+    if legacy:
+        # 빌드 캐시 도입 이전 산출물인데 입력 파일이 더 새로움 (또는 입력을 알 수 없음)
+        return ACTION_BUILD, "이전 버전 산출물"
+    if entry["status"] != "done":
+        return ACTION_BUILD, entry["status"]
+    return ACTION_BUILD, "입력 변경"
+
+
+def newer_than_inputs(output_path: Path, fingerprint: Optional[str]) -> bool:
+    """출력이 key의 모든 입력 파일보다 새로운지 (기록 없는 이전 산출물을 현재 입력의 결과로 인정하는 근거)"""
+    inputs = get_cache().inputs_of(fingerprint) if fingerprint else None
+    if inputs is None:
+        return False
+    output_mtime = output_path.stat().st_mtime_ns
+    for path in inputs:
+        try:
+            if path.stat().st_mtime_ns > output_mtime:
+                return False
+        except OSError:
+            continue
+    return True
+
+
+def store_output(stage: str, fingerprint: str, output_path: Path):
+    """성공한 스테이지 출력을 빌드 캐시에 등록 (예산 초과 시 LRU 정리)"""
+    if output_path.exists():
+        if is_media(output_path) and get_media_index().record(output_path) is None:
+            # 읽을 수 없는 출력은 캐시(원격 포함)에 넣지 않음 - 다음 실행에서 다시 생성
+            print(f"  [WARN] {output_path.name} ffprobe 확인 실패 (캐시에 등록하지 않음, 다음 실행에서 다시 생성)")
+            return
+        cache = get_cache()
+        cache.store(fingerprint, stage, output_path)
+        if cache.over_budget():
+            result = cache.gc(live_cache_keys())
+            if result["removed"]:
+                print(f"  [CACHE] 예산 초과 → {result['removed']}개 정리 ({format_size(result['freed_bytes'])} 해제)")
+
+
+def live_cache_keys() -> set:
+    """현재 프로젝트 출력이 가리키는 캐시 key (gc에서 보호)
+
+    합성 후 정리된 투명 렌더는 파일이 없어도 보호 (배경이 바뀌면 캐시에서 복원해 다시 합성)
+    """
+    keys = {
+        entry["fingerprint"] for entry in get_ledger().entries()
+        if entry["status"] == "done" and is_content_key(entry["fingerprint"])
+        and entry.get("output_path") and Path(entry["output_path"]).exists()
+    }
+    return keys | get_intermediates().released_keys()
+
+
+def raw_render_consumed(output_path: Path, fingerprint: Optional[str] = None) -> bool:
+    """합성 후 정리된 투명 렌더인지 (빌드 캐시에서 다시 복원할 수 있을 때만 True → 아니면 다시 렌더)"""
+    return get_intermediates().consumed(
+        output_path, fingerprint, available=lambda key: get_cache().available(key) is not None
+    )
+
+
+def reset_intermediates(stage: Optional[str] = None, unit: Optional[str] = None) -> int:
+    """렌더/합성 작업 기록 초기화 시 투명 렌더 정리 기록도 삭제 (consumed로 렌더를 건너뛰지 않도록)"""
+    if stage not in (None, "render", "composite"):
+        return 0
+    return get_intermediates().forget(RENDERS_DIR / f"{unit.lower()}_raw.webm" if unit else None)
+
+
+def preserve_outputs(stages: Optional[List[str]] = None) -> int:
+    """삭제 전 ledger에 기록된 출력 중 캐시에 없는 것을 등록 (clean/init 후 복원 가능하도록)"""
+    cache = get_cache()
+    count = 0
+    for entry in get_ledger().entries():
+        if stages is not None and entry["stage"] not in stages:
+            continue
+        output_path = Path(entry["output_path"]) if entry.get("output_path") else None
+        if entry["status"] != "done" or not is_content_key(entry["fingerprint"]) or output_path is None:
+            continue
+        if output_path.exists() and cache.lookup(entry["fingerprint"]) is None:
+            cache.store(entry["fingerprint"], entry["stage"], output_path)
+            count += 1
+    return count
+
+
+_timeline_cache: Dict[tuple, Timeline] = {}
+
+
+def get_timeline(section_gap: float = 0.0) -> Timeline:
+    """프로젝트 타임라인 (scenes.json / 타이밍 파일이 바뀌지 않았으면 재사용)
+
+    파이프라인은 이 파일들을 save_json으로만 쓰고 save_json이 PROJECT.invalidate()를 호출하므로,
+    씬마다 모든 타이밍 파일을 stat하지 않고 PROJECT 세대 번호로 변경을 판단합니다.
+    (외부 편집은 명령 실행 사이에만 반영 - watch는 재빌드마다 전체 무효화)
+    """
+    key = (PROJECT.generation, section_gap)
+    timeline = _timeline_cache.get(key)
+    if timeline is None:
+        _timeline_cache.clear()
+        timeline = _timeline_cache[key] = Timeline.build(PROJECT, section_gap=section_gap)
+    return timeline
+
+
+def build_pending(stage: str, units: List[str], transparent: bool = False) -> Set[str]:
+    """새로 만들어야 하는 씬 (완료됐거나 빌드 캐시에서 복원 가능한 씬 제외)"""
+    pending = set()
+    for unit in units:
+        if stage == "composite":
+            state, _ = stage_state("composite", unit, COMPOSITE_DIR / f"{unit}.mp4", composite_key(unit))
+        else:
+            output_path = render_output(unit, transparent)
+            fingerprint = render_key(unit, unit.upper(), RENDER_ENCODER_ARGS[transparent])
+            if transparent and raw_render_consumed(output_path, fingerprint):
+                continue
+            state, _ = stage_state("render", unit, output_path, fingerprint)
+        if state == ACTION_BUILD:
+            pending.add(unit)
+    return pending
+
+
+def run_preflight(stage: str, scene_ids: Optional[List[str]] = None,
+                  sections: Optional[List[str]] = None, quiet: bool = False,
+                  transparent: bool = False) -> bool:
+    """사전 검증 실행 - 오류가 있으면 False (호출한 단계는 시작하지 않음)"""
+    raw_available = None
+    pending = None
+    disk_dir = OUTPUT_DIR
+    # ledger/캐시 연결은 스레드 간 공유 불가 → 검증 스레드 시작 전에 판단
+    if stage != "final" and PROJECT.scenes_doc() is not None:
+        units = [s.lower() for s in (scene_ids or PROJECT.all_scenes())]
+        if stage == "composite":
+            available = {unit for unit in units if raw_render_available(unit)}
+            raw_available = available.__contains__
+            disk_dir = COMPOSITE_DIR
+        else:
+            disk_dir = RENDERS_DIR if transparent else COMPOSITE_DIR
+        pending = build_pending(stage, units, transparent)
+    preflight = Preflight(
+        PROJECT, remotion_dir=REMOTION_DIR, backgrounds_dir=BACKGROUNDS_DIR,
+        renders_dir=RENDERS_DIR, sections_dir=SECTIONS_DIR, output_dir=OUTPUT_DIR,
+        raw_available=raw_available, pending=pending, disk_dir=disk_dir
+    )
+    result = preflight.run(stage, scene_ids, sections)
+    if not quiet or not result["valid"]:
+        print_preflight_report(result, stage)
+    if not result["valid"]:
+        print("[ERROR] 사전 검증 실패 - 문제를 해결한 뒤 다시 실행하세요 (--no-preflight로 건너뛰기)")
+    return result["valid"]
 
 
 def ensure_dirs():
@@ -350,20 +752,16 @@ def ensure_dirs():
 
 def get_scenes_for_section(section: str) -> List[str]:
     """특정 섹션의 씬 목록 반환"""
-    scenes_file = SCRIPTS_DIR / "scenes.json"
-    if not scenes_file.exists():
+    scenes_data = PROJECT.scenes_doc()
+    if scenes_data is None:
         print(f"[ERROR] scenes.json 없음")
         return []
 
-    scenes_data = load_json(scenes_file)
-    if not scenes_data or "meta" not in scenes_data:
+    if "meta" not in scenes_data:
         return []
 
-    section_info = scenes_data["meta"]["sections"].get(section, [])
-    # section_info가 리스트면 직접 반환, 딕셔너리면 "scenes" 키 사용
-    if isinstance(section_info, list):
-        return section_info
-    return section_info.get("scenes", [])
+    # section_info가 리스트/딕셔너리 어느 형식이든 인덱스에서 처리
+    return PROJECT.section_scenes(section)
 
 
 # ============================================================
@@ -407,43 +805,41 @@ def cmd_merge_scenes(args):
         print("[ERROR] No scenes to merge.")
         return
 
-    # 섹션 순서대로 씬 정렬 및 ID 재부여
+    # 섹션 순서대로 씬 정렬
     section_order = ["hook", "background", "core1", "core2", "core3", "insight", "outro"]
     sorted_scenes_data = []
-    new_section_map = {}
-    scene_counter = 1
-
     for section in section_order:
-        section_scenes = [s for s in all_scenes if s.get("section") == section]
-        if not section_scenes:
-            continue
-
-        new_section_map[section] = {"scenes": [], "count": 0}
+        sorted_scenes_data.extend(s for s in all_scenes if s.get("section") == section)
+
+    # 씬 ID 부여 (이전 merge와 내용/출처가 같은 씬은 기존 ID 유지)
+    renumber = getattr(args, "renumber", False)
+    previous = load_merge_manifest()
+    keys = [
+        (scene_content_hash(scene), f"{scene.get('section')}:{scene.get('scene_id')}")
+        for scene in sorted_scenes_data
+    ]
+    new_ids = assign_scene_ids(keys, previous, renumber)
 
-        for scene in section_scenes:
-            new_scene_id = f"s{scene_counter}"
-            scene["scene_id"] = new_scene_id
-            new_section_map[section]["scenes"].append(new_scene_id)
-            new_section_map[section]["count"] += 1
-            sorted_scenes_data.append(scene)
-            scene_counter += 1
+    new_section_map = {}
+    for scene, new_scene_id in zip(sorted_scenes_data, new_ids):
+        scene["scene_id"] = new_scene_id
+        entry = new_section_map.setdefault(scene["section"], {"scenes": [], "count": 0})
+        entry["scenes"].append(new_scene_id)
+        entry["count"] += 1
 
-    # 씬 데이터 업데이트 및 개별 파일 저장
+    # 씬 데이터 업데이트 및 개별 파일 저장 (내용이 같으면 쓰지 않음 - mtime 유지)
     sorted_scenes = []
+    written = 0
     for scene in sorted_scenes_data:
         new_id = scene["scene_id"]
 
         # 개별 씬 파일 저장
         scene_file = SCRIPTS_DIR / f"{new_id}.json"
-        save_json(scene_file, scene, silent=True)
+        if save_json_if_changed(scene_file, scene):
+            written += 1
 
         # scenes.json용 요약 데이터
-        sorted_scenes.append({
-            "scene_id": new_id,
-            "section": scene.get("section"),
-            "narration_preview": scene.get("narration_tts", "")[:30] + "...",
-            "bg_id": scene.get("bg_id")
-        })
+        sorted_scenes.append(scene_summary(scene))
 
     # scenes.json 생성
     scenes_json = {
@@ -456,7 +852,7 @@ def cmd_merge_scenes(args):
         "backgrounds": all_backgrounds
     }
 
-    save_json(SCRIPTS_DIR / "scenes.json", scenes_json)
+    save_json_if_changed(SCRIPTS_DIR / "scenes.json", scenes_json)
 
     # bg_prompts.json 생성 (배경 프롬프트 추출)
     bg_prompts = {}
@@ -472,32 +868,168 @@ def cmd_merge_scenes(args):
         if bg_id in bg_prompts:
             bg_prompts[bg_id]["scenes"].append(scene["scene_id"])
 
-    save_json(SCRIPTS_DIR / "bg_prompts.json", {"backgrounds": list(bg_prompts.values())})
+    save_json_if_changed(SCRIPTS_DIR / "bg_prompts.json", {"backgrounds": list(bg_prompts.values())})
 
     # scenes_minimal.json 생성 (에이전트용 경량 데이터)
-    minimal_scenes = []
-    for scene in all_scenes:
-        minimal_scenes.append({
-            "scene_id": scene["scene_id"],
-            "section": scene.get("section"),
-            "subtitle_display": scene.get("subtitle_display", "")
-        })
+    minimal_scenes = [scene_minimal(scene) for scene in all_scenes]
+
+    save_json_if_changed(SCRIPTS_DIR / "scenes_minimal.json", {"scenes": minimal_scenes})
 
-    save_json(SCRIPTS_DIR / "scenes_minimal.json", {"scenes": minimal_scenes})
+    # 변경 리포트 + manifest
+    report = build_merge_report(previous, new_ids, keys, new_section_map)
+    current = {
+        scene_id: {"hash": h, "origin": origin, "section": scene["section"]}
+        for scene_id, (h, origin), scene in zip(new_ids, keys, sorted_scenes_data)
+    }
+    save_json(MERGE_MANIFEST_FILE, {"scenes": current}, silent=True)
+    save_json(MERGE_REPORT_FILE, report, silent=True)
+
+    # 삭제된 씬 파일 정리
+    for scene_id in report["removed"]:
+        stale = SCRIPTS_DIR / f"{scene_id}.json"
+        if stale.exists():
+            stale.unlink()
+
+    invalidate_downstream(report)
 
     print(f"\n[DONE] Scene merge completed!")
-    print(f"  - Total {len(sorted_scenes)} scenes")
-    print(f"  - scenes.json created")
-    print(f"  - s1.json ~ s{len(sorted_scenes)}.json created")
-    print(f"  - bg_prompts.json created ({len(bg_prompts)} backgrounds)")
-    print(f"  - scenes_minimal.json created")
+    print(f"  - Total {len(sorted_scenes)} scenes ({written} files written)")
+    print(f"  - added {len(report['added'])}, modified {len(report['modified'])}, "
+          f"removed {len(report['removed'])}, unchanged {len(report['unchanged'])}")
+    print(f"  - bg_prompts.json ({len(bg_prompts)} backgrounds)")
+    print(f"  - {MERGE_REPORT_FILE.name} created")
+
+    # project.db 동기화 (사용 중인 경우)
+    store = open_store()
+    if store:
+        with store:
+            store.replace_scenes(sorted_scenes_data, scenes_json["meta"], all_backgrounds)
+        print(f"  - project.db updated")
 
     # state.json 업데이트
-    state = load_state()
-    state["phase"] = "scenes_completed"
-    state["current_step"] = 4
-    state["scenes_count"] = len(sorted_scenes)
-    save_state(state)
+    update_state({
+        "phase": "scenes_completed",
+        "current_step": 4,
+        "scenes_count": len(sorted_scenes)
+    })
+
+
+def scene_content_hash(scene: Dict) -> str:
+    """씬 내용 해시 (scene_id 제외 - ID 재부여와 무관하게 같은 내용이면 같은 값)"""
+    body = {k: v for k, v in scene.items() if k != "scene_id"}
+    canonical = json.dumps(body, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def load_merge_manifest() -> Dict[str, Dict]:
+    """이전 merge의 {scene_id: {hash, origin, section}}
+
+    manifest가 없으면 (이전 버전으로 merge한 프로젝트) 기존 s#.json 내용으로 해시를 계산
+    """
+    manifest = load_json(MERGE_MANIFEST_FILE)
+    if manifest:
+        return manifest.get("scenes", {})
+
+    previous = {}
+    for scene_id in PROJECT.all_scenes():
+        doc = PROJECT.scene(scene_id)
+        if doc is not None:
+            previous[scene_id] = {"hash": scene_content_hash(doc), "origin": None,
+                                  "section": doc.get("section")}
+    return previous
+
+
+def assign_scene_ids(keys: List[tuple], previous: Dict[str, Dict], renumber: bool = False) -> List[str]:
+    """씬 ID 부여
+
+    1) 내용 해시가 같은 이전 씬 → 그 ID 재사용 (unchanged)
+    2) 출처(섹션:원본 scene_id)가 같은 이전 씬 → 그 ID 재사용 (modified)
+    3) 나머지 → 사용되지 않은 다음 번호
+
+    이전 merge가 없거나 renumber=True면 s1부터 순서대로 부여 (기존 방식)
+    """
+    if renumber or not previous:
+        return [f"s{i}" for i in range(1, len(keys) + 1)]
+
+    by_hash: Dict[str, List[str]] = {}
+    by_origin: Dict[str, str] = {}
+    for scene_id, info in previous.items():
+        by_hash.setdefault(info["hash"], []).append(scene_id)
+        if info.get("origin"):
+            by_origin[info["origin"]] = scene_id
+
+    ids: List[Optional[str]] = [None] * len(keys)
+    claimed = set()
+
+    for i, (content_hash, _) in enumerate(keys):
+        for scene_id in by_hash.get(content_hash, []):
+            if scene_id not in claimed:
+                ids[i] = scene_id
+                claimed.add(scene_id)
+                break
+
+    for i, (_, origin) in enumerate(keys):
+        if ids[i] is None:
+            scene_id = by_origin.get(origin)
+            if scene_id and scene_id not in claimed:
+                ids[i] = scene_id
+                claimed.add(scene_id)
+
+    numbers = [int(sid[1:]) for sid in previous if sid[1:].isdigit()]
+    next_number = max(numbers, default=0) + 1
+    for i in range(len(ids)):
+        if ids[i] is None:
+            ids[i] = f"s{next_number}"
+            next_number += 1
+
+    return ids
+
+
+def build_merge_report(previous: Dict[str, Dict], new_ids: List[str], keys: List[tuple],
+                       section_map: Dict[str, Dict]) -> Dict:
+    """merge 변경 리포트 (downstream 단계가 영향받는 씬/섹션만 다시 빌드하도록)"""
+    added, modified, unchanged = [], [], []
+    for scene_id, (content_hash, _) in zip(new_ids, keys):
+        if scene_id not in previous:
+            added.append(scene_id)
+        elif previous[scene_id]["hash"] != content_hash:
+            modified.append(scene_id)
+        else:
+            unchanged.append(scene_id)
+    removed = [scene_id for scene_id in previous if scene_id not in set(new_ids)]
+
+    scene_section = {sid: sec for sec, info in section_map.items() for sid in info["scenes"]}
+    affected_sections = []
+    for scene_id in added + modified:
+        if scene_section[scene_id] not in affected_sections:
+            affected_sections.append(scene_section[scene_id])
+    for scene_id in removed:
+        section = previous[scene_id].get("section")
+        if section and section not in affected_sections:
+            affected_sections.append(section)
+
+    return {
+        "generated_at": datetime.now().isoformat(),
+        "added": added,
+        "modified": modified,
+        "removed": removed,
+        "unchanged": unchanged,
+        "affected_sections": affected_sections,
+    }
+
+
+def invalidate_downstream(report: Dict):
+    """변경된 씬/섹션의 ledger 기록을 pending으로 (다음 실행 때 해당 작업만 재실행)"""
+    if not (report["added"] or report["modified"] or report["removed"]):
+        return
+
+    ledger = get_ledger()
+    for scene_id in report["added"] + report["modified"]:
+        for stage in ("timing", "render", "composite"):
+            ledger.mark_pending(stage, scene_id)
+    for section in report["affected_sections"]:
+        ledger.mark_pending("section-merge", section)
+    ledger.mark_pending("final", "final")
 
 
 # ============================================================
@@ -513,13 +1045,10 @@ def cmd_audio(args):
     print(f"\n[TTS] Starting TTS generation (voice: {voice})")
 
     # scenes.json에서 섹션별 narration 수집
-    scenes_file = SCRIPTS_DIR / "scenes.json"
-    if not scenes_file.exists():
+    if PROJECT.scenes_doc() is None:
         print("[ERROR] scenes.json not found. Run Phase 2 first.")
         return
 
-    scenes_data = load_json(scenes_file)
-
     # 섹션별 처리
     sections = get_sections()
     for section in sections:
@@ -531,11 +1060,9 @@ def cmd_audio(args):
         # 섹션의 모든 narration_tts 수집
         narration_parts = []
         for scene_id in scene_ids:
-            scene_file = SCRIPTS_DIR / f"{scene_id}.json"
-            if scene_file.exists():
-                scene_data = load_json(scene_file)
-                if scene_data and "narration_tts" in scene_data:
-                    narration_parts.append(scene_data["narration_tts"])
+            scene_data = PROJECT.scene(scene_id)
+            if scene_data and "narration_tts" in scene_data:
+                narration_parts.append(scene_data["narration_tts"])
 
         if not narration_parts:
             print(f"[SKIP] {section} section has no narration")
@@ -543,24 +1070,42 @@ def cmd_audio(args):
 
         full_narration = " ".join(narration_parts)
 
-        # TTS 생성
+        # TTS 생성 (narration/음성/모델이 같으면 기존 파일 또는 캐시 사용)
+        ledger = get_ledger()
+        cache = get_cache()
         audio_path = AUDIO_DIR / f"{section}.mp3"
-        if audio_path.exists() and not args.force:
-            print(f"[SKIP] {section}.mp3 already exists (use --force to regenerate)")
+        tts_key = cache.action_key("tts", [], {"text": full_narration, "voice": voice, "model": TTS_MODEL})
+        if not args.force and is_stage_done("tts", section, audio_path, tts_key):
+            print(f"[SKIP] {section}.mp3 up to date (use --force to regenerate)")
+        else:
+            print(f"[TTS] Generating {section} audio... ({len(full_narration)} chars)")
+            cache.prepare_output(audio_path)
+            with ledger.track("tts", section, tts_key, audio_path), atomic_output(audio_path) as partial:
+                generate_tts(full_narration, partial, voice)
+                if not commit_output(partial, audio_path):
+                    raise RuntimeError(f"{section}.mp3 TTS 출력 없음")
+            store_output("tts", tts_key, audio_path)
+
+        # Whisper 타임스탬프 추출 (오디오 내용이 같으면 재사용)
+        whisper_path = AUDIO_DIR / f"{section}_whisper.json"
+        whisper_key = cache.action_key("whisper", [audio_path], {"model": WHISPER_MODEL})
+        if not args.force and is_stage_done("whisper", section, whisper_path, whisper_key):
+            print(f"[SKIP] {section}_whisper.json up to date")
             continue
 
-        print(f"[TTS] Generating {section} audio... ({len(full_narration)} chars)")
-        generate_tts(full_narration, audio_path, voice)
-
-        # Whisper 타임스탬프 추출
-        whisper_path = AUDIO_DIR / f"{section}_whisper.json"
         print(f"[WHISPER] Extracting timestamps for {section}...")
-        extract_whisper_timestamps(audio_path, whisper_path)
+        with ledger.track("whisper", section, whisper_key, whisper_path):
+            extract_whisper_timestamps(audio_path, whisper_path)
+        store_output("whisper", whisper_key, whisper_path)
 
     print("\n[DONE] Phase 3 (AUDIO) completed!")
     print("Next: Run 'python pipeline.py srt-timing' for subtitle timing")
 
 
+TTS_MODEL = "tts-1-hd"
+WHISPER_MODEL = "whisper-1"
+
+
 def generate_tts(text: str, output_path: Path, voice: str = "nova"):
     """OpenAI TTS로 음성 생성"""
     client = OpenAI()
@@ -569,7 +1114,7 @@ def generate_tts(text: str, output_path: Path, voice: str = "nova"):
     max_chars = 4000
     if len(text) <= max_chars:
         response = client.audio.speech.create(
-            model="tts-1-hd",
+            model=TTS_MODEL,
             voice=voice,
             input=text
         )
@@ -592,7 +1137,7 @@ def generate_tts(text: str, output_path: Path, voice: str = "nova"):
             for idx, chunk in enumerate(chunks):
                 temp_path = Path(tmpdir) / f"chunk_{idx}.mp3"
                 response = client.audio.speech.create(
-                    model="tts-1-hd",
+                    model=TTS_MODEL,
                     voice=voice,
                     input=chunk
                 )
@@ -619,7 +1164,7 @@ def extract_whisper_timestamps(audio_path: Path, output_path: Path):
 
     with open(audio_path, "rb") as audio_file:
         transcript = client.audio.transcriptions.create(
-            model="whisper-1",
+            model=WHISPER_MODEL,
             file=audio_file,
             response_format="verbose_json",
             timestamp_granularities=["word"]
@@ -634,50 +1179,48 @@ def extract_whisper_timestamps(audio_path: Path, output_path: Path):
     }
 
     save_json(output_path, result)
+    # 컬럼 형식 (정렬/SRT 단계에서 memmap으로 로드)
+    save_words(wcol_path(output_path), result["words"])
 
 
 def cmd_srt_timing(args):
     """SRT 타이밍 생성 (subtitle_display + Whisper 매칭)"""
     print("\n[SRT] Generating timing files...")
 
-    scenes_file = SCRIPTS_DIR / "scenes.json"
-    if not scenes_file.exists():
+    if PROJECT.scenes_doc() is None:
         print("[ERROR] scenes.json not found")
         return
 
-    scenes_data = load_json(scenes_file)
+    store = open_store()
 
     # 섹션별 처리
     sections = get_sections()
     for section in sections:
-        section_scenes = scenes_data["meta"]["sections"].get(section, {}).get("scenes", [])
+        section_scenes = PROJECT.section_scenes(section)
         if not section_scenes:
             continue
 
         whisper_file = AUDIO_DIR / f"{section}_whisper.json"
-        if not whisper_file.exists():
+        words = load_section_words(AUDIO_DIR, section)
+        if words is None:
             print(f"[SKIP] {section}_whisper.json not found")
             continue
 
-        whisper_data = load_json(whisper_file)
-        words = whisper_data.get("words", [])
-
-        if not words:
+        if not len(words):
             print(f"[SKIP] {section} has no words")
             continue
 
         # 섹션 전체 duration 계산
-        section_duration = words[-1]["end"] if words else 0
+        section_duration = words.duration
 
         # 씬별 자막 분할
         scene_offset = 0.0
 
         for scene_id in section_scenes:
-            scene_file = SCRIPTS_DIR / f"{scene_id}.json"
-            if not scene_file.exists():
+            scene_data = PROJECT.scene(scene_id)
+            if scene_data is None:
                 continue
 
-            scene_data = load_json(scene_file)
             subtitle_display = scene_data.get("subtitle_display", "")
 
             if not subtitle_display:
@@ -719,17 +1262,24 @@ def cmd_srt_timing(args):
             # s#_timed.json 저장
             timing_file = AUDIO_DIR / f"{scene_id}_timed.json"
             save_json(timing_file, timing_data, silent=True)
+            get_ledger().mark_done(
+                "timing", scene_id, fingerprint_files([PROJECT.scene_path(scene_id), whisper_file]), timing_file
+            )
+            if store:
+                store.upsert_timing(scene_id, timing_data)
 
             # SRT 파일 생성
             srt_content = generate_srt(timing_data["subtitle_segments"])
             srt_file = AUDIO_DIR / f"{scene_id}.srt"
-            with open(srt_file, 'w', encoding='utf-8') as f:
-                f.write(srt_content)
+            atomic_write_text(srt_file, srt_content)
 
             scene_offset += scene_duration
 
         print(f"[OK] {section}: {len(section_scenes)} scenes processed")
 
+    if store:
+        store.close()
+
     print("\n[DONE] SRT timing completed!")
 
 
@@ -775,21 +1325,19 @@ def cmd_update_root(args):
         print("[ERROR] 씬 파일 없음 (remotion/src/scenes/S*.tsx)")
         return
 
-    # 각 씬의 duration 계산
+    # 각 씬의 duration (타임라인의 프레임 단위 길이)
+    timeline = get_timeline()
     compositions = []
 
     for scene_file in scene_files:
         scene_id = scene_file.stem.lower()  # S1 -> s1
-        timing_file = AUDIO_DIR / f"{scene_id}_timed.json"
 
-        if timing_file.exists():
-            timing_data = load_json(timing_file)
-            # s{n}_timed.json 구조: 최상위 레벨에 duration 필드
-            duration = timing_data.get("duration", 10)
+        if scene_id in timeline and scene_id not in timeline.missing:
+            duration_frames = timeline.duration_frames(scene_id)
         else:
-            duration = 10  # default
+            print(f"  [WARN] {scene_id}_timed.json 없음, 기본 10초 사용")
+            duration_frames = 10 * FPS
 
-        duration_frames = int(duration * 30) + 1
         compositions.append({
             "id": scene_file.stem,
             "component": scene_file.stem,
@@ -801,7 +1349,7 @@ def cmd_update_root(args):
         compositions.append({
             "id": trans_file.stem,
             "component": trans_file.stem,
-            "durationInFrames": 90,  # 3초 기본
+            "durationInFrames": 3 * FPS,  # 3초 기본
             "type": "transition"
         })
 
@@ -809,8 +1357,8 @@ def cmd_update_root(args):
     root_content = generate_root_tsx(compositions)
     root_path = REMOTION_DIR / "src" / "Root.tsx"
 
-    with open(root_path, 'w', encoding='utf-8') as f:
-        f.write(root_content)
+    # 렌더 워커가 읽는 중에도 잘린 파일을 보지 않도록 원자적 교체
+    atomic_write_text(root_path, root_content)
 
     print(f"[OK] Root.tsx 업데이트 완료 ({len(compositions)}개 Composition)")
 
@@ -837,7 +1385,7 @@ def generate_root_tsx(compositions: List[Dict]) -> str:
             f'        id="{comp["id"]}"\n'
             f'        component={{{comp["component"]}}}\n'
             f'        durationInFrames={{{comp["durationInFrames"]}}}\n'
-            f'        fps={{30}}\n'
+            f'        fps={{{FPS}}}\n'
             f'        width={{1920}}\n'
             f'        height={{1080}}\n'
             f'      />'
@@ -862,6 +1410,14 @@ export const RemotionRoot: React.FC = () => {{
 # ============================================================
 # Phase 5: RENDER
 # ============================================================
+def render_defaults() -> Dict:
+    """tune-render 프로필의 현재 머신 설정 (없으면 concurrency 4, 씬 1개씩)"""
+    profile = load_profile(RENDER_PROFILE_FILE)
+    if profile and profile.get("concurrency"):
+        return {"concurrency": profile["concurrency"], "jobs": profile["jobs"], "tuned": True}
+    return {"concurrency": 4, "jobs": 1, "tuned": False}
+
+
 def cmd_render(args):
     """Remotion 렌더링 (배경 포함 기본, --transparent로 투명 렌더링)"""
     transparent = args.transparent
@@ -870,72 +1426,224 @@ def cmd_render(args):
 
     section = args.section
     scene = args.scene
-    concurrency = args.concurrency
+    defaults = render_defaults()
+    concurrency = args.concurrency or defaults["concurrency"]
+    jobs = args.jobs or defaults["jobs"]
+    # 튜닝한 머신은 측정한 조합(jobs × concurrency)을 코어 예산으로 사용
+    cores = args.cores or (jobs * concurrency if defaults["tuned"] else os.cpu_count() or 1)
+    if defaults["tuned"] and not (args.concurrency and args.jobs):
+        print(f"  [PROFILE] tune-render 설정: 동시 렌더 {jobs}, concurrency {concurrency}")
 
     if scene:
         # 단일 씬 렌더링
-        render_scene(scene, concurrency, transparent)
+        scene_ids = [scene]
     elif section:
-        # 섹션별 렌더링
+        # 섹션별 렌더링 (전환 클립은 사용하지 않음 - 섹션 직접 연결)
         scene_ids = get_scenes_for_section(section)
-        for scene_id in scene_ids:
-            render_scene(scene_id, concurrency, transparent)
-        # 전환 클립은 사용하지 않음 (섹션 직접 연결)
     else:
-        # 전체 렌더링
-        scenes_data = load_json(SCENES_DIR / "scenes.json")
-        if scenes_data:
-            for scene_info in scenes_data.get("scenes", []):
-                render_scene(scene_info["scene_id"], concurrency, transparent)
+        # 전체 렌더링 (전환은 섹션 간 연결에 사용하지 않음 - 직접 연결)
+        scene_ids = PROJECT.all_scenes()
 
-        # 전환은 섹션 간 연결에 사용하지 않음 (직접 연결)
+    if not args.no_preflight and not run_preflight("render", scene_ids, quiet=True, transparent=transparent):
+        return
+
+    if jobs > 1 and len(scene_ids) > 1:
+        render_parallel(scene_ids, jobs, cores, transparent, args.backend, args.shards)
+    else:
+        for scene_id in scene_ids:
+            render_scene(scene_id, concurrency, transparent, backend=args.backend, shards=args.shards)
 
+    print(f"\n[PROGRESS] {get_ledger().progress_line('render', [s.lower() for s in scene_ids])}")
     print("\n[OK] 렌더링 완료!")
     if not transparent:
         print("💡 배경 포함 렌더링 완료. composite 단계를 생략하고 section-merge로 진행하세요.")
 
 
-def render_scene(scene_id: str, concurrency: int = 4, transparent: bool = False):
+def render_parallel(scene_ids: List[str], jobs: int, cores: int, transparent: bool = False,
+                    backend: Optional[str] = None, shards: int = 1) -> Dict:
+    """여러 씬 동시 렌더 - 전체 코어 예산을 예상 비용 비례로 나눠 Remotion 탭 수로 사용"""
+    costs = estimate_render_costs(scene_ids)
+    pool = RenderPool(budget=cores, jobs=jobs, log_dir=LOGS_DIR)
+    print(f"  [POOL] 동시 렌더 {min(jobs, len(scene_ids))}개, 코어 예산 {pool.budget} (씬별 로그: {LOGS_DIR})")
+
+    def render(scene_id: str, tabs: int, log_path: Path) -> Dict:
+        stats = {"rendered": False, "frames": 0}
+        stats["ok"] = render_scene(scene_id, tabs, transparent, log_path=log_path, stats=stats,
+                                   backend=backend, shards=shards)
+        return stats
+
+    summary = pool.run(costs, render)
+    if summary["rendered"]:
+        print(f"\n[POOL] {len(summary['rendered'])}개 씬, {summary['frames']} 프레임, "
+              f"{summary['elapsed']:.1f}s → 전체 {summary['fps']:.1f} fps")
+    if summary["failed"]:
+        print(f"[ERROR] 렌더 실패: {', '.join(summary['failed'])}")
+    return summary
+
+
+def render_scene(scene_id: str, concurrency: int = 4, transparent: bool = False,
+                 log_path: Optional[Path] = None, stats: Optional[Dict] = None,
+                 backend: Optional[str] = None, shards: int = 1) -> bool:
     """단일 씬 렌더링
 
     Args:
         scene_id: 씬 ID (예: s1)
         concurrency: 동시 렌더링 수
         transparent: True면 투명 배경 WebM, False면 배경 포함 MP4
+        log_path: Remotion 출력을 기록할 파일 (render --jobs: 씬별 로그)
+        stats: 실제로 렌더했으면 {rendered, frames, seconds, concurrency}를 채움
+        backend: "cli" / "server" (기본: PIPELINE_RENDER_BACKEND, 서버는 번들이 있어야 사용)
+        shards: 2 이상이면 프레임 구간으로 나눠 병렬 렌더 후 연결 (CLI, 구간당 최소 60프레임)
+
+    Returns:
+        성공(또는 이미 완료) 여부
     """
     comp_id = scene_id.upper() if not scene_id[0].isupper() else scene_id  # s1 -> S1
+    unit = scene_id.lower()
+
+    output_path = render_output(unit, transparent)
+    encoder_args = RENDER_ENCODER_ARGS[transparent]
+    fingerprint = render_key(unit, comp_id, encoder_args)
+    if transparent and raw_render_consumed(output_path, fingerprint):
+        print(f"[SKIP] {scene_id} 최신 상태 (합성 완료, 투명 렌더 정리됨), 스킵")
+        return True
+    if is_stage_done("render", unit, output_path, fingerprint):
+        print(f"[SKIP] {scene_id} 최신 상태, 스킵")
+        return True
+
+    serve_url = remotion_serve_url()
+    print(f"🎬 {scene_id} 렌더링 중... ({'투명' if transparent else '배경 포함'})")
+    # 임시 이름에 쓰고 성공 시 rename (중단되어도 잘린 파일이 출력 이름으로 남지 않음)
+    partial = partial_path(output_path)
+
+    timeline = get_timeline()
+    frames = timeline.duration_frames(unit) if unit in timeline else 0
+    ranges = plan_shards(frames, shards) if shards > 1 else []
+    # 구간 렌더는 구간 프로세스마다 브라우저를 띄우므로 구간별로 governor 허용을 받음 (render_sharded)
+    slot = contextlib.nullcontext({"size": concurrency}) if len(ranges) > 1 else \
+        GOVERNOR.job("render", concurrency, label=scene_id)
+    reused = 0
+
+    get_cache().prepare_output(output_path)
+    with get_ledger().track("render", unit, fingerprint, output_path) as entry, atomic_output(output_path), \
+            slot as grant:
+        # governor가 여유에 맞춰 concurrency를 줄일 수 있음 (렌더 key에는 포함되지 않음)
+        cmd = f'npx remotion render "{serve_url}" {comp_id} --output "{partial}" {encoder_args} --concurrency {grant["size"]}'
+        started = time.monotonic()
+        server = None
+        if len(ranges) <= 1 and (backend or RENDER_BACKEND) == "server" and serve_url != ENTRY_POINT:
+            # 상주 렌더 서버는 번들이 있을 때만 사용 (시작 실패 시 None → CLI)
+            server = get_render_server()
+        if len(ranges) > 1:
+            returncode, error, reused = render_sharded(unit, comp_id, serve_url, partial, encoder_args, fingerprint,
+                                               ranges, grant["size"], log_path)
+        elif server:
+            returncode, error = render_with_server(server, serve_url, comp_id, partial, encoder_args,
+                                                   grant["size"], log_path)
+        elif log_path:
+            with open(log_path, "w", encoding="utf-8") as log:
+                log.write(f"$ {cmd}\n")
+                log.flush()
+                returncode = subprocess.run(cmd, cwd=str(REMOTION_DIR), stdout=log, stderr=subprocess.STDOUT,
+                                            shell=True).returncode
+            error = log_path.read_text(encoding="utf-8", errors="replace")[-500:]
+        else:
+            result = subprocess.run(cmd, cwd=str(REMOTION_DIR), capture_output=True, text=True, shell=True)
+            returncode, error = result.returncode, result.stderr[:500]
+        ok = returncode == 0 and commit_output(partial, output_path)
+
+        if ok:
+            print(f"  [OK] {output_path.name}")
+            store_output("render", fingerprint, output_path)
+            # 실제 소요 시간 → 렌더 비용 모델 학습 데이터
+            # (이전 실행의 구간을 재사용했으면 전체 프레임을 렌더한 시간이 아니므로 기록하지 않음)
+            seconds = time.monotonic() - started
+            if frames and not reused:
+                get_render_costs().record(unit, frames, render_features(unit), seconds, grant["size"])
+            if stats is not None:
+                stats.update(rendered=True, frames=frames, seconds=seconds, concurrency=grant["size"])
+            if transparent:
+                # 투명 렌더는 composite만 사용 → 합성 후 삭제
+                get_intermediates().register(output_path, [f"composite:{unit}"], fingerprint)
+        else:
+            error = error or "출력 파일 없음"
+            print(f"  [ERROR] {scene_id} 실패: {error}")
+            entry.fail(error)
 
-    if transparent:
-        # 투명 배경 모드: WebM (알파 채널 포함)
-        output_path = RENDERS_DIR / f"{scene_id.lower()}_raw.webm"
-
-        if output_path.exists():
-            print(f"[SKIP] {scene_id} 이미 존재, 스킵")
-            return
-
-        print(f"🎬 {scene_id} 렌더링 중... (투명)")
-
-        # ⚠️ 중요: --pixel-format yuva420p 필수! (알파 채널 포함)
-        cmd = f'npx remotion render src/index.ts {comp_id} --output "{output_path}" --codec vp9 --image-format png --pixel-format yuva420p --concurrency {concurrency}'
-    else:
-        # 배경 포함 모드: MP4 (직접 출력)
-        output_path = COMPOSITE_DIR / f"{scene_id.lower()}.mp4"
-
-        if output_path.exists():
-            print(f"[SKIP] {scene_id} 이미 존재, 스킵")
-            return
+    return ok
 
-        print(f"🎬 {scene_id} 렌더링 중... (배경 포함)")
 
-        # 배경 포함 렌더링: H.264 MP4
-        cmd = f'npx remotion render src/index.ts {comp_id} --output "{output_path}" --codec h264 --image-format jpeg --crf 18 --concurrency {concurrency}'
+def render_sharded(unit: str, comp_id: str, serve_url: str, output: Path, encoder_args: str, fingerprint: str,
+                   ranges: List[tuple], concurrency: int, log_path: Optional[Path] = None) -> tuple:
+    """프레임 구간별 병렬 렌더 → output에 무손실 연결 (returncode, 오류 메시지, 재사용한 구간 수)
 
-    result = subprocess.run(cmd, cwd=str(REMOTION_DIR), capture_output=True, text=True, shell=True)
+    구간 파일은 렌더 key별 작업 폴더(5_renders 또는 scratch)에 남으므로,
+    일부 구간이 실패하면 다음 실행에서 실패한 구간만 다시 렌더합니다.
+    구간 프로세스마다 브라우저를 띄우므로 governor 허용도 구간마다 받습니다.
+    """
+    import shutil
 
-    if result.returncode == 0:
-        print(f"  [OK] {output_path.name}")
-    else:
-        print(f"  [ERROR] 실패: {result.stderr[:500]}")
+    work_dir = get_intermediates().path(RENDERS_DIR, f"{unit}.{fingerprint[:12]}.shards")
+    tabs = max(1, concurrency // len(ranges))   # 구간 프로세스들이 concurrency를 나눠 씀
+    log_lock = threading.Lock()
+    if log_path:
+        log_path.write_text("", encoding="utf-8")
+
+    def render_shard(start: int, end: int, shard_output: Path) -> tuple:
+        with GOVERNOR.job("render", tabs, label=f"{unit}[{start}-{end}]") as grant:
+            cmd = (f'npx remotion render "{serve_url}" {comp_id} --output "{shard_output}" '
+                   f'--frames={start}-{end} {encoder_args} --concurrency {grant["size"]}')
+            result = subprocess.run(cmd, cwd=str(REMOTION_DIR), capture_output=True, text=True, shell=True)
+        if log_path:
+            with log_lock, open(log_path, "a", encoding="utf-8") as log:
+                log.write(f"$ {cmd}\n{result.stdout}{result.stderr}")
+        return result.returncode == 0, result.stderr[:500]
+
+    print(f"  [SHARD] {unit}: 구간 {len(ranges)}개 × concurrency {tabs}")
+    sharder = ShardedRender(work_dir, render_shard, jobs=len(ranges))
+    result = sharder.run(ranges, output.suffix)
+    if result["reused"]:
+        print(f"  [SHARD] 이전 실행에서 완료된 구간 {result['reused']}개 재사용")
+    if not result["ok"]:
+        failed = ", ".join(f"{start}-{end}" for start, end, _ in result["failed"])
+        return 1, f"구간 실패 ({failed}): {result['failed'][0][2]}", result["reused"]
+
+    ok, error = concat_shards(result["paths"], output)
+    if ok and not get_intermediates().keep:
+        # 이번 구간 파일 + 이전 입력 key로 남은 구간 폴더 정리
+        for stale in work_dir.parent.glob(f"{unit}.*.shards"):
+            shutil.rmtree(stale, ignore_errors=True)
+    return (0 if ok else 1), error, result["reused"]
+
+
+# 투명 배경 모드: WebM (알파 채널 포함) - ⚠️ 중요: --pixel-format yuva420p 필수!
+# 배경 포함 모드: H.264 MP4 (직접 출력)
+RENDER_ENCODER_ARGS = {
+    True: "--codec vp9 --image-format png --pixel-format yuva420p",
+    False: "--codec h264 --image-format jpeg --crf 18",
+}
+
+
+def render_output(unit: str, transparent: bool) -> Path:
+    """렌더 출력 경로 (투명: 5_renders/s1_raw.webm, 배경 포함: 6_scenes/s1.mp4)"""
+    return RENDERS_DIR / f"{unit}_raw.webm" if transparent else COMPOSITE_DIR / f"{unit}.mp4"
+
+
+def render_key(unit: str, comp_id: str, encoder_args: str) -> str:
+    """렌더 입력 key: TSX + import한 로컬 파일 + staticFile 에셋 + 타이밍 + 프레임 수 + 인코더 인자 + Remotion 버전
+
+    (동시성은 출력에 영향이 없으므로 제외)
+    """
+    inputs = tsx_dependencies(REMOTION_SCENES_DIR / f"{comp_id}.tsx", REMOTION_DIR / "public")
+    inputs.append(PROJECT.timed_path(unit))
+    timeline = get_timeline()
+    frames = timeline.duration_frames(unit) if unit in timeline else None
+    return get_cache().action_key("render", inputs, {
+        "comp": comp_id,
+        "frames": frames,
+        "encoder": encoder_args,
+        "remotion": remotion_version(REMOTION_DIR),
+    })
 
 
 # 전환 클립은 사용하지 않음 (섹션 직접 연결)
@@ -954,28 +1662,76 @@ def cmd_composite(args):
     if section:
         scene_ids = get_scenes_for_section(section)
     else:
-        scenes_data = load_json(SCENES_DIR / "scenes.json")
-        scene_ids = [s["scene_id"] for s in scenes_data.get("scenes", [])]
+        scene_ids = PROJECT.all_scenes()
+
+    if not args.no_preflight and not run_preflight("composite", scene_ids, quiet=True):
+        return
 
     for scene_id in scene_ids:
         composite_scene(scene_id)
 
+    print(f"\n[PROGRESS] {get_ledger().progress_line('composite', [s.lower() for s in scene_ids])}")
     print("\n[OK] 배경 합성 완료!")
 
 
-def composite_scene(scene_id: str):
+COMPOSITE_ENCODER_ARGS = "-c:v libx264 -preset fast -pix_fmt yuv420p"
+
+
+def render_fingerprint(unit: str) -> Optional[str]:
+    """마지막 렌더의 입력 key (content key가 아니면 None)"""
+    entry = get_ledger().get("render", unit)
+    if entry and entry["status"] == "done" and is_content_key(entry["fingerprint"]):
+        return entry["fingerprint"]
+    return None
+
+
+def composite_key(unit: str) -> str:
+    """합성 입력 key: 투명 렌더 key + 배경 + 인코더 인자 + ffmpeg 버전
+
+    투명 렌더는 합성 후 삭제되므로 파일 내용 대신 렌더 key를 사용합니다.
+    """
+    render_fp = render_fingerprint(unit)
+    inputs = [BACKGROUNDS_DIR / f"bg_{unit}.png"]
+    if render_fp is None:
+        inputs.insert(0, RENDERS_DIR / f"{unit}_raw.webm")
+    return get_cache().action_key(
+        "composite", inputs,
+        {"render": render_fp, "args": COMPOSITE_ENCODER_ARGS, "ffmpeg": ffmpeg_version()}
+    )
+
+
+def raw_render_available(scene_id: str) -> bool:
+    """투명 렌더가 있거나 빌드 캐시에서 복원 가능한지 (preflight용)"""
+    if (RENDERS_DIR / f"{scene_id}_raw.webm").exists():
+        return True
+    render_fp = render_fingerprint(scene_id)
+    return bool(render_fp) and get_cache().available(render_fp) is not None
+
+
+def composite_scene(scene_id: str) -> bool:
     """단일 씬 배경 합성 (WebM 투명 + 배경 PNG → MP4)"""
-    render_path = RENDERS_DIR / f"{scene_id.lower()}_raw.webm"
-    bg_path = BACKGROUNDS_DIR / f"bg_{scene_id.lower()}.png"
-    output_path = COMPOSITE_DIR / f"{scene_id.lower()}.mp4"
+    unit = scene_id.lower()
+    render_path = RENDERS_DIR / f"{unit}_raw.webm"
+    bg_path = BACKGROUNDS_DIR / f"bg_{unit}.png"
+    output_path = COMPOSITE_DIR / f"{unit}.mp4"
+    consumer = f"composite:{unit}"
+
+    fingerprint = composite_key(unit)
+    if is_stage_done("composite", unit, output_path, fingerprint):
+        print(f"[SKIP] {scene_id} 합성본 최신 상태, 스킵")
+        get_intermediates().release(render_path, consumer)
+        return True
 
     if not render_path.exists():
-        print(f"[WARN] {scene_id} 렌더링 없음, 스킵")
-        return
-
-    if output_path.exists():
-        print(f"[SKIP] {scene_id} 합성본 이미 존재, 스킵")
-        return
+        # 이전 합성 후 정리된 투명 렌더 → 렌더 key로 캐시에서 복원
+        render_fp = render_fingerprint(unit)
+        if not (render_fp and get_cache().restore(render_fp, render_path)):
+            # 캐시에서도 사라진 투명 렌더 → 정리 기록을 지워 다음 render에서 다시 렌더
+            get_intermediates().forget(render_path)
+            print(f"[WARN] {scene_id} 렌더링 없음, 스킵 (render --transparent로 다시 렌더 필요)")
+            return False
+        get_intermediates().register(render_path, [consumer], render_fp)
+        print(f"  [CACHE] {render_path.name} 캐시에서 복원")
 
     print(f"🎨 {scene_id} 배경 합성 중...")
 
@@ -984,23 +1740,33 @@ def composite_scene(scene_id: str):
     duration_result = subprocess.run(duration_cmd, capture_output=True, text=True, shell=True)
     duration = float(duration_result.stdout.strip()) if duration_result.stdout.strip() else 10.0
 
+    partial = partial_path(output_path)
     if bg_path.exists():
         # ⚠️ 중요: -c:v libvpx-vp9 디코더와 format=yuva420p 필수!
         # Remotion에서 yuva420p로 렌더링한 WebM의 알파채널을 제대로 읽으려면
         # libvpx-vp9 디코더를 명시하고 yuva420p 포맷으로 변환해야 함
         # 이 설정 없으면 배경이 첫 프레임만 표시되는 문제 발생
-        cmd = f'ffmpeg -y -loop 1 -t {duration} -framerate 30 -i "{bg_path}" -c:v libvpx-vp9 -i "{render_path}" -filter_complex "[1:v]format=yuva420p[fg];[0:v]scale=1920:1080,format=yuva420p[bg];[bg][fg]overlay=0:0" -c:v libx264 -preset fast -pix_fmt yuv420p -t {duration} "{output_path}"'
+        cmd = f'ffmpeg -y -loop 1 -t {duration} -framerate 30 -i "{bg_path}" -c:v libvpx-vp9 -i "{render_path}" -filter_complex "[1:v]format=yuva420p[fg];[0:v]scale=1920:1080,format=yuva420p[bg];[bg][fg]overlay=0:0" {COMPOSITE_ENCODER_ARGS} -t {duration}'
     else:
         # 배경 없음: 검은 배경 사용
         print(f"  [WARN] {bg_path.name} 없음, 검은 배경 사용")
-        cmd = f'ffmpeg -y -f lavfi -t {duration} -i "color=c=black:s=1920x1080:r=30" -c:v libvpx-vp9 -i "{render_path}" -filter_complex "[1:v]format=yuva420p[fg];[0:v]format=yuva420p[bg];[bg][fg]overlay=0:0" -c:v libx264 -preset fast -pix_fmt yuv420p -t {duration} "{output_path}"'
+        cmd = f'ffmpeg -y -f lavfi -t {duration} -i "color=c=black:s=1920x1080:r=30" -c:v libvpx-vp9 -i "{render_path}" -filter_complex "[1:v]format=yuva420p[fg];[0:v]format=yuva420p[bg];[bg][fg]overlay=0:0" {COMPOSITE_ENCODER_ARGS} -t {duration}'
 
-    result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
+    get_cache().prepare_output(output_path)
+    with get_ledger().track("composite", unit, fingerprint, output_path) as entry, atomic_output(output_path):
+        result = run_ffmpeg(cmd, partial, label=f"composite {unit}")
+        ok = result.returncode == 0 and commit_output(partial, output_path)
 
-    if result.returncode == 0:
-        print(f"  [OK] {output_path.name}")
-    else:
-        print(f"  [ERROR] 실패: {result.stderr[:200]}")
+        if ok:
+            print(f"  [OK] {output_path.name}")
+            store_output("composite", fingerprint, output_path)
+            get_intermediates().release(render_path, consumer)
+        else:
+            error = result.stderr[:200] or "출력 파일 없음"
+            print(f"  [ERROR] 실패: {error}")
+            entry.fail(error)
+
+    return ok
 
 
 def cmd_section_merge(args):
@@ -1013,65 +1779,61 @@ def cmd_section_merge(args):
     for sec in sections_to_process:
         merge_section(sec)
 
+    print(f"\n[PROGRESS] {get_ledger().progress_line('section-merge', sections_to_process)}")
     print("\n[OK] 섹션 합성 완료!")
 
 
-def merge_section(section: str):
+def section_key(section: str, scene_ids: List[str]) -> str:
+    """섹션 입력 key: 씬 영상 + 섹션 오디오 + gap 프레임 + ffmpeg 버전"""
+    timeline = get_timeline()
+    return get_cache().action_key(
+        "section-merge",
+        [COMPOSITE_DIR / f"{s}.mp4" for s in scene_ids] + [AUDIO_DIR / f"{section}.mp3"],
+        {"gaps": [timeline.gap_frames(s) if s in timeline else 0 for s in scene_ids],
+         "ffmpeg": ffmpeg_version()}
+    )
+
+
+def merge_section(section: str) -> bool:
     """단일 섹션 합성 (씬 사이 gap을 마지막 프레임으로 채움)"""
     scene_ids = get_scenes_for_section(section)
     if not scene_ids:
         print(f"[WARN] {section} 섹션에 씬 없음, 스킵")
-        return
+        return False
 
     output_path = SECTIONS_DIR / f"section_{section}.mp4"
     audio_path = AUDIO_DIR / f"{section}.mp3"
+    timeline = get_timeline()
+    fingerprint = section_key(section, scene_ids)
 
-    if output_path.exists():
-        print(f"[SKIP] section_{section}.mp4 이미 존재, 스킵")
-        return
+    if is_stage_done("section-merge", section, output_path, fingerprint):
+        print(f"[SKIP] section_{section}.mp4 최신 상태, 스킵")
+        return True
 
     print(f"🔗 {section} 섹션 합성 중...")
 
-    # 씬별 타이밍 정보 로드 및 gap 계산
+    # 씬 사이 gap (타임라인에서 프레임 단위로 계산됨)
     import tempfile
     padded_files = []
     temp_files = []  # 삭제할 임시 파일 목록
 
-    for i, scene_id in enumerate(scene_ids):
+    for scene_id in scene_ids:
         scene_path = COMPOSITE_DIR / f"{scene_id}.mp4"
         if not scene_path.exists():
             print(f"  [WARN] {scene_id}.mp4 없음, 스킵")
             continue
 
-        # 현재 씬의 타이밍 정보
-        timed_path = AUDIO_DIR / f"{scene_id}_timed.json"
-        if not timed_path.exists():
-            padded_files.append(scene_path)
-            continue
+        gap_frames = timeline.gap_frames(scene_id) if scene_id in timeline else 0
 
-        current_timing = load_json(timed_path)
-        # s{n}_timed.json 구조: 최상위 레벨에 section_start, section_end 필드
-        current_end = current_timing.get('section_end', 0)
-
-        # 다음 씬의 시작 시간 확인 (gap 계산)
-        gap_duration = 0
-        if i + 1 < len(scene_ids):
-            next_scene_id = scene_ids[i + 1]
-            next_timed_path = AUDIO_DIR / f"{next_scene_id}_timed.json"
-            if next_timed_path.exists():
-                next_timing = load_json(next_timed_path)
-                next_start = next_timing.get('section_start', 0)
-                gap_duration = next_start - current_end
-
-        # gap이 있으면 마지막 프레임 연장
-        if gap_duration > 0.05:  # 50ms 이상인 경우만
-            padded_path = COMPOSITE_DIR / f"{scene_id}_padded.mp4"
-            pad_cmd = f'ffmpeg -y -i "{scene_path}" -vf "tpad=stop_mode=clone:stop_duration={gap_duration}" -c:v libx264 -preset fast -an "{padded_path}"'
-            result = subprocess.run(pad_cmd, capture_output=True, text=True, shell=True)
+        # gap이 있으면 마지막 프레임 연장 (프레임 수로 지정 → 반올림 오차 없음)
+        if gap_frames > 0:
+            padded_path = get_intermediates().path(COMPOSITE_DIR, f"{scene_id}_padded.mp4")
+            pad_cmd = f'ffmpeg -y -i "{scene_path}" -vf "tpad=stop_mode=clone:stop={gap_frames}" -c:v libx264 -preset fast -an'
+            result = run_ffmpeg(pad_cmd, padded_path, label=f"pad {scene_id}")
             if result.returncode == 0:
                 padded_files.append(padded_path)
                 temp_files.append(padded_path)
-                print(f"    {scene_id}: +{gap_duration:.2f}s gap 추가")
+                print(f"    {scene_id}: +{timeline.seconds(gap_frames):.2f}s gap 추가 ({gap_frames} frames)")
             else:
                 padded_files.append(scene_path)
         else:
@@ -1079,7 +1841,7 @@ def merge_section(section: str):
 
     if not padded_files:
         print(f"  [ERROR] {section} 섹션에 합성 가능한 씬 없음")
-        return
+        return False
 
     # concat 리스트 파일 생성
     with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
@@ -1087,6 +1849,7 @@ def merge_section(section: str):
             f.write(f"file '{sf}'\n")
         list_file = f.name
 
+    partial = partial_path(output_path)
     try:
         if audio_path.exists():
             # 오디오 길이 확인
@@ -1095,19 +1858,30 @@ def merge_section(section: str):
             audio_duration = float(audio_dur_result.stdout.strip()) if audio_dur_result.stdout.strip() else 0
 
             # 영상 concat + 오디오 합성 (-t로 오디오 길이에 맞춤, -shortest는 concat에서 불안정)
-            cmd = f'ffmpeg -y -f concat -safe 0 -i "{list_file}" -i "{audio_path}" -c:v libx264 -preset fast -c:a aac -b:a 192k -map 0:v:0 -map 1:a:0 -t {audio_duration} "{output_path}"'
+            cmd = f'ffmpeg -y -f concat -safe 0 -i "{list_file}" -i "{audio_path}" -c:v libx264 -preset fast -c:a aac -b:a 192k -map 0:v:0 -map 1:a:0 -t {audio_duration}'
         else:
             # 영상만 concat
-            cmd = f'ffmpeg -y -f concat -safe 0 -i "{list_file}" -c:v libx264 -preset fast "{output_path}"'
+            cmd = f'ffmpeg -y -f concat -safe 0 -i "{list_file}" -c:v libx264 -preset fast'
 
-        result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
+        get_cache().prepare_output(output_path)
+        with get_ledger().track("section-merge", section, fingerprint, output_path) as entry, \
+                atomic_output(output_path):
+            result = run_ffmpeg(cmd, partial, label=f"section {section}")
+            ok = result.returncode == 0 and commit_output(partial, output_path)
 
-        if result.returncode == 0:
-            print(f"  [OK] section_{section}.mp4")
-        else:
-            print(f"  [ERROR] 실패: {result.stderr[:200]}")
+            if ok:
+                print(f"  [OK] section_{section}.mp4")
+                store_output("section-merge", fingerprint, output_path)
+            else:
+                error = result.stderr[:200] or "출력 파일 없음"
+                print(f"  [ERROR] 실패: {error}")
+                entry.fail(error)
     finally:
         os.unlink(list_file)
+        # gap 연장 파일은 concat에서만 사용
+        get_intermediates().discard(temp_files)
+
+    return ok
 
 
 # ============================================================
@@ -1121,8 +1895,23 @@ def cmd_final(args):
     section_gap = getattr(args, 'section_gap', 1.0)  # 섹션 간 gap (기본 1초)
     output_path = OUTPUT_DIR / "final_video.mp4"
 
+    # 섹션 gap은 프레임 단위로 반올림 (영상 tpad와 오디오 apad 길이가 정확히 일치)
+    timeline = get_timeline(section_gap)
+    gap_frames = timeline.section_gap_frames
+    gap_seconds = timeline.seconds(gap_frames)
+
     # 섹션 목록 구성
     sections = get_sections()
+    if not args.no_preflight and not run_preflight("final", sections=sections, quiet=True):
+        return
+
+    # BGM + 입력 key (섹션 영상 내용, BGM, 볼륨, gap 프레임, ffmpeg 버전)
+    bgm_path = choose_bgm(args.new_bgm)
+    fingerprint = final_key(sections, bgm_path, bgm_volume, gap_frames)
+    if is_stage_done("final", "final", output_path, fingerprint):
+        print(f"[SKIP] {output_path.name} 최신 상태, 스킵")
+        return
+
     section_files = []
     temp_files = []  # 삭제할 임시 파일
 
@@ -1136,17 +1925,17 @@ def cmd_final(args):
 
         # 모든 섹션에 1초 gap 추가 (마지막 프레임 유지 + 무음)
         # 마지막 섹션도 포함 - 영상 끝이 자연스럽게 마무리되도록
-        if section_gap > 0:
-            extended_path = SECTIONS_DIR / f"section_{section}_extended.mp4"
+        if gap_frames > 0:
+            extended_path = get_intermediates().path(SECTIONS_DIR, f"section_{section}_extended.mp4")
 
             # tpad로 마지막 프레임 연장 + apad로 무음 추가
-            extend_cmd = f'ffmpeg -y -i "{section_path}" -vf "tpad=stop_mode=clone:stop_duration={section_gap}" -af "apad=pad_dur={section_gap}" -c:v libx264 -preset fast -c:a aac "{extended_path}"'
+            extend_cmd = f'ffmpeg -y -i "{section_path}" -vf "tpad=stop_mode=clone:stop={gap_frames}" -af "apad=pad_dur={gap_seconds}" -c:v libx264 -preset fast -c:a aac'
 
-            result = subprocess.run(extend_cmd, capture_output=True, text=True, shell=True)
+            result = run_ffmpeg(extend_cmd, extended_path, label=f"extend {section}")
             if result.returncode == 0:
                 section_files.append(extended_path)
                 temp_files.append(extended_path)
-                print(f"  [OK] section_{section}.mp4 (+{section_gap}s)")
+                print(f"  [OK] section_{section}.mp4 (+{gap_seconds:g}s)")
             else:
                 section_files.append(section_path)
                 print(f"  [OK] section_{section}.mp4 (연장 실패, 원본 사용)")
@@ -1164,25 +1953,28 @@ def cmd_final(args):
             f.write(f"file '{sf}'\n")
         list_file = f.name
 
+    partial = partial_path(output_path)
     try:
-        # BGM 선택
-        bgm_files = list(BGM_DIR.glob("*.mp3"))
-
-        if bgm_files:
-            import random
-            bgm_path = random.choice(bgm_files)
+        if bgm_path:
             print(f"🎵 BGM: {bgm_path.name}")
 
             # concat + BGM 믹싱
-            cmd = f'ffmpeg -y -f concat -safe 0 -i "{list_file}" -i "{bgm_path}" -filter_complex "[1:a]volume={bgm_volume}[bgm];[0:a][bgm]amix=inputs=2:duration=first" -c:v libx264 -preset fast -c:a aac -b:a 192k "{output_path}"'
+            cmd = f'ffmpeg -y -f concat -safe 0 -i "{list_file}" -i "{bgm_path}" -filter_complex "[1:a]volume={bgm_volume}[bgm];[0:a][bgm]amix=inputs=2:duration=first" -c:v libx264 -preset fast -c:a aac -b:a 192k'
         else:
             # BGM 없이
             print("  [INFO] BGM 없음, 나레이션만 포함")
-            cmd = f'ffmpeg -y -f concat -safe 0 -i "{list_file}" -c:v libx264 -preset fast -c:a aac -b:a 192k "{output_path}"'
-
-        result = subprocess.run(cmd, capture_output=True, text=True, shell=True)
+            cmd = f'ffmpeg -y -f concat -safe 0 -i "{list_file}" -c:v libx264 -preset fast -c:a aac -b:a 192k'
+
+        get_cache().prepare_output(output_path)
+        with get_ledger().track("final", "final", fingerprint, output_path) as entry, atomic_output(output_path):
+            result = run_ffmpeg(cmd, partial, label="final")
+            ok = result.returncode == 0 and commit_output(partial, output_path)
+            if ok:
+                store_output("final", fingerprint, output_path)
+            else:
+                entry.fail(result.stderr[:500] or "출력 파일 없음")
 
-        if result.returncode == 0:
+        if ok:
             # 최종 영상 정보 출력
             duration_cmd = f'ffprobe -v error -show_entries format=duration -of csv=p=0 "{output_path}"'
             dur_result = subprocess.run(duration_cmd, capture_output=True, text=True, shell=True)
@@ -1191,14 +1983,116 @@ def cmd_final(args):
             print(f"\n[OK] 최종 영상 생성 완료!")
             print(f"📁 {output_path}")
             print(f"⏱️ 길이: {int(duration//60)}분 {int(duration%60)}초")
+
+            # 섹션 시작 시각 (타임라인 기준 - 챕터 표시용)
+            print("📑 섹션 시작:")
+            for section in timeline.sections:
+                start = timeline.seconds(timeline.section_offset(section))
+                print(f"  {int(start//60):02d}:{int(start%60):02d}  {section}")
         else:
-            print(f"[ERROR] 실패: {result.stderr[:500]}")
+            print(f"[ERROR] 실패: {result.stderr[:500] or '출력 파일 없음'}")
     finally:
         os.unlink(list_file)
-        # 임시 fade 파일 삭제
-        for tf in temp_files:
-            if tf.exists():
-                os.unlink(tf)
+        # 섹션 연장 파일 삭제
+        get_intermediates().discard(temp_files)
+
+
+def final_key(sections: List[str], bgm_path: Optional[Path], bgm_volume: float, gap_frames: int) -> str:
+    """최종 영상 입력 key: 섹션 영상 + BGM + 볼륨 + gap 프레임 + ffmpeg 버전"""
+    return get_cache().action_key(
+        "final",
+        [SECTIONS_DIR / f"section_{sec}.mp4" for sec in sections] + ([bgm_path] if bgm_path else []),
+        {"bgm_volume": bgm_volume, "gap_frames": gap_frames, "ffmpeg": ffmpeg_version()}
+    )
+
+
+def choose_bgm(reshuffle: bool = False) -> Optional[Path]:
+    """BGM 선택 (무작위) - 고른 곡은 state.json에 기록해 재실행해도 같은 곡 사용
+
+    같은 곡이어야 final의 입력 key가 유지되어 변경이 없을 때 다시 인코딩하지 않습니다.
+    """
+    bgm_files = sorted(BGM_DIR.glob("*.mp3"))
+    if not bgm_files:
+        return None
+
+    previous = load_state().get("bgm")
+    if not reshuffle and previous and (BGM_DIR / previous).exists():
+        return BGM_DIR / previous
+
+    import random
+    bgm_path = random.choice(bgm_files)
+    update_state({"bgm": bgm_path.name})
+    return bgm_path
+
+
+def build_final(args) -> bool:
+    """최종 병합 실행 후 성공(또는 최신 상태) 여부"""
+    cmd_final(args)
+    entry = get_ledger().get("final", "final")
+    return bool(entry and entry["status"] == "done") and output_intact(OUTPUT_DIR / "final_video.mp4")
+
+
+def cmd_build(args):
+    """render → (composite) → section-merge → final 의존성 그래프 실행
+
+    섹션의 씬이 모두 끝나면 다른 섹션 렌더 중에도 섹션 합성을 시작하고,
+    마지막 섹션이 끝나면 바로 최종 병합을 시작합니다.
+    """
+    if PROJECT.scenes_doc() is None:
+        print("[ERROR] scenes.json not found")
+        return
+
+    transparent = args.transparent
+    sections = [args.section] if args.section else get_sections()
+    scene_ids = [s for sec in sections for s in get_scenes_for_section(sec)]
+    if not args.no_preflight and not run_preflight("render", scene_ids, quiet=True, transparent=transparent):
+        return
+
+    final_args = argparse.Namespace(bgm_volume=args.bgm_volume, section_gap=args.section_gap,
+                                    new_bgm=args.new_bgm, no_preflight=True)
+    defaults = render_defaults()
+    concurrency = args.concurrency or defaults["concurrency"]
+    render_jobs = args.render_jobs or defaults["jobs"]
+    # 렌더는 예상 비용이 큰 씬부터 (longest-job-first)
+    costs = estimate_render_costs(scene_ids)
+    graph = BuildGraph()
+    for section in sections:
+        section_deps = []
+        for scene_id in get_scenes_for_section(section):
+            graph.add(f"render:{scene_id}",
+                      lambda s=scene_id: render_scene(s, concurrency, transparent, backend=args.backend,
+                                                         shards=args.shards),
+                      pool="render", priority=costs.get(scene_id, 0.0))
+            last = f"render:{scene_id}"
+            if transparent:
+                graph.add(f"composite:{scene_id}", lambda s=scene_id: composite_scene(s),
+                          deps=[last], pool="ffmpeg")
+                last = f"composite:{scene_id}"
+            section_deps.append(last)
+        if args.until in ("section", "final"):
+            graph.add(f"section:{section}", lambda sec=section: merge_section(sec),
+                      deps=section_deps, pool="ffmpeg")
+    if args.until == "final" and not args.section:
+        graph.add("final", lambda: build_final(final_args),
+                  deps=[f"section:{sec}" for sec in sections], pool="ffmpeg")
+
+    mode = "투명 + composite" if transparent else "배경 포함"
+    print(f"\n🏗️ 빌드 시작 ({mode}, 노드 {len(graph.nodes)}개, ffmpeg 병렬 {args.jobs})")
+
+    def on_finish(name: str, status: str, elapsed: float):
+        if status != "done":
+            print(f"  [{status.upper()}] {name}" + (f" ({elapsed:.1f}s)" if status == "failed" else ""))
+
+    if render_jobs > 1:
+        order = longest_first(costs)
+        print(f"  렌더 순서 (예상 비용 큰 순): {', '.join(order[:8])}{' ...' if len(order) > 8 else ''}")
+    result = graph.run({"render": render_jobs, "ffmpeg": args.jobs}, on_finish=on_finish)
+
+    print(f"\n[BUILD] 완료 {len(result['done'])}, 실패 {len(result['failed'])}, "
+          f"건너뜀 {len(result['skipped'])} ({result['elapsed']:.1f}s)")
+    if result["failed"]:
+        print(f"[ERROR] 실패: {', '.join(result['failed'])}")
+        sys.exit(1)
 
 
 # 전환 클립은 사용하지 않음 (섹션 직접 연결)
@@ -1247,18 +2141,334 @@ def cmd_sync_assets(args):
         if count > 0:
             print(f"  [OK] backgrounds/ ({count}개)")
 
-    # 캐시 삭제
-    cache_dir = REMOTION_DIR / "node_modules" / ".cache"
-    if cache_dir.exists():
-        shutil.rmtree(cache_dir)
-        print(f"  [OK] 캐시 삭제")
+    # webpack 캐시는 유지 (public/ 내용이 번들 key에 포함되므로 다음 렌더에서 번들이 새로 만들어짐)
 
     print("\n✅ 에셋 동기화 완료!")
 
 
+def cmd_ledger(args):
+    """스테이지 ledger 진행 현황 / 초기화"""
+    ledger = get_ledger()
+
+    if args.reset:
+        stage = None if args.reset == "all" else args.reset
+        count = ledger.reset(stage, args.unit, force=True)
+        reset_intermediates(stage, args.unit)
+        print(f"[OK] {count}개 작업을 다시 실행하도록 표시")
+        return
+
+    print("\n📒 스테이지 진행 현황")
+    print("=" * 50)
+
+    scene_units = [s.lower() for s in PROJECT.all_scenes()]
+    section_units = get_sections()
+    units_by_stage = {
+        "tts": section_units,
+        "whisper": section_units,
+        "timing": scene_units,
+        "render": scene_units,
+        "composite": scene_units,
+        "section-merge": section_units,
+        "final": ["final"],
+    }
+    for stage in STAGES:
+        print(f"  {ledger.progress_line(stage, units_by_stage[stage])}")
+
+    failed = [e for e in ledger.entries() if e["status"] != "done"]
+    if failed:
+        print("\n미완료 작업:")
+        for e in failed:
+            error = f" - {e['error'][:80]}" if e["error"] else ""
+            print(f"  [{e['status']}] {e['stage']}/{e['unit']}{error}")
+
+
+def changes_to_targets(paths) -> Dict[str, Any]:
+    """변경된 파일 → 다시 실행할 단계와 영향받는 씬/섹션"""
+    targets = {"merge": False, "timing": False, "sync_assets": False, "root": False,
+               "scenes": set(), "sections": set()}
+    source_files, asset_names = set(), set()
+
+    for path in paths:
+        name, parent = path.name, path.parent
+        if parent == SCRIPTS_DIR:
+            if name.startswith("scenes_") and name != "scenes_minimal.json":
+                targets["merge"] = True
+            elif re.fullmatch(r"s\d+\.json", name):
+                # 자막(subtitle_display) 변경 → 타이밍 재생성
+                targets["scenes"].add(path.stem)
+                targets["timing"] = True
+        elif parent == AUDIO_DIR:
+            match = re.fullmatch(r"(s\d+)_timed\.json", name)
+            if match:
+                targets["scenes"].add(match.group(1))
+                targets["root"] = True
+                continue
+            match = re.fullmatch(r"(.+?)(?:_whisper\.json|\.mp3)", name)
+            if match and match.group(1) in PROJECT.sections():
+                targets["timing"] = True
+                targets["root"] = True
+                targets["sections"].add(match.group(1))
+                targets["scenes"].update(PROJECT.section_scenes(match.group(1)))
+        elif parent == REMOTION_SCENES_DIR and re.fullmatch(r"S\d+\.tsx", name):
+            targets["scenes"].add(path.stem.lower())
+            targets["root"] = True
+        elif REMOTION_DIR / "src" in path.parents:
+            source_files.add(path.resolve())
+        elif ASSETS_DIR in path.parents:
+            targets["sync_assets"] = True
+            asset_names.add(path.stem)
+
+    # 공용 컴포넌트/lib/에셋 → 그것을 쓰는 씬
+    if source_files or asset_names:
+        for scene_id in PROJECT.all_scenes():
+            deps = tsx_dependencies(REMOTION_SCENES_DIR / f"{scene_id.upper()}.tsx", REMOTION_DIR / "public")
+            if source_files & set(deps) or asset_names & {d.stem for d in deps if d.suffix != ".tsx"}:
+                targets["scenes"].add(scene_id)
+            elif asset_names and asset_names & set(scene_assets(PROJECT.scene(scene_id) or {})):
+                targets["scenes"].add(scene_id)
+    return targets
+
+
+def rebuild_targets(targets: Dict[str, Any], args) -> bool:
+    """changes_to_targets 결과를 final까지 재빌드"""
+    if targets["merge"]:
+        cmd_merge_scenes(argparse.Namespace(renumber=False))
+        report = load_json(MERGE_REPORT_FILE) or {}
+        targets["scenes"].update(report.get("added", []) + report.get("modified", []))
+        targets["sections"].update(report.get("affected_sections", []))
+        targets["timing"] = targets["root"] = True
+    if targets["timing"]:
+        cmd_srt_timing(None)
+    if targets["sync_assets"]:
+        cmd_sync_assets(None)
+    if targets["root"]:
+        cmd_update_root(None)
+
+    all_scenes = PROJECT.all_scenes()
+    scene_ids = [s for s in all_scenes if s in targets["scenes"]]
+    sections = set(targets["sections"]) | {PROJECT.section_of(s) for s in scene_ids}
+    sections = [sec for sec in get_sections() if sec in sections]
+    if not scene_ids and not sections:
+        print("[INFO] 영향받는 씬 없음")
+        return True
+
+    print(f"\n[WATCH] 씬 {len(scene_ids)}개, 섹션 {len(sections)}개 재빌드: {', '.join(scene_ids) or '-'}")
+    ok = True
+    for scene_id in scene_ids:
+        ok = render_scene(scene_id, args.concurrency, args.transparent) and ok
+        if args.transparent:
+            ok = composite_scene(scene_id) and ok
+    if args.until == "render" or not ok:
+        return ok
+
+    for section in sections:
+        ok = merge_section(section) and ok
+    if args.until == "section" or not ok:
+        return ok
+
+    cmd_final(argparse.Namespace(bgm_volume=args.bgm_volume, section_gap=args.section_gap,
+                                  new_bgm=False, no_preflight=True))
+    return ok
+
+
+def cmd_watch(args):
+    """변경 감지 → 영향받는 씬/섹션만 재빌드 → final 갱신"""
+    roots = [REMOTION_SCENES_DIR, REMOTION_DIR / "src" / "lib", REMOTION_DIR / "src" / "components",
+             SCRIPTS_DIR, AUDIO_DIR, ASSETS_DIR]
+    # 파이프라인이 만드는 파일은 변경으로 보지 않음
+    ignore = ["*.srt", "*.wcol", "scenes.json", "scenes_minimal.json", "bg_prompts.json",
+              "merge_manifest.json", "merge_report.json", "Root.tsx"]
+    watcher = Watcher(roots, interval=args.interval, debounce=args.debounce, ignore=ignore)
+
+    print(f"\n👀 변경 감지 중... (Ctrl+C 종료, debounce {args.debounce}s)")
+    for root in roots:
+        print(f"  - {root.relative_to(BASE_DIR)}")
+
+    try:
+        while True:
+            # wait()가 반환하는 시점의 상태가 기준 (재빌드 시작 시점 스냅샷)
+            changed = watcher.wait()
+            started = time.monotonic()
+            WRITTEN_PATHS.clear()
+            # 외부에서 바뀐 문서 (타이밍 등) → 캐시한 문서/타임라인 무효화
+            PROJECT.invalidate()
+            print(f"\n[WATCH] {len(changed)}개 파일 변경:")
+            for path in sorted(changed)[:10]:
+                print(f"  - {path.relative_to(BASE_DIR)}")
+
+            try:
+                ok = rebuild_targets(changes_to_targets(changed), args)
+            except Exception as e:
+                ok = False
+                print(f"[ERROR] 재빌드 실패: {type(e).__name__}: {e}")
+            # 재빌드가 쓴 파일(s#.json, 타이밍)만 기준에 반영 - 재빌드 중 사용자가 고친 파일은 다음 차례에 재빌드
+            watcher.rebase(WRITTEN_PATHS)
+
+            status = "완료" if ok else "실패 (파일 수정 후 다시 저장하면 재시도)"
+            print(f"[WATCH] 재빌드 {status} ({time.monotonic() - started:.1f}s)")
+            if args.once:
+                return
+    except KeyboardInterrupt:
+        print("\n[WATCH] 종료")
+
+
+def cmd_plan(args):
+    """빌드 계획 (dry-run) - 다시 만들어야 하는 씬/섹션/최종 영상과 예상 소요 시간"""
+    if PROJECT.scenes_doc() is None:
+        print("[ERROR] scenes.json not found")
+        return
+
+    # dry-run: digest 메모, 손상된 캐시 object 삭제, 무결성 인덱스 기록 등 아무것도 쓰지 않음
+    with get_cache().dry_run():
+        plan = make_plan(args)
+
+    if args.json:
+        print(json.dumps(plan.to_dict(), ensure_ascii=False, indent=2))
+        return
+
+    mode = "투명 + composite" if args.transparent else "배경 포함"
+    print(f"\n📝 빌드 계획 ({mode}, concurrency {args.concurrency})")
+    print("=" * 50)
+    print_plan(plan, show_skipped=args.all)
+
+
+def make_plan(args) -> BuildPlan:
+    """씬/섹션/최종 영상별 skip / restore / build 판단 (stage_state 기준)"""
+    timeline = get_timeline(args.section_gap)
+    all_sections = get_sections()
+    sections = [args.section] if args.section else all_sections
+
+    # 현재 프레임 수 (과거 기록 → 프레임당 비용 환산용)
+    frames_of = {("final", "final"): timeline.total_frames}
+    for sec in timeline.sections:
+        frames_of[("section-merge", sec)] = timeline.section_length(sec)
+    for scene_id in timeline.scene_ids:
+        frames_of[("render", scene_id)] = frames_of[("composite", scene_id)] = timeline.duration_frames(scene_id)
+
+    plan = BuildPlan(CostModel(get_ledger().entries(), frames_of, render_parallelism=args.concurrency))
+
+    for section in sections:
+        section_dirty = False
+        for scene_id in get_scenes_for_section(section):
+            unit = scene_id.lower()
+            frames = frames_of.get(("render", unit), 0)
+            output_path = render_output(unit, args.transparent)
+            fingerprint = render_key(unit, unit.upper(), RENDER_ENCODER_ARGS[args.transparent])
+            if args.transparent and raw_render_consumed(output_path, fingerprint):
+                action, reason = ACTION_SKIP, "합성 완료"
+            else:
+                action, reason = stage_state("render", unit, output_path, fingerprint)
+            dirty = plan.add("render", unit, action, frames, reason) != ACTION_SKIP
+
+            if args.transparent:
+                if dirty:
+                    action, reason = ACTION_BUILD, "렌더 변경"
+                else:
+                    action, reason = stage_state("composite", unit, COMPOSITE_DIR / f"{unit}.mp4", composite_key(unit))
+                dirty = plan.add("composite", unit, action, frames, reason) != ACTION_SKIP
+            section_dirty = section_dirty or dirty
+
+        # 씬이 다시 만들어지면 섹션 입력이 바뀌므로 key 비교 없이 build
+        if section_dirty:
+            action, reason = ACTION_BUILD, "씬 변경"
+        else:
+            action, reason = stage_state(
+                "section-merge", section, SECTIONS_DIR / f"section_{section}.mp4",
+                section_key(section, get_scenes_for_section(section))
+            )
+        plan.add("section-merge", section, action, frames_of.get(("section-merge", section), 0), reason)
+
+    if not args.section:
+        bgm_name = load_state().get("bgm")
+        bgm_path = BGM_DIR / bgm_name if bgm_name and (BGM_DIR / bgm_name).exists() else None
+        if any(plan.action_of("section-merge", sec) != ACTION_SKIP for sec in all_sections):
+            action, reason = ACTION_BUILD, "섹션 변경"
+        elif bgm_path is None and any(BGM_DIR.glob("*.mp3")):
+            action, reason = ACTION_BUILD, "BGM 미선택"
+        else:
+            action, reason = stage_state(
+                "final", "final", OUTPUT_DIR / "final_video.mp4",
+                final_key(all_sections, bgm_path, args.bgm_volume, timeline.section_gap_frames)
+            )
+        plan.add("final", "final", action, timeline.total_frames, reason)
+    return plan
+
+
+def cmd_preflight(args):
+    """사전 검증 (씬 문서, 타이밍, 에셋, 배경, 디스크)"""
+    print(f"\n[PREFLIGHT] {args.stage} 사전 검증")
+    print("=" * 50)
+
+    if args.scene:
+        scene_ids = [args.scene]
+    elif args.section:
+        scene_ids = get_scenes_for_section(args.section)
+    else:
+        scene_ids = None
+    sections = [args.section] if args.section else None
+
+    if not run_preflight(args.stage, scene_ids, sections):
+        sys.exit(1)
+
+
+def cmd_store(args):
+    """SQLite 프로젝트 저장소 (import / export / query)"""
+    action = args.action
+
+    if action == "import":
+        print("\n🗄️ JSON → project.db")
+        try:
+            with ProjectStore(STORE_FILE) as store:
+                counts = store.import_json(SCRIPTS_DIR, AUDIO_DIR)
+        except FileNotFoundError:
+            print("[ERROR] scenes.json not found. Run merge-scenes first.")
+            return
+        for table, count in counts.items():
+            print(f"  [OK] {table}: {count}")
+        print(f"\n[OK] {STORE_FILE}")
+        return
+
+    if not STORE_FILE.exists():
+        print(f"[ERROR] {STORE_FILE.name} 없음. 먼저 'store import' 실행")
+        return
+
+    with ProjectStore(STORE_FILE) as store:
+        if action == "export":
+            print("\n🗄️ project.db → JSON")
+            written = store.export_json(
+                SCRIPTS_DIR, AUDIO_DIR, lambda path, data: save_json(path, data, silent=True)
+            )
+            print(f"[OK] {written}개 파일 저장")
+        elif args.section:
+            print("\n".join(store.scenes_in_section(args.section)))
+        elif args.asset:
+            print("\n".join(store.scenes_using_asset(args.asset)))
+        elif args.bg:
+            print("\n".join(store.scenes_with_bg(args.bg)))
+        else:
+            for table, count in store.counts().items():
+                print(f"  {table}: {count}")
+
+
 def cmd_status(args):
-    """프로젝트 상태 확인"""
+    """프로젝트 상태 확인 (씬 × 스테이지 산출물 매트릭스)"""
     state = load_state()
+    scanner = StatusScanner({
+        "scripts": SCRIPTS_DIR,
+        "audio": AUDIO_DIR,
+        "scenes": REMOTION_SCENES_DIR,
+        "renders": RENDERS_DIR,
+        "composite": COMPOSITE_DIR,
+        "sections": SECTIONS_DIR,
+        "output": OUTPUT_DIR,
+    })
+    report = build_report(scanner, PROJECT, section=args.section,
+                          raw_consumed=lambda scene_id: raw_render_consumed(RENDERS_DIR / f"{scene_id}_raw.webm"))
+
+    if args.json:
+        report["state"] = {k: state.get(k) for k in ("category", "topic", "phase", "updated_at")}
+        print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
 
     print("\n📊 프로젝트 상태")
     print("=" * 50)
@@ -1271,18 +2481,22 @@ def cmd_status(args):
     # 파일 존재 확인
     print("\n📁 파일 상태:")
 
-    checks = [
-        ("reading_script.json", SCRIPTS_DIR / "reading_script.json"),
-        ("scenes.json", SCRIPTS_DIR / "scenes.json"),
-        ("hook.mp3", AUDIO_DIR / "hook.mp3"),
-        ("S1.tsx", REMOTION_SCENES_DIR / "S1.tsx"),
-        ("final_video.mp4", OUTPUT_DIR / "final_video.mp4"),
-    ]
+    scripts = scanner.scan("scripts")
+    audio = scanner.scan("audio")
+    checks = [("reading_script.json", "reading_script.json" in scripts),
+              ("scenes.json", "scenes.json" in scripts)]
+    checks += [(f"{sec}.mp3", f"{sec}.mp3" in audio) for sec in PROJECT.sections()]
 
-    for name, path in checks:
-        status = "[OK]" if path.exists() else "[ERROR]"
+    for name, exists in checks:
+        status = "[OK]" if exists else "[ERROR]"
         print(f"  {status} {name}")
 
+    if not report["scenes"]:
+        return
+
+    print(f"\n🎞️ 씬별 산출물 ({len(report['scenes'])}개 씬):")
+    print_matrix(report, problems_only=args.problems)
+
 
 def cmd_clean(args):
     """output 폴더만 초기화 (에셋 유지)"""
@@ -1290,6 +2504,15 @@ def cmd_clean(args):
 
     print("\n🧹 output 폴더 초기화")
 
+    # 렌더/TTS 등 비싼 출력은 빌드 캐시에 남김 → 같은 입력이면 다음 실행에서 복원
+    reset_stages = None if not args.phase or args.phase <= 3 else ["render", "composite"]
+    if args.purge_cache:
+        purge_cache()
+    else:
+        preserved = preserve_outputs(reset_stages)
+        if preserved:
+            print(f"  [CACHE] {preserved}개 출력을 빌드 캐시에 보관")
+
     if args.phase:
         print(f"Phase {args.phase} 이후만 삭제")
         phase_dirs = {
@@ -1330,12 +2553,114 @@ def cmd_clean(args):
             f.unlink()
             print(f"  🗑️ transitions/{f.name}")
 
+    # 작업 기록 초기화 (캐시 key는 남아 있으므로 복원 가능)
+    ledger = get_ledger()
+    for stage in reset_stages or [None]:
+        ledger.reset(stage)
+        reset_intermediates(stage)
+
     # 디렉토리 재생성
     ensure_dirs()
 
+    if not args.purge_cache:
+        print(f"\n  빌드 캐시 유지: {format_size(get_cache().usage())} (삭제: clean --purge-cache 또는 gc)")
     print("\n[OK] output 초기화 완료!")
 
 
+def purge_cache():
+    """빌드 캐시 전체 삭제 (--purge-cache)"""
+    import shutil
+
+    if getattr(_connections, "cache", None) is not None:
+        _connections.cache.close()
+        _connections.cache = None
+    if CACHE_DIR.exists():
+        shutil.rmtree(CACHE_DIR)
+        print(f"  🗑️ {CACHE_DIR.name}/ (빌드 캐시)")
+
+
+def cmd_gc(args):
+    """빌드 캐시 정리 (LRU + 기간, 현재 프로젝트 출력은 보호)"""
+    cache = get_cache()
+    max_bytes = parse_size(args.max_bytes) if args.max_bytes else cache.max_bytes
+    before = cache.usage()
+
+    print(f"\n🧹 빌드 캐시 정리 ({CACHE_DIR})")
+    print(f"  현재: {format_size(before)} / 예산 {format_size(max_bytes) if max_bytes else '제한 없음'}")
+    if args.max_age_days is not None:
+        print(f"  {args.max_age_days:g}일 이상 사용하지 않은 항목 삭제")
+
+    result = cache.gc(live_cache_keys(), max_bytes=max_bytes, max_age_days=args.max_age_days,
+                      dry_run=args.dry_run)
+
+    prefix = "[DRY-RUN] " if args.dry_run else ""
+    print(f"\n{prefix}삭제: {result['removed']}개 ({format_size(result['removed_bytes'])}), "
+          f"디스크 해제: {format_size(result['freed_bytes'])}")
+    print(f"유지: {result['kept']}개 ({format_size(result['kept_bytes'])}), 보호(현재 프로젝트): {result['pinned']}개")
+    if result["removed_bytes"] > result["freed_bytes"]:
+        print("  [INFO] 일부 항목은 output 파일과 하드링크를 공유하므로 해당 출력이 지워질 때 해제됩니다")
+
+
+def cmd_tune_render(args):
+    """대표 씬 샘플 렌더로 머신별 최적 concurrency / 동시 렌더 수 측정 → 프로필 저장"""
+    if PROJECT.scenes_doc() is None:
+        print("[ERROR] scenes.json not found")
+        return
+
+    timeline = get_timeline()
+    if args.scenes:
+        scene_ids = [s.strip() for s in args.scenes.split(",") if s.strip()]
+    else:
+        # 예상 비용 최소/중간/최대 씬 (가벼운 씬과 무거운 씬을 모두 포함)
+        costs = estimate_render_costs(PROJECT.all_scenes())
+        ranked = longest_first(costs)
+        picks = [ranked[round(i * (len(ranked) - 1) / max(1, args.samples - 1))] for i in range(args.samples)]
+        scene_ids = list(dict.fromkeys(picks))
+    samples = []
+    for scene_id in scene_ids:
+        unit = scene_id.lower()
+        if unit not in timeline:
+            print(f"[WARN] {scene_id} 타이밍 없음, 제외")
+            continue
+        samples.append((unit.upper(), min(args.frames, timeline.duration_frames(unit))))
+    if not samples:
+        print("[ERROR] 샘플로 쓸 씬이 없습니다 (srt-timing 먼저 실행)")
+        return
+
+    cpus = os.cpu_count() or 1
+    def parse_levels(text: Optional[str]) -> Optional[List[int]]:
+        return [int(v) for v in text.split(",")] if text else None
+
+    settings = candidate_settings(cpus, parse_levels(args.levels), parse_levels(args.jobs_levels))
+    encoder_args = RENDER_ENCODER_ARGS[args.transparent]
+    suffix = ".webm" if args.transparent else ".mp4"
+    serve_url = remotion_serve_url()   # 번들은 측정 전에 한 번만 생성
+
+    def build_cmd(comp: str, output: Path, frames: int, concurrency: int) -> str:
+        return (f'npx remotion render "{serve_url}" {comp} --output "{output.with_suffix(suffix)}" '
+                f'--frames=0-{frames - 1} {encoder_args} --concurrency {concurrency}')
+
+    print(f"\n⏱️ 렌더 튜닝 ({cpus}코어, 설정 {len(settings)}개)")
+    print(f"  샘플: {', '.join(f'{comp} {frames}프레임' for comp, frames in samples)}")
+    print(f"  {'jobs':>4} {'conc':>4} {'fps':>8} {'메모리':>10} {'시간':>7}")
+
+    def on_result(result: Dict):
+        status = "" if result["ok"] else f"  [ERROR] {result['error']}"
+        print(f"  {result['jobs']:>4} {result['concurrency']:>4} {result['fps']:>8.1f} "
+              f"{format_size(result['peak_mem']):>10} {result['seconds']:>6.1f}s{status}")
+
+    tuner = RenderTuner(build_cmd, cwd=REMOTION_DIR, mem_reserve=GOVERNOR.mem_reserve)
+    result = tuner.tune(samples, settings, on_result)
+    if result["concurrency"] is None:
+        print("\n[ERROR] 성공한 설정이 없습니다 (프로필을 저장하지 않음)")
+        return
+
+    save_profile(RENDER_PROFILE_FILE, result, samples)
+    print(f"\n[OK] 최적: 동시 렌더 {result['jobs']}, concurrency {result['concurrency']} "
+          f"({result['fps']:.1f} fps, 메모리 {format_size(result['peak_mem'])})")
+    print(f"  프로필 저장: {RENDER_PROFILE_FILE} (render/build 기본값으로 사용)")
+
+
 def cmd_init(args):
     """프로젝트 완전 초기화 (에셋 포함)"""
     import shutil
@@ -1345,6 +2670,14 @@ def cmd_init(args):
 
     # 1. output 폴더 초기화
     print("\n[1/4] Cleaning output folders...")
+    if args.purge_cache:
+        purge_cache()
+    else:
+        preserved = preserve_outputs()
+        if preserved:
+            print(f"  [CACHE] {preserved} outputs kept in build cache")
+    get_ledger().reset()
+    get_intermediates().forget()
     for d in [SCRIPTS_DIR, AUDIO_DIR, BACKGROUNDS_DIR, VISUAL_DIR, RENDERS_DIR, COMPOSITE_DIR, SECTIONS_DIR, TRANSITIONS_DIR]:
         if d.exists():
             shutil.rmtree(d)
@@ -1390,8 +2723,7 @@ export const RemotionRoot: React.FC = () => {
   );
 };
 '''
-    with open(root_path, 'w', encoding='utf-8') as f:
-        f.write(root_content)
+    atomic_write_text(root_path, root_content)
     print(f"  - Root.tsx reset")
 
     # 3. assets 폴더 내용 삭제
@@ -1450,7 +2782,8 @@ export const RemotionRoot: React.FC = () => {
         "created_at": None,
         "updated_at": None
     }
-    save_json(STATE_FILE, initial_state)
+    with file_lock(STATE_FILE):
+        save_json(STATE_FILE, initial_state)
 
     # 디렉토리 재생성
     ensure_dirs()
@@ -1488,7 +2821,7 @@ def cmd_download_assets(args):
     for scene_file in SCRIPTS_DIR.glob("s*.json"):
         if scene_file.name in ["scenes.json", "scenes_minimal.json"]:
             continue
-        scene_data = load_json(scene_file)
+        scene_data = PROJECT.load(scene_file)
         if scene_data:
             for elem in scene_data.get("elements", []):
                 asset = elem.get("asset")
@@ -1555,6 +2888,7 @@ def main():
 
     # Phase 2: merge-scenes
     p_merge = subparsers.add_parser("merge-scenes", help="씬 파일 병합")
+    p_merge.add_argument("--renumber", action="store_true", help="기존 ID 매핑 무시하고 s1부터 재부여")
     p_merge.set_defaults(func=cmd_merge_scenes)
 
     # Phase 3: audio
@@ -1575,13 +2909,24 @@ def main():
     p_render = subparsers.add_parser("render", help="Remotion 렌더링 (기본: 배경 포함)")
     p_render.add_argument("--section", "-s", help="특정 섹션만")
     p_render.add_argument("--scene", help="특정 씬만")
-    p_render.add_argument("--concurrency", "-c", type=int, default=4, help="동시성 (기본: 4)")
+    p_render.add_argument("--concurrency", "-c", type=int,
+                          help="동시성 (기본: tune-render 프로필 또는 4, --jobs 1일 때)")
+    p_render.add_argument("--jobs", "-j", type=int,
+                          help="동시에 렌더할 씬 수 (기본: tune-render 프로필 또는 1, 2 이상이면 --cores를 씬별 예상 비용 비례로 분배)")
+    p_render.add_argument("--cores", type=int,
+                          help="--jobs 모드 전체 코어 예산 = Remotion 탭 합 (기본: 프로필 jobs × concurrency 또는 CPU 코어 수)")
+    p_render.add_argument("--shards", type=int, default=1,
+                          help="씬을 프레임 구간 N개로 나눠 병렬 렌더 후 연결 (기본: 1, 실패한 구간만 재시도)")
+    p_render.add_argument("--backend", choices=["cli", "server"],
+                          help="cli: 씬마다 npx remotion render / server: 상주 렌더 서버 (기본: PIPELINE_RENDER_BACKEND 또는 cli)")
     p_render.add_argument("--transparent", "-t", action="store_true", help="투명 배경 렌더링 (WebM, FFmpeg 합성 필요)")
+    p_render.add_argument("--no-preflight", action="store_true", help="사전 검증 생략")
     p_render.set_defaults(func=cmd_render)
 
     # Phase 5: composite
     p_composite = subparsers.add_parser("composite", help="배경 합성")
     p_composite.add_argument("--section", "-s", help="특정 섹션만")
+    p_composite.add_argument("--no-preflight", action="store_true", help="사전 검증 생략")
     p_composite.set_defaults(func=cmd_composite)
 
     # Phase 5: section-merge
@@ -1593,22 +2938,105 @@ def main():
     p_final = subparsers.add_parser("final", help="최종 병합")
     p_final.add_argument("--bgm-volume", type=float, default=0.08, help="BGM 볼륨 (기본: 0.08)")
     p_final.add_argument("--section-gap", type=float, default=1.0, help="섹션 간 gap 시간 - 마지막 프레임 유지 (기본: 1초, 0이면 비활성화)")
+    p_final.add_argument("--new-bgm", action="store_true", help="BGM 다시 무작위 선택 (기본: 이전 곡 유지)")
+    p_final.add_argument("--no-preflight", action="store_true", help="사전 검증 생략")
     p_final.set_defaults(func=cmd_final)
 
     # 유틸리티
     p_sync = subparsers.add_parser("sync-assets", help="에셋 동기화 (assets/ → remotion/)")
     p_sync.set_defaults(func=cmd_sync_assets)
 
+    p_ledger = subparsers.add_parser("ledger", help="스테이지별 진행 현황 (재개 지점 확인)")
+    p_ledger.add_argument("--reset", choices=STAGES + ["all"], help="스테이지를 다시 실행하도록 표시")
+    p_ledger.add_argument("--unit", help="--reset 대상 씬/섹션 (생략 시 스테이지 전체)")
+    p_ledger.set_defaults(func=cmd_ledger)
+
+    p_build = subparsers.add_parser("build", aliases=["all"],
+                                    help="render → section-merge → final 의존성 그래프 실행 (섹션별 파이프라이닝)")
+    p_build.add_argument("--section", help="특정 섹션만 (final 제외)")
+    p_build.add_argument("--until", choices=["render", "section", "final"], default="final",
+                         help="어디까지 빌드할지 (기본: final)")
+    p_build.add_argument("--transparent", "-t", action="store_true", help="투명 렌더 + composite")
+    p_build.add_argument("--concurrency", "-c", type=int, help="렌더 동시성 (기본: tune-render 프로필 또는 4)")
+    p_build.add_argument("--jobs", "-j", type=int, default=max(1, (os.cpu_count() or 2) // 2),
+                         help="동시에 실행할 ffmpeg 작업 수 (기본: CPU 코어 수 / 2)")
+    p_build.add_argument("--render-jobs", type=int,
+                         help="동시에 실행할 Remotion 렌더 수 (기본: tune-render 프로필 또는 1, 예상 비용이 큰 씬부터)")
+    p_build.add_argument("--shards", type=int, default=1, help="씬을 프레임 구간 N개로 나눠 병렬 렌더 (기본: 1)")
+    p_build.add_argument("--backend", choices=["cli", "server"],
+                         help="렌더 backend (기본: PIPELINE_RENDER_BACKEND 또는 cli)")
+    p_build.add_argument("--bgm-volume", type=float, default=0.08, help="BGM 볼륨 (기본: 0.08)")
+    p_build.add_argument("--section-gap", type=float, default=1.0, help="섹션 간 gap (기본: 1초)")
+    p_build.add_argument("--new-bgm", action="store_true", help="BGM 다시 선택")
+    p_build.add_argument("--no-preflight", action="store_true", help="사전 검증 건너뛰기")
+    p_build.set_defaults(func=cmd_build)
+
+    p_watch = subparsers.add_parser("watch", help="변경 감지 → 영향받는 씬만 재빌드 → final 갱신")
+    p_watch.add_argument("--until", choices=["render", "section", "final"], default="final",
+                         help="어디까지 재빌드할지 (기본: final)")
+    p_watch.add_argument("--transparent", "-t", action="store_true", help="투명 렌더 + composite")
+    p_watch.add_argument("--concurrency", "-c", type=int, default=4, help="렌더 동시성 (기본: 4)")
+    p_watch.add_argument("--bgm-volume", type=float, default=0.08, help="BGM 볼륨 (기본: 0.08)")
+    p_watch.add_argument("--section-gap", type=float, default=1.0, help="섹션 간 gap (기본: 1초)")
+    p_watch.add_argument("--interval", type=float, default=0.5, help="폴링 간격 초 (기본: 0.5)")
+    p_watch.add_argument("--debounce", type=float, default=1.0, help="마지막 변경 후 대기 초 (기본: 1.0)")
+    p_watch.add_argument("--once", action="store_true", help="변경 한 번 처리 후 종료")
+    p_watch.set_defaults(func=cmd_watch)
+
+    p_plan = subparsers.add_parser("plan", help="빌드 계획 (dry-run, 예상 소요 시간)")
+    p_plan.add_argument("--section", "-s", help="특정 섹션만 (final 제외)")
+    p_plan.add_argument("--transparent", "-t", action="store_true", help="투명 렌더 + composite 기준")
+    p_plan.add_argument("--concurrency", "-c", type=int, default=4, help="렌더 동시성 (CPU 시간 추정용)")
+    p_plan.add_argument("--bgm-volume", type=float, default=0.08, help="final과 같은 값 (기본: 0.08)")
+    p_plan.add_argument("--section-gap", type=float, default=1.0, help="final과 같은 값 (기본: 1초)")
+    p_plan.add_argument("--all", action="store_true", help="최신 상태(skip) 항목도 표시")
+    p_plan.add_argument("--json", action="store_true", help="JSON 출력")
+    p_plan.set_defaults(func=cmd_plan)
+
+    p_preflight = subparsers.add_parser("preflight", help="렌더/합성/최종 병합 전 사전 검증")
+    p_preflight.add_argument("stage", nargs="?", default="all", choices=["render", "composite", "final", "all"],
+                             help="검증할 단계 (기본: all)")
+    p_preflight.add_argument("--section", "-s", help="특정 섹션만")
+    p_preflight.add_argument("--scene", help="특정 씬만")
+    p_preflight.set_defaults(func=cmd_preflight)
+
+    p_store = subparsers.add_parser("store", help="SQLite 프로젝트 저장소 (import/export/query)")
+    p_store.add_argument("action", choices=["import", "export", "query"], help="작업")
+    p_store.add_argument("--section", "-s", help="query: 섹션의 씬 목록")
+    p_store.add_argument("--asset", help="query: 에셋을 사용하는 씬 목록")
+    p_store.add_argument("--bg", help="query: 배경 ID를 사용하는 씬 목록")
+    p_store.set_defaults(func=cmd_store)
+
     p_status = subparsers.add_parser("status", help="프로젝트 상태")
+    p_status.add_argument("--section", "-s", help="특정 섹션만")
+    p_status.add_argument("--problems", action="store_true", help="없거나 오래된 산출물이 있는 씬만 표시")
+    p_status.add_argument("--json", action="store_true", help="JSON 출력 (대시보드용)")
     p_status.set_defaults(func=cmd_status)
 
     p_clean = subparsers.add_parser("clean", help="output 폴더 초기화 (에셋 유지)")
     p_clean.add_argument("--phase", type=int, help="특정 Phase 이후만")
+    p_clean.add_argument("--purge-cache", action="store_true", help="빌드 캐시도 삭제 (기본: 유지)")
     p_clean.set_defaults(func=cmd_clean)
 
     p_init = subparsers.add_parser("init", help="프로젝트 완전 초기화 (에셋 포함)")
+    p_init.add_argument("--purge-cache", action="store_true", help="빌드 캐시도 삭제 (기본: 유지)")
     p_init.set_defaults(func=cmd_init)
 
+    p_gc = subparsers.add_parser("gc", help="빌드 캐시 정리 (LRU, 현재 프로젝트 출력 보호)")
+    p_gc.add_argument("--max-bytes", help="캐시 예산 (예: 5G, 기본: PIPELINE_CACHE_MAX_BYTES 또는 20G)")
+    p_gc.add_argument("--max-age-days", type=float, help="이 기간 동안 사용하지 않은 항목 삭제")
+    p_gc.add_argument("--dry-run", action="store_true", help="삭제하지 않고 결과만 표시")
+    p_gc.set_defaults(func=cmd_gc)
+
+    p_tune = subparsers.add_parser("tune-render", help="샘플 렌더로 이 머신의 최적 concurrency / 동시 렌더 수 측정")
+    p_tune.add_argument("--scenes", help="샘플 씬 (쉼표 구분, 기본: 예상 비용 최소/중간/최대 씬)")
+    p_tune.add_argument("--samples", type=int, default=3, help="자동 선택할 샘플 씬 수 (기본: 3)")
+    p_tune.add_argument("--frames", type=int, default=60, help="씬당 렌더할 앞부분 프레임 수 (기본: 60)")
+    p_tune.add_argument("--levels", help="concurrency 후보 (예: 2,4,8,16, 기본: 1,2,4,... 코어 수)")
+    p_tune.add_argument("--jobs-levels", help="동시 렌더 수 후보 (예: 1,2, 기본: 1,2,4)")
+    p_tune.add_argument("--transparent", "-t", action="store_true", help="투명 렌더(VP9) 기준으로 측정")
+    p_tune.set_defaults(func=cmd_tune_render)
+
     # asset-catalog 명령어는 asset-checker 스킬로 대체됨
     # p_catalog = subparsers.add_parser("asset-catalog", help="에셋 카탈로그 생성")
     # p_catalog.set_defaults(func=cmd_asset_catalog)
@@ -0,0 +1,312 @@
+#!/usr/bin/env python3
+"""
+Preflight - 렌더/합성/최종 병합 전 사전 검증
+
+s{n}.json 누락, 에셋/배경 누락, duration 없는 타이밍 파일, 겹치는 자막 시간 등은
+기존에는 render/composite/final이 몇 분 진행된 뒤에야 드러났습니다.
+preflight는 모든 씬 문서, 타이밍, 에셋, 배경, 디스크 여유 공간을 스레드 풀에서
+동시에 검사하고 문제가 있으면 비싼 단계를 시작하기 전에 중단합니다.
+
+검사 항목 (stage별):
+    render      씬 문서, 타이밍, 씬 컴포넌트(.tsx)와 staticFile() 참조, elements 에셋, npx, 디스크
+    composite   씬 문서, 타이밍, 투명 렌더(_raw.webm), 배경 bg_{scene}.png, ffmpeg, 디스크
+    final       섹션 영상(section_*.mp4), ffmpeg, 디스크
+    all         위 항목 중 산출물(렌더/섹션 영상)을 제외한 전부
+
+사용법:
+    preflight = Preflight(PROJECT, remotion_dir=REMOTION_DIR, ...)
+    result = preflight.run("render", scene_ids)
+    if not result["valid"]:
+        ...  # result["errors"], result["warnings"]
+"""
+
+import os
+import re
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from project_index import ProjectIndex
+
+
+STAGES = ["render", "composite", "final", "all"]
+
+# 씬 1개당 예상 디스크 사용량 (MB) - 1080p 30fps 씬 평균 기준 여유 있게
+DISK_MB_PER_SCENE = {"render": 60, "composite": 60, "all": 120}
+
+ASSET_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp", ".svg", ".gif"}
+STATIC_FILE_RE = re.compile(r"""staticFile\(\s*["'`]([^"'`$]+)["'`]\s*\)""")
+
+# 같은 시각으로 반올림된 자막 경계는 겹침으로 보지 않음
+OVERLAP_TOLERANCE = 0.005
+
+
+def _scan_files(root: Path) -> Set[str]:
+    """root 아래 모든 파일의 상대 경로 (os.scandir 재귀 - glob보다 훨씬 빠름)"""
+    found: Set[str] = set()
+    stack = [(Path(root), "")]
+    while stack:
+        directory, prefix = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    rel = f"{prefix}{entry.name}"
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append((Path(entry.path), rel + "/"))
+                    else:
+                        found.add(rel)
+        except OSError:
+            continue
+    return found
+
+
+def timed_duration(data: Dict) -> Optional[float]:
+    """타이밍 파일의 duration (srt-timing 형식 / scene-splitter 형식 모두 지원)"""
+    duration = data.get("duration")
+    if duration is None:
+        duration = (data.get("timing") or {}).get("duration")
+    return duration
+
+
+def timed_segments(data: Dict) -> List[Dict]:
+    """자막 구간 목록 (subtitle_segments 또는 captions)"""
+    return data.get("subtitle_segments") or data.get("captions") or []
+
+
+def scene_assets(scene: Dict) -> List[str]:
+    """씬이 참조하는 에셋 ID (elements + required_elements)"""
+    assets = []
+    for key in ("elements", "required_elements"):
+        for elem in scene.get(key) or []:
+            asset = elem.get("asset") if isinstance(elem, dict) else None
+            if asset and asset not in assets:
+                assets.append(asset)
+    return assets
+
+
+class Preflight:
+    """스테이지 실행 전 검증기"""
+
+    def __init__(self, index: ProjectIndex, remotion_dir: Path, backgrounds_dir: Path,
+                 renders_dir: Path, sections_dir: Path, output_dir: Path,
+                 workers: Optional[int] = None,
+                 raw_available: Optional[Callable[[str], bool]] = None,
+                 pending: Optional[Set[str]] = None, disk_dir: Optional[Path] = None):
+        """
+        Args:
+            raw_available: 씬 ID → 투명 렌더 사용 가능 여부 (생략 시 파일 존재 여부).
+                합성 후 정리된 투명 렌더를 빌드 캐시에서 복원할 수 있는 경우를 허용하기 위함.
+            pending: 새로 만들어야 하는 씬 ID (생략 시 대상 씬 전체) - 디스크 필요량 계산용
+            disk_dir: 출력이 쓰일 폴더 (생략 시 output_dir) - 이 파일시스템의 여유 공간을 검사
+        """
+        self.index = index
+        self.remotion_dir = Path(remotion_dir)
+        self.scenes_dir = self.remotion_dir / "src" / "scenes"
+        self.public_dir = self.remotion_dir / "public"
+        self.assets_dir = self.public_dir / "assets"
+        self.backgrounds_dir = Path(backgrounds_dir)
+        self.renders_dir = Path(renders_dir)
+        self.sections_dir = Path(sections_dir)
+        self.output_dir = Path(output_dir)
+        self.pending = pending
+        self.disk_dir = Path(disk_dir) if disk_dir else self.output_dir
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        self.raw_available = raw_available or (lambda scene_id: (self.renders_dir / f"{scene_id}_raw.webm").exists())
+
+        self._public_files: Set[str] = set()
+        self._asset_ids: Set[str] = set()
+
+    # --------------------------------------------------------
+    # 실행
+    # --------------------------------------------------------
+    def run(self, stage: str, scene_ids: Optional[List[str]] = None,
+            sections: Optional[List[str]] = None) -> Dict:
+        """검증 실행
+
+        Returns:
+            {"valid", "errors", "warnings", "scenes", "elapsed"}
+        """
+        started = time.perf_counter()
+        result = {"valid": True, "errors": [], "warnings": [], "scenes": 0, "elapsed": 0.0}
+
+        if self.index.scenes_doc() is None:
+            result["errors"].append("scenes.json이 없습니다. merge-scenes를 먼저 실행하세요.")
+            result["valid"] = False
+            return result
+
+        if scene_ids is None:
+            scene_ids = self.index.all_scenes()
+        scene_ids = [s.lower() for s in scene_ids]
+        if sections is None:
+            sections = self.index.sections()
+        result["scenes"] = len(scene_ids)
+
+        if stage in ("render", "all"):
+            self._public_files = _scan_files(self.public_dir)
+            self._asset_ids = {
+                Path(rel).stem for rel in self._public_files
+                if rel.startswith("assets/") and Path(rel).suffix.lower() in ASSET_EXTENSIONS
+            }
+
+        if stage == "final":
+            jobs = [(self._check_section, section) for section in sections]
+        else:
+            jobs = [(self._check_scene, scene_id) for scene_id in scene_ids]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            futures = [pool.submit(check, stage, unit) for check, unit in jobs]
+            # 제출 순서대로 수집 → 출력 순서가 씬 순서와 같음
+            for future in futures:
+                errors, warnings = future.result()
+                result["errors"].extend(errors)
+                result["warnings"].extend(warnings)
+
+        errors, warnings = self._check_environment(stage, scene_ids, sections)
+        result["errors"].extend(errors)
+        result["warnings"].extend(warnings)
+
+        result["valid"] = not result["errors"]
+        result["elapsed"] = time.perf_counter() - started
+        return result
+
+    # --------------------------------------------------------
+    # 씬 단위 검사
+    # --------------------------------------------------------
+    def _check_scene(self, stage: str, scene_id: str) -> Tuple[List[str], List[str]]:
+        errors: List[str] = []
+        warnings: List[str] = []
+
+        try:
+            scene = self.index.scene(scene_id)
+        except ValueError as e:
+            return [f"{scene_id}.json 파싱 실패: {e}"], []
+        if scene is None:
+            return [f"{scene_id}.json 파일이 없습니다."], []
+        if not scene.get("subtitle_display"):
+            warnings.append(f"{scene_id}: subtitle_display 없음")
+
+        errors.extend(self._check_timing(scene_id))
+
+        if stage in ("render", "all"):
+            for asset in scene_assets(scene):
+                if asset not in self._asset_ids:
+                    errors.append(f"{scene_id}: 에셋 '{asset}'이 remotion/public/assets에 없습니다.")
+            errors.extend(self._check_composition(scene_id))
+
+        if stage == "composite":
+            if not self.raw_available(scene_id):
+                errors.append(f"{scene_id}: 투명 렌더 {scene_id}_raw.webm 없음 (render --transparent 필요)")
+            if not (self.backgrounds_dir / f"bg_{scene_id}.png").exists():
+                errors.append(f"{scene_id}: 배경 bg_{scene_id}.png 없음")
+
+        return errors, warnings
+
+    def _check_timing(self, scene_id: str) -> List[str]:
+        try:
+            timed = self.index.timed(scene_id)
+        except ValueError as e:
+            return [f"{scene_id}_timed.json 파싱 실패: {e}"]
+        if timed is None:
+            return [f"{scene_id}_timed.json 파일이 없습니다. srt-timing을 먼저 실행하세요."]
+
+        errors = []
+        duration = timed_duration(timed)
+        if not isinstance(duration, (int, float)) or duration <= 0:
+            errors.append(f"{scene_id}_timed.json: duration 없음 또는 0 이하 ({duration!r})")
+
+        prev_end = None
+        for seg in timed_segments(timed):
+            start, end = seg.get("start"), seg.get("end")
+            if not isinstance(start, (int, float)) or not isinstance(end, (int, float)):
+                errors.append(f"{scene_id}: 자막 {seg.get('index', '?')} 시간 누락")
+                continue
+            if end <= start:
+                errors.append(f"{scene_id}: 자막 {seg.get('index', '?')} end({end}) <= start({start})")
+            if prev_end is not None and start < prev_end - OVERLAP_TOLERANCE:
+                errors.append(f"{scene_id}: 자막 {seg.get('index', '?')} 시작({start})이 이전 자막 끝({prev_end})과 겹침")
+            prev_end = end if prev_end is None else max(prev_end, end)
+        return errors
+
+    def _check_composition(self, scene_id: str) -> List[str]:
+        comp_id = scene_id.upper()
+        tsx_path = self.scenes_dir / f"{comp_id}.tsx"
+        try:
+            source = tsx_path.read_text(encoding="utf-8")
+        except OSError:
+            return [f"{scene_id}: 씬 컴포넌트 {comp_id}.tsx 없음 (scene-coder 필요)"]
+
+        errors = []
+        for ref in STATIC_FILE_RE.findall(source):
+            if ref.lstrip("/") not in self._public_files:
+                errors.append(f"{scene_id}: {comp_id}.tsx가 참조하는 public/{ref.lstrip('/')} 없음")
+        return errors
+
+    # --------------------------------------------------------
+    # 섹션 / 환경 검사
+    # --------------------------------------------------------
+    def _check_section(self, stage: str, section: str) -> Tuple[List[str], List[str]]:
+        if not (self.sections_dir / f"section_{section}.mp4").exists():
+            return [f"section_{section}.mp4 없음 (section-merge 필요)"], []
+        return [], []
+
+    def _check_environment(self, stage: str, scene_ids: List[str],
+                           sections: Iterable[str]) -> Tuple[List[str], List[str]]:
+        errors: List[str] = []
+        warnings: List[str] = []
+
+        tools = {"render": ["npx"], "composite": ["ffmpeg", "ffprobe"],
+                 "final": ["ffmpeg", "ffprobe"], "all": ["npx", "ffmpeg", "ffprobe"]}[stage]
+        for tool in tools:
+            if shutil.which(tool) is None:
+                errors.append(f"{tool}를 찾을 수 없습니다 (PATH 확인)")
+
+        if stage == "final":
+            # 섹션 영상 연장본 + 최종 영상 ≈ 섹션 합계의 2배
+            needed = 0
+            for section in sections:
+                try:
+                    needed += (self.sections_dir / f"section_{section}.mp4").stat().st_size
+                except OSError:
+                    pass
+            needed *= 2
+        else:
+            # 완료됐거나 캐시에서 복원할 씬은 새로 쓰지 않음
+            count = len(scene_ids) if self.pending is None else len(self.pending.intersection(scene_ids))
+            needed = count * DISK_MB_PER_SCENE[stage] * 1024 * 1024
+
+        # 출력 폴더가 아직 없으면 가장 가까운 상위 폴더 (같은 파일시스템)
+        target = self.disk_dir
+        while not target.exists() and target != target.parent:
+            target = target.parent
+        try:
+            free = shutil.disk_usage(target).free
+        except OSError:
+            return errors, warnings
+
+        if free < needed:
+            errors.append(f"디스크 여유 공간 부족: {free / 1024**3:.1f}GB (예상 필요 {needed / 1024**3:.1f}GB)")
+        elif free < needed * 2:
+            warnings.append(f"디스크 여유 공간이 적습니다: {free / 1024**3:.1f}GB (예상 필요 {needed / 1024**3:.1f}GB)")
+        return errors, warnings
+
+
+def print_report(result: Dict, stage: str, limit: int = 30):
+    """검증 결과 출력 (오류가 많으면 limit개까지만)"""
+    if result["errors"]:
+        print(f"\n❌ 오류 {len(result['errors'])}개:")
+        for err in result["errors"][:limit]:
+            print(f"  - {err}")
+        if len(result["errors"]) > limit:
+            print(f"  ... 외 {len(result['errors']) - limit}개")
+
+    if result["warnings"]:
+        print(f"\n⚠️ 경고 {len(result['warnings'])}개:")
+        for warn in result["warnings"][:limit]:
+            print(f"  - {warn}")
+        if len(result["warnings"]) > limit:
+            print(f"  ... 외 {len(result['warnings']) - limit}개")
+
+    status = "통과" if result["valid"] else "실패"
+    print(f"\n[PREFLIGHT] {stage}: {status} ({result['scenes']}개 씬, {result['elapsed']:.2f}s)")
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Project Index - 프로젝트 JSON 문서 인메모리 캐시
+
+scenes.json, s{n}.json, s{n}_timed.json 등을 한 번만 파싱하고
+파일의 (mtime, size)가 바뀌었을 때만 다시 읽습니다.
+
+사용법:
+    from project_index import ProjectIndex
+
+    index = ProjectIndex(SCRIPTS_DIR, AUDIO_DIR)
+    index.sections()              # ["hook", "background", ...]
+    index.section_scenes("hook")  # ["s1", "s2", ...]
+    index.section_of("s3")        # "hook"
+    index.scene("s3")             # s3.json 내용
+    index.timed("s3")             # s3_timed.json 내용
+
+⚠️ 반환되는 dict/list는 캐시와 공유됩니다. 수정이 필요하면 copy.deepcopy() 후 사용하세요.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from json_io import read_json
+
+
+# (st_mtime_ns, st_size) - 파일 변경 여부 판단용 서명
+FileSignature = Tuple[int, int]
+
+
+def _file_signature(path: Path) -> Optional[FileSignature]:
+    """파일 서명 반환 (없으면 None)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class ProjectIndex:
+    """프로젝트 문서 캐시 + 섹션/씬 인덱스
+
+    - 모든 JSON은 처음 요청될 때 한 번만 파싱
+    - 이후 요청은 stat() 한 번으로 변경 여부만 확인
+    - scenes.json이 바뀌면 section↔scene 매핑을 다시 구성
+    """
+
+    def __init__(self, scripts_dir: Path, audio_dir: Path):
+        self.scripts_dir = Path(scripts_dir)
+        self.audio_dir = Path(audio_dir)
+        self._docs: Dict[Path, Tuple[FileSignature, Any]] = {}
+        self._lock = threading.RLock()
+
+        # scenes.json 기반 인덱스 (scenes.json 서명으로 무효화)
+        self._index_sig: Optional[FileSignature] = None
+        self._sections: List[str] = []
+        self._section_scenes: Dict[str, List[str]] = {}
+        self._scene_section: Dict[str, str] = {}
+        self._all_scenes: List[str] = []
+
+        self.hits = 0
+        self.misses = 0
+        # invalidate()마다 증가 - 문서에서 파생한 값(타임라인 등)을 stat 없이 재사용하기 위한 세대 번호
+        self.generation = 0
+
+    # --------------------------------------------------------
+    # 경로
+    # --------------------------------------------------------
+    @property
+    def scenes_path(self) -> Path:
+        return self.scripts_dir / "scenes.json"
+
+    def scene_path(self, scene_id: str) -> Path:
+        return self.scripts_dir / f"{scene_id}.json"
+
+    def timed_path(self, scene_id: str) -> Path:
+        return self.audio_dir / f"{scene_id}_timed.json"
+
+    # --------------------------------------------------------
+    # 문서 로드 (캐시)
+    # --------------------------------------------------------
+    def load(self, path: Path) -> Optional[Any]:
+        """JSON 문서 로드 - 서명이 같으면 캐시 반환, 파일이 없으면 None
+
+        파싱 오류(ValueError 계열)는 호출자에게 그대로 전달됩니다.
+        """
+        path = Path(path)
+        sig = _file_signature(path)
+
+        with self._lock:
+            if sig is None:
+                self._docs.pop(path, None)
+                return None
+
+            cached = self._docs.get(path)
+            if cached is not None and cached[0] == sig:
+                self.hits += 1
+                return cached[1]
+
+        data = read_json(path)
+
+        with self._lock:
+            self._docs[path] = (sig, data)
+            self.misses += 1
+        return data
+
+    def invalidate(self, path: Optional[Path] = None):
+        """캐시 무효화 (path 생략 시 전체)"""
+        with self._lock:
+            self.generation += 1
+            if path is None:
+                self._docs.clear()
+                self._index_sig = None
+            else:
+                path = Path(path)
+                self._docs.pop(path, None)
+                if path == self.scenes_path:
+                    self._index_sig = None
+
+    def scenes_doc(self) -> Optional[Dict]:
+        """scenes.json 전체"""
+        return self.load(self.scenes_path)
+
+    def scene(self, scene_id: str) -> Optional[Dict]:
+        """s{n}.json"""
+        return self.load(self.scene_path(scene_id))
+
+    def timed(self, scene_id: str) -> Optional[Dict]:
+        """s{n}_timed.json"""
+        return self.load(self.timed_path(scene_id))
+
+    # --------------------------------------------------------
+    # 섹션 ↔ 씬 인덱스
+    # --------------------------------------------------------
+    def _ensure_index(self):
+        """scenes.json이 바뀌었으면 section/scene 매핑 재구성"""
+        data = self.scenes_doc()
+        sig = _file_signature(self.scenes_path) if data is not None else None
+
+        with self._lock:
+            if sig is not None and sig == self._index_sig:
+                return
+
+            self._sections = []
+            self._section_scenes = {}
+            self._scene_section = {}
+            self._all_scenes = []
+            self._index_sig = sig
+
+            if not data:
+                return
+
+            scenes = data.get("scenes", [])
+            self._all_scenes = [s["scene_id"] for s in scenes if "scene_id" in s]
+
+            # 섹션 순서는 scenes 배열 순서를 따름
+            for scene in scenes:
+                section = scene.get("section")
+                if section and section not in self._sections:
+                    self._sections.append(section)
+
+            sections_info = (data.get("meta") or {}).get("sections") or {}
+            for section, info in sections_info.items():
+                # info가 리스트면 직접 사용, 딕셔너리면 "scenes" 키 사용
+                scene_ids = info if isinstance(info, list) else info.get("scenes", [])
+                self._section_scenes[section] = list(scene_ids)
+                for scene_id in scene_ids:
+                    self._scene_section[scene_id] = section
+
+            # meta.sections가 없는 형식 (history_maker merge-scenes) 보완
+            for scene in scenes:
+                scene_id = scene.get("scene_id")
+                section = scene.get("section")
+                if not scene_id or not section or scene_id in self._scene_section:
+                    continue
+                self._section_scenes.setdefault(section, []).append(scene_id)
+                self._scene_section[scene_id] = section
+
+    def has_section_meta(self) -> bool:
+        """scenes.json에 meta.sections 정보가 있는지"""
+        data = self.scenes_doc()
+        return bool(data and (data.get("meta") or {}).get("sections"))
+
+    def sections(self) -> List[str]:
+        """섹션 목록 (scenes 배열 순서)"""
+        self._ensure_index()
+        return list(self._sections)
+
+    def section_scenes(self, section: str) -> List[str]:
+        """특정 섹션의 씬 ID 목록"""
+        self._ensure_index()
+        return list(self._section_scenes.get(section, []))
+
+    def all_scenes(self) -> List[str]:
+        """모든 씬 ID (순서대로)"""
+        self._ensure_index()
+        return list(self._all_scenes)
+
+    def section_of(self, scene_id: str) -> Optional[str]:
+        """씬이 속한 섹션"""
+        self._ensure_index()
+        return self._scene_section.get(scene_id)
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 통계"""
+        with self._lock:
+            return {"documents": len(self._docs), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+"""
+Project Store - SQLite 단일 파일 프로젝트 저장소 (선택 사항)
+
+scenes.json / scenes_minimal.json / bg_prompts.json / s{n}.json / s{n}_timed.json에
+흩어져 있는 데이터를 output/project.db 하나에 저장합니다.
+
+- section, bg_id, asset 인덱스로 "core3 섹션의 씬", "에셋 X를 쓰는 씬" 조회
+- 타이밍 하나 수정 시 해당 행만 갱신 (전체 JSON 재직렬화 없음)
+- export_json()으로 기존 파일 구조를 그대로 재생성 (에이전트 호환)
+
+사용법:
+    python pipeline.py store import               # 파일 → project.db
+    python pipeline.py store export               # project.db → 파일
+    python pipeline.py store query --section core3
+    python pipeline.py store query --asset question_mark
+    python pipeline.py store query --bg bg_palace
+"""
+
+import json
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from json_io import read_json
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key         TEXT PRIMARY KEY,
+    value       TEXT NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sections (
+    section     TEXT PRIMARY KEY,
+    position    INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS scenes (
+    scene_id    TEXT PRIMARY KEY,
+    position    INTEGER NOT NULL,
+    section     TEXT,
+    bg_id       TEXT,
+    doc         TEXT NOT NULL,
+    updated_at  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_scenes_section ON scenes(section, position);
+CREATE INDEX IF NOT EXISTS idx_scenes_bg_id ON scenes(bg_id);
+
+CREATE TABLE IF NOT EXISTS scene_elements (
+    scene_id    TEXT NOT NULL,
+    asset       TEXT NOT NULL,
+    type        TEXT,
+    role        TEXT,
+    required    INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_elements_asset ON scene_elements(asset);
+CREATE INDEX IF NOT EXISTS idx_elements_scene ON scene_elements(scene_id);
+
+CREATE TABLE IF NOT EXISTS timings (
+    scene_id    TEXT PRIMARY KEY,
+    section     TEXT,
+    duration    REAL,
+    doc         TEXT NOT NULL,
+    updated_at  TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_timings_section ON timings(section);
+
+CREATE TABLE IF NOT EXISTS backgrounds (
+    bg_id       TEXT PRIMARY KEY,
+    prompt      TEXT
+);
+"""
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def scene_summary(scene: Dict) -> Dict:
+    """scenes.json용 요약 데이터"""
+    return {
+        "scene_id": scene["scene_id"],
+        "section": scene.get("section"),
+        "narration_preview": scene.get("narration_tts", "")[:30] + "...",
+        "bg_id": scene.get("bg_id")
+    }
+
+
+def scene_minimal(scene: Dict) -> Dict:
+    """scenes_minimal.json용 경량 데이터"""
+    return {
+        "scene_id": scene["scene_id"],
+        "section": scene.get("section"),
+        "subtitle_display": scene.get("subtitle_display", "")
+    }
+
+
+def _timing_duration(timing: Dict) -> Optional[float]:
+    """s{n}_timed.json의 duration (pipeline/auto_scene_splitter 두 형식 지원)"""
+    if "duration" in timing:
+        return timing["duration"]
+    return (timing.get("timing") or {}).get("duration")
+
+
+class ProjectStore:
+    """SQLite 기반 프로젝트 저장소"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --------------------------------------------------------
+    # meta
+    # --------------------------------------------------------
+    def set_meta(self, key: str, value: Any):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta(key, value) VALUES (?, ?)", (key, _dumps(value))
+        )
+
+    def get_meta(self, key: str, default: Any = None) -> Any:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return json.loads(row["value"]) if row else default
+
+    # --------------------------------------------------------
+    # 쓰기 (행 단위)
+    # --------------------------------------------------------
+    def _write_elements(self, scene: Dict):
+        scene_id = scene["scene_id"]
+        self.conn.execute("DELETE FROM scene_elements WHERE scene_id = ?", (scene_id,))
+        rows = []
+        for required, key in ((1, "required_elements"), (0, "elements")):
+            for elem in scene.get(key, []) or []:
+                asset = elem.get("asset") if isinstance(elem, dict) else None
+                if asset:
+                    rows.append((scene_id, asset, elem.get("type"), elem.get("role"), required))
+        if rows:
+            self.conn.executemany(
+                "INSERT INTO scene_elements(scene_id, asset, type, role, required) VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def upsert_timing(self, scene_id: str, timing: Dict):
+        """타이밍 하나만 갱신 (s{n}_timed.json 한 행)"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO timings(scene_id, section, duration, doc, updated_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (scene_id, timing.get("section"), _timing_duration(timing),
+                 _dumps(timing), datetime.now().isoformat())
+            )
+
+    def replace_scenes(self, scenes: List[Dict], scenes_meta: Optional[Dict] = None,
+                       backgrounds: Optional[List[Dict]] = None):
+        """merge-scenes 결과로 씬 전체 교체 (단일 트랜잭션)"""
+        now = datetime.now().isoformat()
+        with self.conn:
+            self.conn.execute("DELETE FROM scenes")
+            self.conn.execute("DELETE FROM scene_elements")
+            self.conn.execute("DELETE FROM sections")
+            self.conn.execute("DELETE FROM backgrounds")
+
+            sections: List[str] = []
+            for position, scene in enumerate(scenes, start=1):
+                self.conn.execute(
+                    "INSERT INTO scenes(scene_id, position, section, bg_id, doc, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (scene["scene_id"], position, scene.get("section"), scene.get("bg_id"),
+                     _dumps(scene), now)
+                )
+                self._write_elements(scene)
+                section = scene.get("section")
+                if section and section not in sections:
+                    sections.append(section)
+
+                bg_id = scene.get("bg_id")
+                if bg_id and scene.get("bg_prompt"):
+                    self.conn.execute(
+                        "INSERT OR IGNORE INTO backgrounds(bg_id, prompt) VALUES (?, ?)",
+                        (bg_id, scene["bg_prompt"])
+                    )
+
+            self.conn.executemany(
+                "INSERT INTO sections(section, position) VALUES (?, ?)",
+                [(s, i) for i, s in enumerate(sections, start=1)]
+            )
+            # 사라진 씬의 타이밍 삭제 (export_json이 없는 씬의 _timed.json을 다시 쓰지 않도록)
+            self.conn.execute("DELETE FROM timings WHERE scene_id NOT IN (SELECT scene_id FROM scenes)")
+            if scenes_meta is not None:
+                self.set_meta("scenes_meta", scenes_meta)
+            if backgrounds is not None:
+                self.set_meta("backgrounds", backgrounds)
+
+    # --------------------------------------------------------
+    # 조회 (인덱스 사용)
+    # --------------------------------------------------------
+    def sections(self) -> List[str]:
+        rows = self.conn.execute("SELECT section FROM sections ORDER BY position").fetchall()
+        return [r["section"] for r in rows]
+
+    def all_scenes(self) -> List[str]:
+        rows = self.conn.execute("SELECT scene_id FROM scenes ORDER BY position").fetchall()
+        return [r["scene_id"] for r in rows]
+
+    def scenes_in_section(self, section: str) -> List[str]:
+        rows = self.conn.execute(
+            "SELECT scene_id FROM scenes WHERE section = ? ORDER BY position", (section,)
+        ).fetchall()
+        return [r["scene_id"] for r in rows]
+
+    def scenes_with_bg(self, bg_id: str) -> List[str]:
+        rows = self.conn.execute(
+            "SELECT scene_id FROM scenes WHERE bg_id = ? ORDER BY position", (bg_id,)
+        ).fetchall()
+        return [r["scene_id"] for r in rows]
+
+    def scenes_using_asset(self, asset: str) -> List[str]:
+        rows = self.conn.execute(
+            "SELECT DISTINCT e.scene_id, s.position FROM scene_elements e "
+            "JOIN scenes s ON s.scene_id = e.scene_id WHERE e.asset = ? ORDER BY s.position",
+            (asset,)
+        ).fetchall()
+        return [r["scene_id"] for r in rows]
+
+    def required_assets(self) -> List[str]:
+        rows = self.conn.execute("SELECT DISTINCT asset FROM scene_elements ORDER BY asset").fetchall()
+        return [r["asset"] for r in rows]
+
+    def get_scene(self, scene_id: str) -> Optional[Dict]:
+        row = self.conn.execute("SELECT doc FROM scenes WHERE scene_id = ?", (scene_id,)).fetchone()
+        return json.loads(row["doc"]) if row else None
+
+    def get_timing(self, scene_id: str) -> Optional[Dict]:
+        row = self.conn.execute("SELECT doc FROM timings WHERE scene_id = ?", (scene_id,)).fetchone()
+        return json.loads(row["doc"]) if row else None
+
+    def iter_scenes(self) -> Iterable[Dict]:
+        for row in self.conn.execute("SELECT doc FROM scenes ORDER BY position"):
+            yield json.loads(row["doc"])
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            table: self.conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            for table in ("sections", "scenes", "scene_elements", "timings", "backgrounds")
+        }
+
+    # --------------------------------------------------------
+    # 파일 ↔ DB
+    # --------------------------------------------------------
+    def import_json(self, scripts_dir: Path, audio_dir: Path) -> Dict[str, int]:
+        """기존 JSON 파일들을 DB로 가져오기"""
+        scripts_dir, audio_dir = Path(scripts_dir), Path(audio_dir)
+        scenes_path = scripts_dir / "scenes.json"
+        if not scenes_path.exists():
+            raise FileNotFoundError(scenes_path)
+
+        scenes_data = read_json(scenes_path)
+
+        scenes = []
+        for summary in scenes_data.get("scenes", []):
+            scene_path = scripts_dir / f"{summary['scene_id']}.json"
+            if scene_path.exists():
+                scenes.append(read_json(scene_path))
+            else:
+                scenes.append(dict(summary))
+
+        self.replace_scenes(scenes, scenes_data.get("meta", {}), scenes_data.get("backgrounds", []))
+
+        # bg_prompts.json에만 있는 배경 프롬프트 보완
+        bg_path = scripts_dir / "bg_prompts.json"
+        if bg_path.exists():
+            bg_data = read_json(bg_path)
+            with self.conn:
+                for bg in bg_data.get("backgrounds", []):
+                    if bg.get("bg_id"):
+                        self.conn.execute(
+                            "INSERT OR IGNORE INTO backgrounds(bg_id, prompt) VALUES (?, ?)",
+                            (bg["bg_id"], bg.get("prompt"))
+                        )
+
+        for scene in scenes:
+            timed_path = audio_dir / f"{scene['scene_id']}_timed.json"
+            if timed_path.exists():
+                self.upsert_timing(scene["scene_id"], read_json(timed_path))
+
+        return self.counts()
+
+    def export_json(self, scripts_dir: Path, audio_dir: Path, save_json) -> int:
+        """DB 내용을 기존 파일 구조로 내보내기
+
+        Args:
+            save_json: (path, data) 저장 함수 - 호출 측의 저장 방식을 그대로 사용
+        Returns:
+            저장한 파일 수
+        """
+        scripts_dir, audio_dir = Path(scripts_dir), Path(audio_dir)
+        scenes = list(self.iter_scenes())
+        written = 0
+
+        section_map: Dict[str, Dict] = {}
+        bg_prompts: Dict[str, Dict] = {}
+        prompts = {
+            r["bg_id"]: r["prompt"]
+            for r in self.conn.execute("SELECT bg_id, prompt FROM backgrounds")
+        }
+
+        for scene in scenes:
+            save_json(scripts_dir / f"{scene['scene_id']}.json", scene)
+            written += 1
+
+            section = scene.get("section")
+            if section:
+                entry = section_map.setdefault(section, {"scenes": [], "count": 0})
+                entry["scenes"].append(scene["scene_id"])
+                entry["count"] += 1
+
+            bg_id = scene.get("bg_id")
+            if bg_id and bg_id in prompts:
+                bg = bg_prompts.setdefault(bg_id, {"bg_id": bg_id, "prompt": prompts[bg_id], "scenes": []})
+                bg["scenes"].append(scene["scene_id"])
+
+        meta = dict(self.get_meta("scenes_meta", {}) or {})
+        meta["total_scenes"] = len(scenes)
+        meta["sections"] = section_map
+
+        save_json(scripts_dir / "scenes.json", {
+            "meta": meta,
+            "scenes": [scene_summary(s) for s in scenes],
+            "backgrounds": self.get_meta("backgrounds", [])
+        })
+        save_json(scripts_dir / "bg_prompts.json", {"backgrounds": list(bg_prompts.values())})
+        save_json(scripts_dir / "scenes_minimal.json", {"scenes": [scene_minimal(s) for s in scenes]})
+        written += 3
+
+        for row in self.conn.execute("SELECT scene_id, doc FROM timings"):
+            save_json(audio_dir / f"{row['scene_id']}_timed.json", json.loads(row["doc"]))
+            written += 1
+
+        return written
@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""
+Remote Cache - 여러 작업 PC / CI가 공유하는 빌드 캐시 백엔드
+
+build_cache의 action key(스테이지 입력 내용 해시)로 출력 파일을 공유 저장소에 올리고,
+다른 머신에서 같은 key가 나오면 렌더/합성/TTS 대신 내려받습니다.
+
+백엔드:
+    DirectoryBackend   공유 폴더 (NFS/SMB 마운트)      PIPELINE_REMOTE_CACHE=/mnt/nfs/video-cache
+    HttpBackend        HTTP GET/PUT/HEAD {base}/{key}  PIPELINE_REMOTE_CACHE=http://cache-host:8765
+
+HTTP 프로토콜:
+    HEAD /{key}   200 있음 / 404 없음
+    GET  /{key}   200 + 파일 내용 (X-Cache-Suffix, X-Cache-Stage, X-Cache-Digest 헤더) / 404
+    PUT  /{key}   요청 본문 = 파일 내용, X-Cache-Suffix / X-Cache-Stage / X-Cache-Digest 헤더 → 201
+                  (Content-Length 없으면 411, 본문 sha256이 X-Cache-Digest와 다르면 400)
+    내려받은 바이트 수가 Content-Length와 다르면 (연결 끊김) 버림 - digest는 build_cache가 확인
+
+로컬 대체 서버 (HTTP 백엔드 테스트/사내 캐시 서버용):
+    python remote_cache.py serve --dir /srv/video-cache --port 8765
+
+환경 변수:
+    PIPELINE_REMOTE_CACHE            백엔드 위치 (없으면 원격 캐시 사용 안 함)
+    PIPELINE_REMOTE_CACHE_READONLY   1이면 내려받기만 (CI 외 PC에서 오염 방지 등)
+    PIPELINE_REMOTE_CACHE_TOKEN      HTTP Authorization: Bearer 토큰
+"""
+
+import argparse
+import hashlib
+import http.client
+import os
+import re
+import shutil
+import sys
+import tempfile
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+
+from json_io import read_json, write_json_atomic
+
+
+KEY_RE = re.compile(r"^[0-9a-f]{64}$")
+COPY_CHUNK = 1024 * 1024
+
+
+def _valid_key(key: str) -> bool:
+    return bool(KEY_RE.match(key))
+
+
+class DirectoryBackend:
+    """공유 폴더 백엔드 - {root}/ab/{key}.blob + {key}.json (메타)"""
+
+    def __init__(self, root: Path, read_only: bool = False):
+        self.root = Path(root)
+        self.read_only = read_only
+
+    def __repr__(self) -> str:
+        return f"dir:{self.root}"
+
+    def _paths(self, key: str):
+        base = self.root / key[:2]
+        return base / f"{key}.blob", base / f"{key}.json"
+
+    def exists(self, key: str) -> bool:
+        blob, meta = self._paths(key)
+        return blob.exists() and meta.exists()
+
+    def get(self, key: str, dest: Path) -> Optional[Dict]:
+        """dest로 복사하고 메타 반환 (없으면 None)"""
+        blob, meta_path = self._paths(key)
+        try:
+            meta = read_json(meta_path)
+            shutil.copyfile(blob, dest)
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def put(self, key: str, src: Path, meta: Dict) -> bool:
+        if self.read_only:
+            return False
+        blob, meta_path = self._paths(key)
+        if blob.exists() and meta_path.exists():
+            return True
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        # 임시 파일에 복사 후 rename - 다른 머신이 반쯤 쓰인 blob을 읽지 않도록
+        fd, tmp_name = tempfile.mkstemp(prefix=f".{key}.", suffix=".tmp", dir=str(blob.parent))
+        os.close(fd)
+        try:
+            shutil.copyfile(src, tmp_name)
+            os.replace(tmp_name, blob)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        # 메타는 blob 다음에 기록 (exists()는 둘 다 있어야 True)
+        write_json_atomic(meta_path, meta)
+        return True
+
+
+class HttpBackend:
+    """HTTP GET/PUT 백엔드"""
+
+    def __init__(self, base_url: str, read_only: bool = False, token: Optional[str] = None,
+                 timeout: float = 60.0):
+        self.base_url = base_url.rstrip("/")
+        self.read_only = read_only
+        self.token = token
+        self.timeout = timeout
+
+    def __repr__(self) -> str:
+        return self.base_url
+
+    def _request(self, method: str, key: str, data=None, headers: Optional[Dict] = None):
+        request = urllib.request.Request(f"{self.base_url}/{key}", data=data, method=method,
+                                         headers=dict(headers or {}))
+        if self.token:
+            request.add_header("Authorization", f"Bearer {self.token}")
+        return urllib.request.urlopen(request, timeout=self.timeout)
+
+    def exists(self, key: str) -> bool:
+        try:
+            with self._request("HEAD", key) as response:
+                return response.status == 200
+        except (urllib.error.URLError, OSError):
+            return False
+
+    def get(self, key: str, dest: Path) -> Optional[Dict]:
+        """dest로 내려받고 메타 반환 (없거나 본문이 Content-Length보다 짧으면 None)"""
+        try:
+            with self._request("GET", key) as response, open(dest, "wb") as f:
+                shutil.copyfileobj(response, f, COPY_CHUNK)
+                received = f.tell()
+                length = response.headers.get("Content-Length")
+                meta = {
+                    "suffix": response.headers.get("X-Cache-Suffix", ""),
+                    "stage": response.headers.get("X-Cache-Stage", ""),
+                    "digest": response.headers.get("X-Cache-Digest", ""),
+                }
+        except (urllib.error.URLError, http.client.HTTPException, OSError, ValueError):
+            return None
+        if length is None or not length.isdigit() or int(length) != received:
+            return None
+        meta["size"] = received
+        return meta
+
+    def put(self, key: str, src: Path, meta: Dict) -> bool:
+        if self.read_only:
+            return False
+        if self.exists(key):
+            return True
+        headers = {
+            "X-Cache-Suffix": meta.get("suffix", ""),
+            "X-Cache-Stage": meta.get("stage", ""),
+            "X-Cache-Digest": meta.get("digest", ""),
+            "Content-Length": str(os.path.getsize(src)),
+            "Content-Type": "application/octet-stream",
+        }
+        try:
+            with open(src, "rb") as f, self._request("PUT", key, data=f, headers=headers) as response:
+                return response.status in (200, 201, 204)
+        except (urllib.error.URLError, OSError):
+            return False
+
+
+def open_remote(location: Optional[str] = None):
+    """PIPELINE_REMOTE_CACHE (또는 location)로 백엔드 생성, 설정이 없으면 None"""
+    location = location or os.environ.get("PIPELINE_REMOTE_CACHE", "").strip()
+    if not location:
+        return None
+    read_only = os.environ.get("PIPELINE_REMOTE_CACHE_READONLY") == "1"
+    if location.startswith(("http://", "https://")):
+        return HttpBackend(location, read_only=read_only,
+                           token=os.environ.get("PIPELINE_REMOTE_CACHE_TOKEN"))
+    return DirectoryBackend(Path(location), read_only=read_only)
+
+
+# ============================================================
+# 로컬 대체 서버
+# ============================================================
+def make_handler(backend: DirectoryBackend, token: Optional[str] = None):
+    """DirectoryBackend를 HTTP 프로토콜로 노출하는 요청 핸들러"""
+
+    class CacheHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _key(self) -> Optional[str]:
+            if token and self.headers.get("Authorization") != f"Bearer {token}":
+                self.send_error(401)
+                return None
+            key = self.path.strip("/")
+            if not _valid_key(key):
+                self.send_error(400, "invalid key")
+                return None
+            return key
+
+        def do_HEAD(self):
+            key = self._key()
+            if key is None:
+                return
+            self.send_response(200 if backend.exists(key) else 404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def do_GET(self):
+            key = self._key()
+            if key is None:
+                return
+            blob, meta_path = backend._paths(key)
+            if not backend.exists(key):
+                self.send_error(404)
+                return
+            meta = read_json(meta_path)
+            self.send_response(200)
+            self.send_header("Content-Length", str(blob.stat().st_size))
+            self.send_header("X-Cache-Suffix", meta.get("suffix", ""))
+            self.send_header("X-Cache-Stage", meta.get("stage", ""))
+            self.send_header("X-Cache-Digest", meta.get("digest", ""))
+            self.end_headers()
+            with open(blob, "rb") as f:
+                shutil.copyfileobj(f, self.wfile, COPY_CHUNK)
+
+        def do_PUT(self):
+            key = self._key()
+            if key is None:
+                return
+            length = self.headers.get("Content-Length", "")
+            if not length.isdigit():
+                # 길이를 모르면 본문이 끝까지 왔는지 확인할 수 없으므로 받지 않음 (빈 blob 방지)
+                self.send_error(411, "Content-Length required")
+                return
+            length = int(length)
+            expected = self.headers.get("X-Cache-Digest", "")
+            backend.root.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(prefix=".upload.", dir=str(backend.root))
+            try:
+                h = hashlib.sha256()
+                with os.fdopen(fd, "wb") as f:
+                    remaining = length
+                    while remaining:
+                        chunk = self.rfile.read(min(COPY_CHUNK, remaining))
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        h.update(chunk)
+                        remaining -= len(chunk)
+                if remaining:
+                    self.send_error(400, "incomplete body")
+                    return
+                if expected and h.hexdigest() != expected:
+                    self.send_error(400, "digest mismatch")
+                    return
+                backend.put(key, Path(tmp_name), {
+                    "suffix": self.headers.get("X-Cache-Suffix", ""),
+                    "stage": self.headers.get("X-Cache-Stage", ""),
+                    "size": length,
+                    "digest": h.hexdigest(),
+                })
+            finally:
+                os.unlink(tmp_name)
+            self.send_response(201)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+
+        def log_message(self, format, *args):
+            print(f"[CACHE-SERVER] {self.address_string()} {format % args}")
+
+    return CacheHandler
+
+
+def serve(root: Path, host: str = "0.0.0.0", port: int = 8765, token: Optional[str] = None):
+    server = ThreadingHTTPServer((host, port), make_handler(DirectoryBackend(root), token))
+    print(f"[CACHE-SERVER] {root} → http://{host}:{port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="공유 빌드 캐시 서버")
+    subparsers = parser.add_subparsers(dest="command")
+    p_serve = subparsers.add_parser("serve", help="DirectoryBackend를 HTTP로 제공")
+    p_serve.add_argument("--dir", required=True, help="캐시 폴더")
+    p_serve.add_argument("--host", default="0.0.0.0")
+    p_serve.add_argument("--port", type=int, default=8765)
+    p_serve.add_argument("--token", default=os.environ.get("PIPELINE_REMOTE_CACHE_TOKEN"),
+                         help="Bearer 토큰 (설정 시 인증 필요)")
+    args = parser.parse_args()
+
+    if args.command != "serve":
+        parser.print_help()
+        sys.exit(1)
+    serve(Path(args.dir), args.host, args.port, args.token)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+// Remotion 렌더 서버 - 브라우저를 한 번 띄워 두고 pipeline.py의 렌더 요청을 처리
+//
+// `npx remotion render`는 씬마다 node + headless Chrome을 새로 띄웁니다 (씬당 수 초).
+// 이 서버는 @remotion/renderer(프로그래밍 API)로 브라우저와 번들별 composition 목록을 유지하고,
+// stdin/stdout JSON lines로 요청을 받습니다. (Remotion 로그는 stderr, stdout은 프로토콜 전용)
+//
+// 요청 (한 줄에 JSON 하나):
+//   {"id": "1", "type": "render", "serveUrl": "<번들 폴더>", "composition": "S3",
+//    "output": "<출력 경로>", "options": {"codec": "h264", "imageFormat": "jpeg", "crf": 18}, "concurrency": 4}
+//   {"id": "2", "type": "ping"}
+//   {"type": "shutdown"}
+//
+// 이벤트:
+//   {"event": "ready"}
+//   {"id": "1", "event": "progress", "progress": 0.42, "renderedFrames": 38, "encodedFrames": 30}
+//   {"id": "1", "event": "done", "output": "...", "seconds": 12.3}
+//   {"id": "1", "event": "error", "message": "..."}
+//
+// 사용법: node render-server.mjs  (pipeline.py가 PIPELINE_RENDER_BACKEND=server일 때 자동 실행)
+
+import { createInterface } from "node:readline";
+import { ensureBrowser, openBrowser, renderMedia, selectComposition } from "@remotion/renderer";
+
+const send = (message) => process.stdout.write(JSON.stringify(message) + "\n");
+
+// Remotion/Chrome 로그가 프로토콜 출력에 섞이지 않도록 stderr로 보냄
+console.log = (...args) => console.error(...args);
+console.info = (...args) => console.error(...args);
+
+let browserPromise = null;
+const compositions = new Map(); // `${serveUrl}#${id}` → composition
+
+const getBrowser = () => {
+  if (!browserPromise) {
+    browserPromise = ensureBrowser().then(() => openBrowser("chrome"));
+  }
+  return browserPromise;
+};
+
+const getComposition = async (serveUrl, id, browser) => {
+  const key = `${serveUrl}#${id}`;
+  if (!compositions.has(key)) {
+    compositions.set(key, await selectComposition({ serveUrl, id, inputProps: {}, puppeteerInstance: browser }));
+  }
+  return compositions.get(key);
+};
+
+const render = async (request) => {
+  const started = Date.now();
+  const browser = await getBrowser();
+  const composition = await getComposition(request.serveUrl, request.composition, browser);
+  let lastPercent = -1;
+  await renderMedia({
+    ...(request.options || {}),
+    composition,
+    serveUrl: request.serveUrl,
+    outputLocation: request.output,
+    inputProps: {},
+    concurrency: request.concurrency || null,
+    overwrite: true,
+    puppeteerInstance: browser,
+    onProgress: ({ progress, renderedFrames, encodedFrames }) => {
+      const percent = Math.floor(progress * 100);
+      if (percent !== lastPercent) {
+        lastPercent = percent;
+        send({ id: request.id, event: "progress", progress, renderedFrames, encodedFrames });
+      }
+    },
+  });
+  send({ id: request.id, event: "done", output: request.output, seconds: (Date.now() - started) / 1000 });
+};
+
+const shutdown = async () => {
+  if (browserPromise) {
+    try {
+      const browser = await browserPromise;
+      await browser.close({ silent: true });
+    } catch (error) {
+      console.error(error);
+    }
+  }
+  process.exit(0);
+};
+
+const lines = createInterface({ input: process.stdin });
+lines.on("line", (line) => {
+  if (!line.trim()) return;
+  let request;
+  try {
+    request = JSON.parse(line);
+  } catch (error) {
+    send({ event: "error", message: `잘못된 요청: ${error.message}` });
+    return;
+  }
+  if (request.type === "shutdown") {
+    shutdown();
+  } else if (request.type === "ping") {
+    send({ id: request.id, event: "pong" });
+  } else if (request.type === "render") {
+    // 요청마다 비동기로 처리 (동시 렌더는 같은 브라우저를 공유)
+    render(request).catch((error) => {
+      // 번들이 바뀌었을 수 있으므로 composition 메모를 비움
+      compositions.delete(`${request.serveUrl}#${request.composition}`);
+      console.error(error);
+      send({ id: request.id, event: "error", message: String(error && error.message ? error.message : error) });
+    });
+  } else {
+    send({ id: request.id, event: "error", message: `알 수 없는 요청: ${request.type}` });
+  }
+});
+lines.on("close", shutdown);
+
+send({ event: "ready" });
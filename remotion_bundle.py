@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Remotion Bundle - webpack 번들을 한 번 만들고 모든 씬 렌더에서 재사용
+
+`npx remotion render src/index.ts S3`은 실행할 때마다 Root.tsx가 import하는 모든 씬을
+webpack으로 다시 번들링합니다. 씬이 N개면 번들링 비용을 N번 냅니다.
+
+번들은 remotion/src + remotion/public (+ package.json, remotion.config.ts 등) 내용 해시로 key를 만들어
+빌드 캐시 폴더(bundles/{key})에 보관하고, 렌더는 `npx remotion render {번들 폴더} S3`로 실행합니다.
+    - 같은 key의 번들이 있으면 그대로 사용 (다음 실행에서도 재사용)
+    - 없으면 `npx remotion bundle`로 한 번 생성 (동시 렌더는 생성이 끝날 때까지 대기)
+    - 생성 실패 시 None → 호출자는 기존처럼 src/index.ts를 넘김
+      (실패한 key는 프로세스 동안 기억 - 같은 소스로 렌더마다 번들 생성을 다시 시도하지 않음)
+파일 해시는 BuildCache.file_digest의 mtime/size 메모를 사용하므로 변경이 없으면 stat만 합니다.
+
+최근 KEEP_BUNDLES개만 남기고 오래된 번들은 삭제합니다 (번들에 public/ 사본이 들어 있어 큼).
+
+환경 변수:
+    PIPELINE_REMOTION_BUNDLE=0   번들 재사용 비활성화 (렌더마다 src/index.ts 번들링)
+
+사용법:
+    bundler = RemotionBundler(REMOTION_DIR, CACHE_DIR / "bundles")
+    serve_url = bundler.ensure(get_cache()) or "src/index.ts"
+    run(f'npx remotion render "{serve_url}" S3 ...')
+"""
+
+import os
+import shutil
+import subprocess
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Set
+
+from build_cache import BuildCache, remotion_version
+
+
+ENTRY_POINT = "src/index.ts"
+BUNDLE_INPUT_DIRS = ["src", "public"]
+BUNDLE_INPUT_FILES = ["package.json", "package-lock.json", "remotion.config.ts", "tsconfig.json"]
+KEEP_BUNDLES = 3
+BUNDLE_MARKER = "index.html"     # 완성된 번들에만 있는 파일
+
+
+def bundle_enabled() -> bool:
+    return os.environ.get("PIPELINE_REMOTION_BUNDLE") != "0"
+
+
+def bundle_inputs(remotion_dir: Path) -> List[Path]:
+    """번들 key 입력 파일 (정렬된 전체 경로)"""
+    remotion_dir = Path(remotion_dir)
+    files = [remotion_dir / name for name in BUNDLE_INPUT_FILES if (remotion_dir / name).is_file()]
+    for folder in BUNDLE_INPUT_DIRS:
+        root = remotion_dir / folder
+        if root.is_dir():
+            files.extend(p for p in root.rglob("*") if p.is_file() and not p.name.startswith("."))
+    return sorted(files)
+
+
+class RemotionBundler:
+    """내용 해시 key 번들 (스레드 안전 - 같은 key는 한 번만 생성)"""
+
+    def __init__(self, remotion_dir: Path, bundles_dir: Path, keep: int = KEEP_BUNDLES):
+        self.remotion_dir = Path(remotion_dir)
+        self.bundles_dir = Path(bundles_dir)
+        self.keep = keep
+        self._lock = threading.Lock()
+        self._failed: Set[str] = set()    # 생성에 실패한 key (이번 프로세스)
+        self.stats = {"built": 0, "reused": 0, "failed": 0}
+
+    def key(self, cache: BuildCache) -> str:
+        inputs = bundle_inputs(self.remotion_dir)
+        # action_key는 파일 이름만 넣으므로 상대 경로 목록을 파라미터로 함께 넣음 (같은 이름 구분)
+        return cache.action_key("bundle", inputs, {
+            "files": [str(p.relative_to(self.remotion_dir)) for p in inputs],
+            "entry": ENTRY_POINT,
+            "remotion": remotion_version(self.remotion_dir),
+        })
+
+    def path(self, key: str) -> Path:
+        return self.bundles_dir / key[:16]
+
+    def ensure(self, cache: BuildCache) -> Optional[Path]:
+        """현재 소스의 번들 폴더 (없으면 생성, 실패하면 None)"""
+        key = self.key(cache)
+        bundle = self.path(key)
+        with self._lock:
+            if key in self._failed:
+                return None
+            if (bundle / BUNDLE_MARKER).exists():
+                self.stats["reused"] += 1
+                os.utime(bundle)   # 최근 사용 표시 (정리 순서)
+                return bundle
+            built = self._build(bundle)
+            if built is None:
+                self._failed.add(key)
+            return built
+
+    def _build(self, bundle: Path) -> Optional[Path]:
+        print(f"📦 Remotion 번들 생성 중... ({bundle.name})")
+        self.bundles_dir.mkdir(parents=True, exist_ok=True)
+        partial = bundle.with_name(f".{bundle.name}.partial")
+        shutil.rmtree(partial, ignore_errors=True)
+
+        started = time.monotonic()
+        cmd = f'npx remotion bundle {ENTRY_POINT} --out-dir "{partial}"'
+        result = subprocess.run(cmd, cwd=str(self.remotion_dir), capture_output=True, text=True, shell=True)
+        if result.returncode != 0 or not (partial / BUNDLE_MARKER).exists():
+            shutil.rmtree(partial, ignore_errors=True)
+            self.stats["failed"] += 1
+            error = (result.stderr or result.stdout)[:500] or "번들 출력 없음"
+            print(f"  [WARN] 번들 생성 실패 - 씬마다 번들링합니다: {error}")
+            return None
+
+        shutil.rmtree(bundle, ignore_errors=True)
+        os.replace(partial, bundle)
+        self.stats["built"] += 1
+        print(f"  [OK] 번들 {bundle.name} ({time.monotonic() - started:.1f}s)")
+        self._prune(keep_current=bundle)
+        return bundle
+
+    def _prune(self, keep_current: Path):
+        """최근 사용한 keep개 외의 번들 삭제"""
+        bundles = [p for p in self.bundles_dir.iterdir() if p.is_dir() and not p.name.startswith(".")]
+        bundles.sort(key=lambda p: p.stat().st_mtime, reverse=True)
+        for old in bundles[self.keep:]:
+            if old != keep_current:
+                shutil.rmtree(old, ignore_errors=True)
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Render Cost - 씬 렌더 비용 예측 (longest-job-first 스케줄링용)
+
+렌더를 문서 순서대로 나누면 긴 씬이 마지막에 걸렸을 때 다른 worker가 모두 놀게 됩니다.
+씬별 비용을 예측해 긴 씬부터 배정하면 전체 소요 시간(makespan)이 줄어듭니다.
+
+예측: CPU 초 = 프레임 수 × (b0 + Σ w_i × 특징_i)
+    특징 (FEATURES): TSX/씬 JSON의 정적 특징
+        images       staticFile / <Img / <HistoryImage 수
+        camera       cameraZoom / cameraPan / <CameraContainer 수
+        animations   interpolate / spring / 애니메이션 헬퍼 호출 수
+        elements     씬 JSON elements + required_elements 수
+        tsx_kb       TSX 크기 (KB)
+    학습: 실제 렌더 기록(render_costs 테이블)으로 ridge 회귀 (numpy)
+          기록이 적거나 numpy가 없으면 프레임당 평균 시간 × 프레임 수
+
+CPU 초 = wall 초 × Remotion concurrency (governor가 concurrency를 줄여도 비교 가능하도록)
+
+사용법:
+    model = RenderCostModel(OUTPUT_DIR / "ledger.db").fit()
+    cost = model.predict(frames, scene_features(scene_doc, tsx_path))
+    ...
+    model.record("s3", frames, features, wall_seconds, concurrency)
+"""
+
+import json
+import re
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from build_plan import DEFAULT_SECONDS_PER_FRAME
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+FEATURES = ["images", "camera", "animations", "elements", "tsx_kb"]
+
+FEATURE_PATTERNS = {
+    "images": re.compile(r"staticFile\(|<Img\b|<HistoryImage\b"),
+    "camera": re.compile(r"\bcamera(?:Zoom|Pan)\(|<CameraContainer\b"),
+    "animations": re.compile(r"\b(?:interpolate|spring|fadeIn|fadeOut|slideIn\w*|scaleIn|drawLine|pulse)\("),
+}
+
+MAX_SAMPLES = 1000       # 최근 기록만 사용
+RIDGE = 1e-2
+MIN_PER_FRAME_RATIO = 0.2   # 예측값 하한 (평균 프레임당 비용 대비)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS render_costs (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    unit         TEXT NOT NULL,
+    frames       INTEGER NOT NULL,
+    features     TEXT NOT NULL,
+    seconds      REAL NOT NULL,
+    concurrency  INTEGER NOT NULL,
+    recorded_at  TEXT NOT NULL
+);
+"""
+
+
+def scene_features(scene: Optional[Dict], tsx_path: Optional[Path]) -> Dict[str, float]:
+    """씬 JSON + TSX → 특징 dict"""
+    features = {name: 0.0 for name in FEATURES}
+    if scene:
+        features["elements"] = float(len(scene.get("elements") or []) + len(scene.get("required_elements") or []))
+    if tsx_path is not None:
+        try:
+            text = Path(tsx_path).read_text(encoding="utf-8")
+        except OSError:
+            text = ""
+        for name, pattern in FEATURE_PATTERNS.items():
+            features[name] = float(len(pattern.findall(text)))
+        features["tsx_kb"] = len(text.encode("utf-8")) / 1024.0
+    return features
+
+
+class RenderCostModel:
+    """렌더 비용 기록 + 예측"""
+
+    def __init__(self, db_path: Path):
+        self.conn = sqlite3.connect(str(db_path), timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+        self.per_frame = DEFAULT_SECONDS_PER_FRAME["render"]
+        self.weights: Optional[List[float]] = None
+        self.samples = 0
+
+    def close(self):
+        self.conn.close()
+
+    def record(self, unit: str, frames: int, features: Dict[str, float], seconds: float, concurrency: int = 1):
+        """실제 렌더 시간 기록 (wall 초, 사용한 concurrency)"""
+        if frames <= 0 or seconds <= 0:
+            return
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO render_costs(unit, frames, features, seconds, concurrency, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (unit, frames, json.dumps(features), seconds, max(1, concurrency), datetime.now().isoformat())
+            )
+
+    def fit(self) -> "RenderCostModel":
+        rows = self.conn.execute(
+            "SELECT frames, features, seconds, concurrency FROM render_costs ORDER BY id DESC LIMIT ?",
+            (MAX_SAMPLES,)
+        ).fetchall()
+        self.samples = len(rows)
+        if not rows:
+            return self
+
+        cpu_seconds = [row["seconds"] * row["concurrency"] for row in rows]
+        total_frames = sum(row["frames"] for row in rows)
+        self.per_frame = sum(cpu_seconds) / total_frames
+
+        if NUMPY_AVAILABLE and len(rows) >= len(FEATURES) + 3:
+            # seconds = frames × [1, x...] · w  →  X = frames × [1, x...]
+            X = np.array([[row["frames"]] + [row["frames"] * json.loads(row["features"]).get(name, 0.0)
+                                             for name in FEATURES] for row in rows], dtype=np.float64)
+            y = np.array(cpu_seconds, dtype=np.float64)
+            scale = np.maximum(np.abs(X).max(axis=0), 1e-9)
+            Xs = X / scale
+            A = Xs.T @ Xs + RIDGE * np.eye(Xs.shape[1])
+            w = np.linalg.solve(A, Xs.T @ y) / scale
+            self.weights = w.tolist()
+        return self
+
+    def predict(self, frames: int, features: Dict[str, float]) -> float:
+        """예상 CPU 초 (wall 초 ≈ 값 / concurrency)"""
+        if self.weights is None:
+            return frames * self.per_frame
+        per_frame = self.weights[0] + sum(w * features.get(name, 0.0) for w, name in zip(self.weights[1:], FEATURES))
+        return frames * max(per_frame, self.per_frame * MIN_PER_FRAME_RATIO)
+
+
+def longest_first(costs: Dict[str, float]) -> List[str]:
+    """예상 비용이 큰 순서 (같으면 원래 순서 유지)"""
+    ranked = sorted(enumerate(costs), key=lambda item: (-costs[item[1]], item[0]))
+    return [unit for _, unit in ranked]
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Render Pool - 여러 씬을 동시에 렌더 (전체 코어 예산 분배)
+
+씬을 하나씩 --concurrency 4로 렌더하면 코어가 많은 머신에서 대부분의 코어가 놉니다.
+pool은 jobs개의 씬 렌더를 동시에 실행하고, 전체 코어 예산(budget)을 Remotion 탭 수로 나눠 줍니다.
+
+탭 분배 (split_cores):
+    기본 몫 = budget / jobs
+    씬별 탭 = 기본 몫 × (예상 비용 / 평균 예상 비용), 1 ~ budget 범위
+    → 긴 씬은 탭을 많이, 짧은 씬은 적게 받아 비슷한 시간에 끝남
+
+실행:
+    예상 비용이 큰 씬부터 시작 (longest-job-first, render_cost.longest_first)
+    실행 중인 탭 합이 budget을 넘지 않도록, 남은 코어가 부족하면 남은 만큼만 받아 시작
+    (governor가 실시간 부하를 보고 더 줄일 수 있음)
+
+로그:
+    씬마다 별도 파일 (output/logs/render_s3.log) - 동시에 도는 렌더의 출력이 섞이지 않음
+
+사용법:
+    pool = RenderPool(budget=32, jobs=4, log_dir=OUTPUT_DIR / "logs")
+    summary = pool.run(costs, lambda unit, tabs, log_path: render(unit, tabs, log_path))
+    # render는 {ok, rendered, frames[, concurrency]} 반환
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from render_cost import longest_first
+
+
+def split_cores(costs: Dict[str, float], budget: int, jobs: int) -> Dict[str, int]:
+    """예상 비용 비례 탭 수 {씬: 탭}"""
+    if not costs:
+        return {}
+    budget = max(1, budget)
+    jobs = max(1, min(jobs, len(costs)))
+    share = budget / jobs
+    mean = sum(costs.values()) / len(costs)
+    tabs = {}
+    for unit, cost in costs.items():
+        ratio = cost / mean if mean > 0 else 1.0
+        tabs[unit] = max(1, min(budget, round(share * ratio)))
+    return tabs
+
+
+class RenderPool:
+    """동시 씬 렌더 + 코어 예산"""
+
+    def __init__(self, budget: int, jobs: int, log_dir: Path):
+        self.budget = max(1, budget)
+        self.jobs = max(1, jobs)
+        self.log_dir = Path(log_dir)
+        self._cond = threading.Condition()
+        self._in_use = 0
+
+    def _take(self, want: int) -> int:
+        """남은 코어에서 최대 want개 (하나도 없으면 대기)"""
+        with self._cond:
+            while self._in_use >= self.budget:
+                self._cond.wait()
+            tabs = min(want, self.budget - self._in_use)
+            self._in_use += tabs
+            return tabs
+
+    def _give(self, tabs: int):
+        with self._cond:
+            self._in_use -= tabs
+            self._cond.notify_all()
+
+    def run(self, costs: Dict[str, float], render: Callable[[str, int, Path], Dict]) -> Dict:
+        """costs의 씬을 모두 렌더
+
+        Args:
+            costs: {씬: 예상 비용} (순서는 비용이 같을 때의 순서)
+            render: (씬, 탭 수, 로그 경로) → {ok, rendered, frames[, concurrency: 실제 탭 수]}
+
+        Returns:
+            {ok, failed, rendered, frames, elapsed, fps, scenes: {씬: {tabs, seconds, frames, rendered, ok}}}
+        """
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        order = longest_first(costs)
+        plan = split_cores(costs, self.budget, self.jobs)
+        scenes: Dict[str, Dict] = {}
+        started = time.monotonic()
+
+        def job(unit: str):
+            tabs = self._take(plan[unit])
+            log_path = self.log_dir / f"render_{unit.lower()}.log"
+            job_started = time.monotonic()
+            try:
+                stats = render(unit, tabs, log_path) or {}
+            except Exception as e:
+                print(f"  [ERROR] {unit}: {type(e).__name__}: {e}")
+                stats = {"ok": False}
+            finally:
+                self._give(tabs)
+            seconds = time.monotonic() - job_started
+            tabs = stats.get("concurrency", tabs)   # governor가 더 줄였을 수 있음
+            scenes[unit] = {"tabs": tabs, "seconds": round(seconds, 2), "frames": stats.get("frames", 0),
+                            "rendered": bool(stats.get("rendered")), "ok": bool(stats.get("ok"))}
+            if scenes[unit]["rendered"] and seconds > 0:
+                print(f"  [POOL] {unit} 완료 - 탭 {tabs}, {seconds:.1f}s, "
+                      f"{scenes[unit]['frames'] / seconds:.1f} fps (로그: {log_path})")
+            elif not scenes[unit]["ok"]:
+                print(f"  [POOL] {unit} 실패 (로그: {log_path})")
+
+        with ThreadPoolExecutor(max_workers=min(self.jobs, len(order)) or 1) as executor:
+            list(executor.map(job, order))
+
+        elapsed = time.monotonic() - started
+        rendered: List[str] = [u for u in order if scenes[u]["rendered"]]
+        frames = sum(scenes[u]["frames"] for u in rendered)
+        return {
+            "ok": [u for u in order if scenes[u]["ok"]],
+            "failed": [u for u in order if not scenes[u]["ok"]],
+            "rendered": rendered,
+            "frames": frames,
+            "elapsed": round(elapsed, 2),
+            "fps": round(frames / elapsed, 2) if rendered and elapsed > 0 else 0.0,
+            "scenes": scenes,
+        }
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Render Server - 상주 Node 렌더 서버(remotion/render-server.mjs) 클라이언트
+
+`npx remotion render`는 씬마다 node + headless Chrome을 새로 띄우므로,
+5~8초짜리 짧은 씬이 많으면 시작 비용이 렌더 시간보다 커집니다.
+렌더 서버는 브라우저와 composition 정보를 유지한 채 stdin/stdout JSON lines로 렌더 요청을 받습니다.
+
+    server = RenderServer(REMOTION_DIR, log_path=LOGS_DIR / "render_server.log")
+    server.start()                                   # 실패 시 False (node/@remotion/renderer 없음 등)
+    result = server.render(bundle_dir, "S3", output, cli_options(RENDER_ENCODER_ARGS[False]),
+                           concurrency=4, on_progress=lambda e: ...)
+    # result: {ok, seconds, error}
+    server.close()
+
+여러 스레드에서 동시에 render()를 호출할 수 있습니다 (요청 id로 이벤트 구분, 서버는 브라우저 공유).
+serve URL은 번들 폴더여야 합니다 (remotion_bundle) - src/index.ts는 서버에서 사용할 수 없음.
+"""
+
+import itertools
+import json
+import queue
+import subprocess
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+
+SERVER_SCRIPT = "render-server.mjs"
+READY_TIMEOUT = 30        # 서버 시작 대기 (초)
+RENDER_TIMEOUT = 3600     # 렌더 1건 최대 (초)
+
+
+def cli_options(args: str) -> Dict:
+    """CLI 인자 문자열 → renderMedia 옵션 ("--image-format png --crf 18" → {imageFormat: "png", crf: 18})"""
+    options = {}
+    tokens = args.split()
+    for i, token in enumerate(tokens):
+        if not token.startswith("--"):
+            continue
+        name, _, value = token[2:].partition("=")
+        if not value:
+            has_value = i + 1 < len(tokens) and not tokens[i + 1].startswith("--")
+            value = tokens[i + 1] if has_value else "true"
+        key = name.split("-")[0] + "".join(part.title() for part in name.split("-")[1:])
+        if value in ("true", "false"):
+            options[key] = value == "true"
+        else:
+            try:
+                options[key] = int(value)
+            except ValueError:
+                try:
+                    options[key] = float(value)
+                except ValueError:
+                    options[key] = value
+    return options
+
+
+class RenderServer:
+    """render-server.mjs 프로세스 + 요청/이벤트 중계"""
+
+    def __init__(self, remotion_dir: Path, log_path: Optional[Path] = None):
+        self.remotion_dir = Path(remotion_dir)
+        self.log_path = Path(log_path) if log_path else None
+        self.process: Optional[subprocess.Popen] = None
+        self._log = None
+        self._write_lock = threading.Lock()
+        self._waiters: Dict[str, queue.Queue] = {}
+        self._ids = itertools.count(1)
+        self._ready = threading.Event()
+        self._serving = False       # ready 이벤트 수신 여부 (시작 중 종료와 구분)
+
+    @property
+    def alive(self) -> bool:
+        return self.process is not None and self.process.poll() is None
+
+    def start(self) -> bool:
+        """서버 실행 후 ready 이벤트 대기"""
+        if self.alive:
+            return True
+        if not (self.remotion_dir / SERVER_SCRIPT).exists():
+            return False
+        if self.log_path:
+            self.log_path.parent.mkdir(parents=True, exist_ok=True)
+            self._log = open(self.log_path, "a", encoding="utf-8")
+        try:
+            self.process = subprocess.Popen(
+                ["node", SERVER_SCRIPT], cwd=str(self.remotion_dir), stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE, stderr=self._log or subprocess.DEVNULL,
+                text=True, encoding="utf-8", bufsize=1
+            )
+        except OSError:
+            self.process = None
+            return False
+
+        self._ready.clear()
+        self._serving = False
+        threading.Thread(target=self._read_events, name="render-server", daemon=True).start()
+        # 시작 중 종료되면 stdout EOF에서 바로 깨어남 (timeout까지 기다리지 않음)
+        if not self._ready.wait(READY_TIMEOUT) or not self._serving or not self.alive:
+            self.close()
+            return False
+        return True
+
+    def _read_events(self):
+        """stdout 이벤트를 요청 id별 큐로 전달 (서버 종료 시 대기 중인 요청에 오류 전달)"""
+        for line in self.process.stdout:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                continue
+            if event.get("event") == "ready":
+                self._serving = True
+                self._ready.set()
+                continue
+            waiter = self._waiters.get(str(event.get("id")))
+            if waiter is not None:
+                waiter.put(event)
+        self._ready.set()
+        for waiter in list(self._waiters.values()):
+            waiter.put({"event": "error", "message": "렌더 서버 종료"})
+
+    def _send(self, message: Dict):
+        with self._write_lock:
+            self.process.stdin.write(json.dumps(message, ensure_ascii=False) + "\n")
+            self.process.stdin.flush()
+
+    def render(self, serve_url: str, composition: str, output: Path, options: Dict,
+               concurrency: Optional[int] = None, on_progress: Optional[Callable[[Dict], None]] = None,
+               timeout: float = RENDER_TIMEOUT) -> Dict:
+        """렌더 요청 후 완료까지 대기 → {ok, seconds, error}"""
+        if not self.alive:
+            return {"ok": False, "seconds": 0.0, "error": "렌더 서버가 실행 중이 아님"}
+        request_id = str(next(self._ids))
+        waiter: queue.Queue = queue.Queue()
+        self._waiters[request_id] = waiter
+        try:
+            self._send({"id": request_id, "type": "render", "serveUrl": str(serve_url),
+                        "composition": composition, "output": str(output),
+                        "options": options, "concurrency": concurrency})
+            while True:
+                try:
+                    event = waiter.get(timeout=timeout)
+                except queue.Empty:
+                    return {"ok": False, "seconds": 0.0, "error": f"응답 없음 ({timeout}s)"}
+                if event["event"] == "progress":
+                    if on_progress:
+                        on_progress(event)
+                elif event["event"] == "done":
+                    return {"ok": True, "seconds": event.get("seconds", 0.0), "error": ""}
+                else:
+                    return {"ok": False, "seconds": 0.0, "error": event.get("message", "알 수 없는 오류")}
+        except (OSError, ValueError) as e:
+            return {"ok": False, "seconds": 0.0, "error": f"렌더 서버 통신 실패: {e}"}
+        finally:
+            self._waiters.pop(request_id, None)
+
+    def close(self):
+        """shutdown 요청 후 종료 대기 (응답이 없으면 kill)"""
+        if self.process is not None:
+            if self.alive:
+                try:
+                    self._send({"type": "shutdown"})
+                    self.process.stdin.close()
+                    self.process.wait(timeout=10)
+                except (OSError, ValueError, subprocess.TimeoutExpired):
+                    self.process.kill()
+            self.process = None
+        if self._log is not None:
+            self._log.close()
+            self._log = None
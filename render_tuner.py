@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Render Tuner - 머신별 최적 렌더 concurrency / 동시 렌더 수 측정
+
+render --concurrency 기본값 4는 머신과 무관하게 고정이라, 4/8/16 중 어느 쪽이 빠른지 알 수 없었습니다.
+tune-render는 대표 씬 몇 개의 앞부분 프레임만 (--frames=0-N) 여러 설정으로 렌더해
+fps와 최대 메모리 사용량을 측정하고, 가장 빠른 설정을 머신별 프로필에 저장합니다.
+
+설정 = (jobs: 동시에 실행하는 렌더 프로세스 수, concurrency: 프로세스당 Remotion 탭 수)
+    concurrency 후보: 1, 2, 4, 8, ... (코어 수 이하) + 코어 수
+    jobs 후보: 1, 2, 4 (jobs × concurrency ≤ 코어 수인 조합만)
+    각 설정은 샘플 씬 작업(최소 jobs개)을 jobs개 worker로 실행 → fps = 전체 프레임 / 경과 시간
+    (프로세스 시작/브라우저 실행 비용까지 포함한 실제 렌더와 같은 조건)
+
+메모리: psutil이 있으면 렌더 프로세스 트리 RSS 합, 없으면 시스템 가용 메모리 감소량의 최대값
+선택: 메모리 여유(전체 − reserve) 안에서 fps 최고, TIE_RATIO 이내면 자원을 적게 쓰는 설정
+
+프로필 (기본 output/render_profile.json, PIPELINE_RENDER_PROFILE로 변경):
+    {"machines": {"host|32cpu|64G": {"jobs": 2, "concurrency": 8, "fps": ..., "results": [...]}}}
+    머신 key별로 저장하므로 여러 머신이 같은 프로젝트 폴더를 써도 각자의 설정을 사용합니다.
+
+사용법:
+    tuner = RenderTuner(build_cmd, cwd=REMOTION_DIR)
+    samples = [("S3", 60), ("S7", 60)]
+    result = tuner.tune(samples, candidate_settings(os.cpu_count()))
+    save_profile(PROFILE_PATH, result, samples)
+    load_profile(PROFILE_PATH)   # {"jobs": 2, "concurrency": 8, ...} 또는 None
+"""
+
+import os
+import socket
+import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from json_io import read_json, update_json
+from resource_governor import PSUTIL_AVAILABLE, live_usage
+
+if PSUTIL_AVAILABLE:
+    import psutil
+
+
+JOBS_CANDIDATES = [1, 2, 4]
+TIE_RATIO = 0.03          # fps 차이가 3% 이내면 자원을 적게 쓰는 설정 선택
+MEMORY_POLL = 0.2
+GB = 1024 ** 3
+
+
+def machine_key() -> str:
+    """호스트 이름 + 코어 수 + 메모리 (GB)"""
+    mem_total = live_usage()["mem_total"]
+    return f"{socket.gethostname()}|{os.cpu_count() or 1}cpu|{round(mem_total / GB)}G"
+
+
+def concurrency_levels(cpus: int) -> List[int]:
+    levels = []
+    level = 1
+    while level <= cpus:
+        levels.append(level)
+        level *= 2
+    if cpus not in levels:
+        levels.append(cpus)
+    return levels
+
+
+def candidate_settings(cpus: int, levels: Optional[List[int]] = None,
+                       jobs_levels: Optional[List[int]] = None) -> List[Tuple[int, int]]:
+    """(jobs, concurrency) 후보 - jobs × concurrency가 코어 수를 넘지 않는 조합"""
+    levels = levels or concurrency_levels(cpus)
+    jobs_levels = jobs_levels or [j for j in JOBS_CANDIDATES if j <= cpus]
+    settings = []
+    for jobs in jobs_levels:
+        for concurrency in levels:
+            if jobs == 1 or jobs * concurrency <= cpus:
+                settings.append((jobs, concurrency))
+    return settings
+
+
+class MemoryMonitor:
+    """렌더 중 최대 메모리 사용량 (바이트) 측정"""
+
+    def __init__(self):
+        self.peak = 0
+        self.pids: List[int] = []
+        self._stop = threading.Event()
+        self._baseline = live_usage()["mem_available"]
+        self._thread = threading.Thread(target=self._poll, daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _used(self) -> int:
+        if PSUTIL_AVAILABLE:
+            total = 0
+            for pid in list(self.pids):
+                try:
+                    proc = psutil.Process(pid)
+                    for p in [proc] + proc.children(recursive=True):
+                        total += p.memory_info().rss
+                except psutil.Error:
+                    continue
+            return total
+        return max(0, self._baseline - live_usage()["mem_available"])
+
+    def _poll(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self._used())
+            self._stop.wait(MEMORY_POLL)
+
+
+class RenderTuner:
+    """샘플 렌더로 (jobs, concurrency) 측정"""
+
+    def __init__(self, build_cmd: Callable[[str, Path, int, int], str], cwd: Path,
+                 mem_reserve: int = 2 * GB):
+        """
+        Args:
+            build_cmd: (composition, 출력 경로, 프레임 수, concurrency) → 렌더 명령 문자열
+            cwd: 렌더 명령 실행 폴더 (remotion/)
+            mem_reserve: 이만큼은 남아야 하는 메모리 (넘는 설정은 선택하지 않음)
+        """
+        self.build_cmd = build_cmd
+        self.cwd = Path(cwd)
+        self.mem_reserve = mem_reserve
+
+    def measure(self, samples: List[Tuple[str, int]], jobs: int, concurrency: int) -> Dict:
+        """한 설정 측정 → {jobs, concurrency, frames, seconds, fps, peak_mem, ok, error}"""
+        tasks = [samples[i % len(samples)] for i in range(max(len(samples), jobs))]
+        errors = []
+
+        with tempfile.TemporaryDirectory(prefix="tune-render-") as tmp, MemoryMonitor() as monitor:
+            def run(index: int) -> int:
+                comp, frames = tasks[index]
+                output = Path(tmp) / f"{index}_{comp}.mp4"
+                proc = subprocess.Popen(self.build_cmd(comp, output, frames, concurrency), cwd=str(self.cwd),
+                                        shell=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+                monitor.pids.append(proc.pid)
+                _, stderr = proc.communicate()
+                monitor.pids.remove(proc.pid)
+                if proc.returncode != 0:
+                    errors.append(f"{comp}: {(stderr or '').strip()[:200]}")
+                    return 0
+                return frames
+
+            started = time.monotonic()
+            with ThreadPoolExecutor(max_workers=jobs) as executor:
+                frames = sum(executor.map(run, range(len(tasks))))
+            seconds = time.monotonic() - started
+
+        return {
+            "jobs": jobs, "concurrency": concurrency, "frames": frames, "seconds": round(seconds, 2),
+            "fps": round(frames / seconds, 2) if seconds > 0 and not errors else 0.0,
+            "peak_mem": monitor.peak, "ok": not errors, "error": "; ".join(errors),
+        }
+
+    def tune(self, samples: List[Tuple[str, int]], settings: List[Tuple[int, int]],
+             on_result: Optional[Callable[[Dict], None]] = None) -> Dict:
+        """모든 설정 측정 후 최적 설정 선택 → {jobs, concurrency, fps, peak_mem, results}"""
+        results = []
+        for jobs, concurrency in settings:
+            result = self.measure(samples, jobs, concurrency)
+            results.append(result)
+            if on_result:
+                on_result(result)
+
+        mem_limit = live_usage()["mem_total"] - self.mem_reserve
+        usable = [r for r in results if r["ok"] and (mem_limit <= 0 or r["peak_mem"] <= mem_limit)]
+        if not usable:
+            return {"jobs": None, "concurrency": None, "fps": 0.0, "peak_mem": 0, "results": results}
+
+        top = max(r["fps"] for r in usable)
+        close = [r for r in usable if r["fps"] >= top * (1 - TIE_RATIO)]
+        best = min(close, key=lambda r: (r["jobs"] * r["concurrency"], r["peak_mem"]))
+        return {"jobs": best["jobs"], "concurrency": best["concurrency"], "fps": best["fps"],
+                "peak_mem": best["peak_mem"], "results": results}
+
+
+# ============================================================
+# 프로필
+# ============================================================
+def load_profile(path: Path) -> Optional[Dict]:
+    """현재 머신의 튜닝 결과 (없으면 None)"""
+    try:
+        profile = read_json(path)
+    except (OSError, ValueError):
+        return None
+    return profile.get("machines", {}).get(machine_key())
+
+
+def save_profile(path: Path, result: Dict, samples: List[Tuple[str, int]]):
+    """현재 머신 결과 저장 (다른 머신 결과는 유지)"""
+    entry = {
+        "jobs": result["jobs"],
+        "concurrency": result["concurrency"],
+        "fps": result["fps"],
+        "peak_mem": result["peak_mem"],
+        "samples": [{"composition": comp, "frames": frames} for comp, frames in samples],
+        "results": result["results"],
+        "tuned_at": datetime.now().isoformat(),
+    }
+    update_json(path, lambda profile: profile.setdefault("machines", {}).update({machine_key(): entry}))
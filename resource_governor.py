@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+"""
+Resource Governor - CPU/메모리 기준 작업 허용 (admit / delay / shrink)
+
+Remotion 렌더(Chrome + --concurrency 탭)와 libx264 인코딩을 동시에 돌리면
+코어 수를 넘겨 스래싱하거나 메모리 부족으로 죽을 수 있습니다.
+governor는 작업 종류별 선언 비용과 머신의 실시간 부하를 보고
+    - 여유가 있으면 바로 허용 (admit)
+    - 최소 크기도 들어가지 않으면 다른 작업이 끝날 때까지 대기 (delay)
+    - 요청 크기가 다 들어가지 않으면 줄여서 허용 (shrink: Remotion concurrency, ffmpeg -threads)
+합니다.
+
+비용 모델 (JOB_COSTS, 크기 = render는 concurrency, ffmpeg는 threads):
+    CPU = base_cpu + cpu × 크기        (코어)
+    메모리 = base_mem + mem × 크기      (바이트)
+
+여유 계산:
+    CPU    = 코어 수 × cpu_target − max(허용된 작업 선언 합, 실시간 사용 코어)
+    메모리 = min(전체 − 선언 합, 실시간 가용) − mem_reserve
+실시간 값은 psutil이 있으면 psutil, 없으면 /proc/stat(0.1초 측정) + /proc/meminfo,
+둘 다 없으면 os.getloadavg().
+
+실행 중인 작업이 없으면 최소 크기로는 항상 허용합니다 (교착 방지).
+
+환경 변수:
+    PIPELINE_GOVERNOR=0          비활성화 (요청 크기 그대로 즉시 허용)
+    PIPELINE_CPU_TARGET          목표 CPU 사용률 (기본 0.9)
+    PIPELINE_MEM_RESERVE         남겨둘 메모리 (기본 2G)
+
+사용법:
+    governor = ResourceGovernor()
+    with governor.job("render", 8) as grant:
+        run(f"npx remotion render ... --concurrency {grant['size']}")
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+from build_cache import parse_size
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+
+MB = 1024 * 1024
+
+JOB_COSTS = {
+    # Chrome 1개 + 탭마다 렌더 프로세스
+    "render": {"base_cpu": 0.5, "cpu": 1.0, "base_mem": 600 * MB, "mem": 400 * MB},
+    # libx264 1080p: 스레드당 약 1코어, 프레임 버퍼
+    "ffmpeg": {"base_cpu": 0.0, "cpu": 1.0, "base_mem": 200 * MB, "mem": 40 * MB},
+}
+
+# ffmpeg 기본 스레드 (x264는 1080p에서 8~16 스레드 이후 효율이 크게 떨어짐)
+FFMPEG_THREADS = min(8, os.cpu_count() or 1)
+
+POLL_INTERVAL = 0.5
+CPU_SAMPLE_WINDOW = 0.1
+
+
+def _meminfo() -> Dict[str, int]:
+    """/proc/meminfo (Linux) → {total, available} 바이트"""
+    values = {}
+    try:
+        with open("/proc/meminfo") as f:
+            for line in f:
+                key, _, rest = line.partition(":")
+                if key in ("MemTotal", "MemAvailable"):
+                    values[key] = int(rest.split()[0]) * 1024
+    except (OSError, ValueError):
+        pass
+    return {"total": values.get("MemTotal", 0), "available": values.get("MemAvailable", 0)}
+
+
+def _proc_stat() -> Optional[tuple]:
+    """/proc/stat 첫 줄 → (idle, total) jiffies"""
+    try:
+        with open("/proc/stat") as f:
+            fields = [int(v) for v in f.readline().split()[1:]]
+    except (OSError, ValueError):
+        return None
+    return fields[3] + fields[4], sum(fields)
+
+
+def cpu_busy(window: float = CPU_SAMPLE_WINDOW) -> Optional[float]:
+    """최근 window초 동안 사용 중인 코어 수
+
+    loadavg는 1분 평균이라 방금 끝난 작업의 부하가 남아 있으므로 짧은 구간을 직접 측정합니다.
+    """
+    cpus = os.cpu_count() or 1
+    if PSUTIL_AVAILABLE:
+        return psutil.cpu_percent(interval=window) / 100.0 * cpus
+    before = _proc_stat()
+    if before is None:
+        return None
+    time.sleep(window)
+    after = _proc_stat()
+    total = after[1] - before[1]
+    if total <= 0:
+        return 0.0
+    return (1.0 - (after[0] - before[0]) / total) * cpus
+
+
+def live_usage() -> Dict[str, float]:
+    """{busy_cpus, mem_total, mem_available} (측정할 수 없는 값은 0)"""
+    busy = cpu_busy()
+    if busy is None:
+        try:
+            busy = min(float(os.cpu_count() or 1), os.getloadavg()[0])
+        except (OSError, AttributeError):
+            busy = 0.0
+
+    if PSUTIL_AVAILABLE:
+        vm = psutil.virtual_memory()
+        return {"busy_cpus": busy, "mem_total": vm.total, "mem_available": vm.available}
+    mem = _meminfo()
+    return {"busy_cpus": busy, "mem_total": mem["total"], "mem_available": mem["available"]}
+
+
+def job_cost(job_type: str, size: int) -> Dict[str, float]:
+    cost = JOB_COSTS[job_type]
+    return {"cpu": cost["base_cpu"] + cost["cpu"] * size, "mem": cost["base_mem"] + cost["mem"] * size}
+
+
+class ResourceGovernor:
+    """프로세스 전체에서 공유하는 작업 허용기 (스레드 안전)"""
+
+    def __init__(self, cpus: Optional[int] = None, cpu_target: Optional[float] = None,
+                 mem_reserve: Optional[int] = None, enabled: Optional[bool] = None):
+        self.cpus = cpus or os.cpu_count() or 1
+        self.cpu_target = cpu_target if cpu_target is not None else float(os.environ.get("PIPELINE_CPU_TARGET", 0.9))
+        self.mem_reserve = mem_reserve if mem_reserve is not None else parse_size(
+            os.environ.get("PIPELINE_MEM_RESERVE", "2G"))
+        self.enabled = enabled if enabled is not None else os.environ.get("PIPELINE_GOVERNOR") != "0"
+        self._cond = threading.Condition()
+        self._running: Dict[int, Dict] = {}
+        self._next_id = 0
+        self._sample: Optional[tuple] = None    # (측정 시각, live_usage) - POLL_INTERVAL 동안 재사용
+        self.stats = {"admitted": 0, "delayed": 0, "shrunk": 0}
+
+    # --------------------------------------------------------
+    # 허용 판단
+    # --------------------------------------------------------
+    def _declared(self) -> Dict[str, float]:
+        return {
+            "cpu": sum(g["cpu"] for g in self._running.values()),
+            "mem": sum(g["mem"] for g in self._running.values()),
+        }
+
+    def _live(self) -> Dict[str, float]:
+        """live_usage (CPU 측정에 0.1초 걸리므로 POLL_INTERVAL 동안 재사용, 잠금 밖에서 호출)"""
+        sample = self._sample
+        if sample is not None and time.monotonic() - sample[0] < POLL_INTERVAL:
+            return sample[1]
+        live = live_usage()
+        self._sample = (time.monotonic(), live)
+        return live
+
+    def fit(self, job_type: str, want: int, min_size: int = 1,
+            live: Optional[Dict[str, float]] = None) -> int:
+        """지금 허용 가능한 크기 (min_size 미만이면 0)
+
+        live를 생략하면 여기서 측정하므로 self._cond를 잡은 상태에서는 미리 측정한 값을 넘깁니다.
+        """
+        if not self.enabled:
+            return want
+        live = live or self._live()
+        declared = self._declared()
+        cost = JOB_COSTS[job_type]
+
+        free_cpu = self.cpus * self.cpu_target - max(declared["cpu"], live["busy_cpus"])
+        size_by_cpu = int((free_cpu - cost["base_cpu"]) // cost["cpu"]) if cost["cpu"] else want
+
+        size_by_mem = want
+        if live["mem_total"]:
+            free_mem = min(live["mem_total"] - declared["mem"], live["mem_available"]) - self.mem_reserve
+            size_by_mem = int((free_mem - cost["base_mem"]) // cost["mem"]) if cost["mem"] else want
+
+        size = min(want, size_by_cpu, size_by_mem)
+        return size if size >= min_size else 0
+
+    def acquire(self, job_type: str, want: int, min_size: int = 1, label: str = "") -> Dict:
+        """허용될 때까지 대기 → grant {id, type, size, cpu, mem, waited}"""
+        started = time.monotonic()
+        delayed = False
+        while True:
+            # 실시간 측정(0.1초)은 잠금 밖에서 - 다른 acquire/release가 측정을 기다리지 않도록
+            live = self._live() if self.enabled else None
+            with self._cond:
+                size = self.fit(job_type, want, min_size, live)
+                if size == 0 and not self._running:
+                    size = min_size    # 혼자 실행해도 부족 → 최소 크기로 진행 (교착 방지)
+                if size:
+                    # 판단과 등록을 같은 잠금 안에서 (다른 스레드가 사이에 끼어 초과 허용하지 않도록)
+                    self._next_id += 1
+                    grant = {"id": self._next_id, "type": job_type, "size": size,
+                             "waited": round(time.monotonic() - started, 2), **job_cost(job_type, size)}
+                    self._running[grant["id"]] = grant
+                    self.stats["admitted"] += 1
+                    if size < want:
+                        self.stats["shrunk"] += 1
+                        print(f"  [GOVERNOR] {label or job_type} 크기 축소 {want} → {size}")
+                    return grant
+                if not delayed:
+                    delayed = True
+                    self.stats["delayed"] += 1
+                    print(f"  [GOVERNOR] {label or job_type} 대기 (CPU/메모리 여유 부족)")
+                self._cond.wait(POLL_INTERVAL)
+
+    def release(self, grant: Dict):
+        with self._cond:
+            self._running.pop(grant["id"], None)
+            self._cond.notify_all()
+
+    @contextmanager
+    def job(self, job_type: str, want: int, min_size: int = 1, label: str = ""):
+        grant = self.acquire(job_type, want, min_size, label)
+        try:
+            yield grant
+        finally:
+            self.release(grant)
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+Stage Ledger - 씬/스테이지 단위 작업 기록 (SQLite)
+
+state.json은 phase/current_step만 기록하므로, 렌더 배치가 중간에 죽으면
+어디까지 끝났는지 파일 존재 여부로만 추측해야 했습니다.
+ledger는 (stage, unit)마다 상태, 입력 fingerprint, 출력 경로, 소요 시간, 오류를 기록합니다.
+
+스테이지:
+    tts, whisper        unit = 섹션
+    timing              unit = 씬
+    render, composite   unit = 씬
+    section-merge       unit = 섹션
+    final               unit = "final"
+
+사용법:
+    ledger = StageLedger(OUTPUT_DIR / "ledger.db")
+    if ledger.is_done("render", "s3", fingerprint):
+        ...  # 스킵
+    with ledger.track("render", "s3", fingerprint, output_path) as entry:
+        ...  # 실패 시 entry.fail("메시지") 또는 예외 → failed 기록
+"""
+
+import hashlib
+import os
+import sqlite3
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+
+STAGES = ["tts", "whisper", "timing", "render", "composite", "section-merge", "final"]
+
+STATUS_PENDING = "pending"
+STATUS_RUNNING = "running"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_FORCED = "forced"      # 명시적 초기화 (ledger --reset) - 빌드 캐시 복원 없이 다시 실행
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    stage        TEXT NOT NULL,
+    unit         TEXT NOT NULL,
+    status       TEXT NOT NULL,
+    fingerprint  TEXT,
+    output_path  TEXT,
+    started_at   TEXT,
+    finished_at  TEXT,
+    duration     REAL,
+    error        TEXT,
+    PRIMARY KEY (stage, unit)
+);
+CREATE INDEX IF NOT EXISTS idx_entries_status ON entries(stage, status);
+"""
+
+
+def fingerprint_files(paths: Iterable[Path], *extra: object) -> str:
+    """입력 파일들의 (경로, mtime, size) + 추가 인자로 fingerprint 생성
+
+    내용 해시가 아닌 stat 기반이므로 수천 개 파일도 밀리초 단위로 계산됩니다.
+    """
+    h = hashlib.sha1()
+    for path in paths:
+        path = Path(path)
+        try:
+            st = os.stat(path)
+            h.update(f"{path.name}:{st.st_mtime_ns}:{st.st_size};".encode("utf-8"))
+        except OSError:
+            h.update(f"{path.name}:missing;".encode("utf-8"))
+    for value in extra:
+        h.update(f"{value!r};".encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+class _Tracked:
+    """track() 컨텍스트 안에서 실패를 명시적으로 기록하기 위한 핸들"""
+
+    def __init__(self):
+        self.error: Optional[str] = None
+
+    def fail(self, error: str):
+        self.error = error
+
+
+class StageLedger:
+    """스테이지별 작업 기록"""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    # --------------------------------------------------------
+    # 기록
+    # --------------------------------------------------------
+    def begin(self, stage: str, unit: str, fingerprint: Optional[str] = None,
+              output_path: Optional[Path] = None):
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries(stage, unit, status, fingerprint, output_path, "
+                "started_at, finished_at, duration, error) VALUES (?, ?, ?, ?, ?, ?, NULL, NULL, NULL)",
+                (stage, unit, STATUS_RUNNING, fingerprint,
+                 str(output_path) if output_path else None, datetime.now().isoformat())
+            )
+
+    def finish(self, stage: str, unit: str, duration: Optional[float] = None,
+               error: Optional[str] = None):
+        status = STATUS_FAILED if error else STATUS_DONE
+        with self.conn:
+            self.conn.execute(
+                "UPDATE entries SET status = ?, finished_at = ?, duration = ?, error = ? "
+                "WHERE stage = ? AND unit = ?",
+                (status, datetime.now().isoformat(), duration, error, stage, unit)
+            )
+
+    def mark_done(self, stage: str, unit: str, fingerprint: Optional[str] = None,
+                  output_path: Optional[Path] = None, duration: Optional[float] = None):
+        """기존 산출물을 완료로 등록 (ledger 도입 이전 프로젝트 호환)"""
+        now = datetime.now().isoformat()
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries(stage, unit, status, fingerprint, output_path, "
+                "started_at, finished_at, duration, error) VALUES (?, ?, ?, ?, ?, ?, ?, ?, NULL)",
+                (stage, unit, STATUS_DONE, fingerprint,
+                 str(output_path) if output_path else None, now, now, duration)
+            )
+
+    def mark_pending(self, stage: str, unit: str):
+        """다시 실행해야 함으로 표시 (기록이 없어도 생성 - 기존 출력 파일을 완료로 오인하지 않도록)"""
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO entries(stage, unit, status) VALUES (?, ?, ?) "
+                "ON CONFLICT(stage, unit) DO UPDATE SET status = excluded.status",
+                (stage, unit, STATUS_PENDING)
+            )
+
+    def track(self, stage: str, unit: str, fingerprint: Optional[str] = None,
+              output_path: Optional[Path] = None):
+        """begin/finish를 감싸는 컨텍스트 매니저"""
+        ledger = self
+
+        class _Context:
+            def __enter__(self):
+                self.started = time.monotonic()
+                self.handle = _Tracked()
+                ledger.begin(stage, unit, fingerprint, output_path)
+                return self.handle
+
+            def __exit__(self, exc_type, exc, tb):
+                error = self.handle.error
+                if exc_type is not None:
+                    error = f"{exc_type.__name__}: {exc}"
+                ledger.finish(stage, unit, time.monotonic() - self.started, error)
+                return False
+
+        return _Context()
+
+    def reset(self, stage: Optional[str] = None, unit: Optional[str] = None, force: bool = False) -> int:
+        """다시 실행하도록 pending 표시 (stage/unit 생략 시 전체)
+
+        기록을 지우지 않고 pending으로 남겨야 기존 출력 파일이 있어도 재실행됩니다.
+        force=True면 forced로 표시 - 같은 입력 key가 빌드 캐시에 있어도 복원하지 않고 다시 실행합니다.
+        """
+        query, params = "UPDATE entries SET status = ?", [STATUS_FORCED if force else STATUS_PENDING]
+        conditions = []
+        if stage:
+            conditions.append("stage = ?")
+            params.append(stage)
+        if unit:
+            conditions.append("unit = ?")
+            params.append(unit)
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self.conn:
+            return self.conn.execute(query, params).rowcount
+
+    # --------------------------------------------------------
+    # 조회
+    # --------------------------------------------------------
+    def get(self, stage: str, unit: str) -> Optional[Dict]:
+        row = self.conn.execute(
+            "SELECT * FROM entries WHERE stage = ? AND unit = ?", (stage, unit)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def is_done(self, stage: str, unit: str, fingerprint: Optional[str] = None) -> bool:
+        """완료 여부 (fingerprint를 주면 입력이 같을 때만 완료로 판단)"""
+        entry = self.get(stage, unit)
+        if not entry or entry["status"] != STATUS_DONE:
+            return False
+        if fingerprint is not None and entry["fingerprint"] not in (None, fingerprint):
+            return False
+        return True
+
+    def has_entry(self, stage: str, unit: str) -> bool:
+        return self.get(stage, unit) is not None
+
+    def pending(self, stage: str, units: List[str]) -> List[str]:
+        """완료되지 않은 unit 목록 (입력 순서 유지)"""
+        done = {
+            row["unit"] for row in self.conn.execute(
+                "SELECT unit FROM entries WHERE stage = ? AND status = ?", (stage, STATUS_DONE)
+            )
+        }
+        return [u for u in units if u not in done]
+
+    def entries(self, stage: Optional[str] = None) -> List[Dict]:
+        if stage:
+            rows = self.conn.execute("SELECT * FROM entries WHERE stage = ? ORDER BY unit", (stage,))
+        else:
+            rows = self.conn.execute("SELECT * FROM entries ORDER BY stage, unit")
+        return [dict(r) for r in rows]
+
+    def summary(self) -> Dict[str, Dict[str, int]]:
+        """{stage: {status: count}}"""
+        result: Dict[str, Dict[str, int]] = {}
+        for row in self.conn.execute(
+            "SELECT stage, status, COUNT(*) AS n FROM entries GROUP BY stage, status"
+        ):
+            result.setdefault(row["stage"], {})[row["status"]] = row["n"]
+        return result
+
+    def progress_line(self, stage: str, units: List[str]) -> str:
+        """"render: 12/40 done, 1 failed" 형식 진행률"""
+        statuses = {
+            row["unit"]: row["status"] for row in self.conn.execute(
+                "SELECT unit, status FROM entries WHERE stage = ?", (stage,)
+            )
+        }
+        done = sum(1 for u in units if statuses.get(u) == STATUS_DONE)
+        failed = sum(1 for u in units if statuses.get(u) == STATUS_FAILED)
+        line = f"{stage}: {done}/{len(units)} done"
+        if failed:
+            line += f", {failed} failed"
+        return line
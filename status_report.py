@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Status Report - 씬 × 스테이지 산출물 매트릭스
+
+출력 폴더마다 os.scandir를 한 번만 돌려 (이름 → 크기, mtime) 맵을 만들고,
+씬별로 script / timed / srt / tsx / raw / composite / section / final 존재 여부,
+크기, 그리고 상위 산출물보다 오래된(stale) 파일인지 판단합니다.
+1000개 씬 프로젝트도 수십 ms 안에 끝납니다.
+
+stale 판단 (상위 산출물보다 mtime이 이전이면 stale):
+    timed, srt, tsx   ← script
+    raw               ← tsx, timed  (합성 후 정리된 투명 렌더는 완료로 표시)
+    composite         ← raw (투명 렌더) 또는 tsx, timed (배경 포함 렌더)
+    section           ← 섹션의 모든 composite
+    final             ← 모든 section
+
+사용법:
+    scanner = StatusScanner({"scripts": SCRIPTS_DIR, ...})
+    report = build_report(scanner, PROJECT)
+    print_matrix(report)
+"""
+
+import os
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from project_index import ProjectIndex
+
+
+# (크기, mtime_ns)
+FileInfo = Tuple[int, int]
+
+# 매트릭스 열 순서
+ARTIFACTS = ["script", "timed", "srt", "tsx", "raw", "composite", "section", "final"]
+
+# 산출물 → (폴더 키, 파일명 패턴)
+ARTIFACT_FILES = {
+    "script": ("scripts", "{scene}.json"),
+    "timed": ("audio", "{scene}_timed.json"),
+    "srt": ("audio", "{scene}.srt"),
+    "tsx": ("scenes", "{comp}.tsx"),
+    "raw": ("renders", "{scene}_raw.webm"),
+    "composite": ("composite", "{scene}.mp4"),
+    "section": ("sections", "section_{section}.mp4"),
+    "final": ("output", "final_video.mp4"),
+}
+
+UPSTREAM = {
+    "timed": ["script"],
+    "srt": ["script"],
+    "tsx": ["script"],
+    "raw": ["tsx", "timed"],
+}
+
+SYMBOLS = {"ok": "●", "stale": "!", "missing": "·"}
+
+
+class StatusScanner:
+    """폴더별 scandir (폴더당 한 번 → 이름: (크기, mtime))"""
+
+    def __init__(self, dirs: Dict[str, Path]):
+        self.dirs = {key: Path(path) for key, path in dirs.items()}
+
+    def scan(self, key: str) -> Dict[str, FileInfo]:
+        files: Dict[str, FileInfo] = {}
+        try:
+            with os.scandir(self.dirs[key]) as it:
+                for entry in it:
+                    try:
+                        if entry.is_file():
+                            st = entry.stat()
+                            files[entry.name] = (st.st_size, st.st_mtime_ns)
+                    except OSError:
+                        continue
+        except OSError:
+            return {}
+        return files
+
+    def scan_all(self) -> Dict[str, Dict[str, FileInfo]]:
+        return {key: self.scan(key) for key in self.dirs}
+
+
+def _cell(info: Optional[FileInfo], upstream: List[Optional[FileInfo]]) -> Dict:
+    if info is None:
+        return {"status": "missing", "size": 0, "mtime": None}
+    newest_input = max((u[1] for u in upstream if u is not None), default=None)
+    stale = newest_input is not None and info[1] < newest_input
+    return {
+        "status": "stale" if stale else "ok",
+        "size": info[0],
+        "mtime": datetime.fromtimestamp(info[1] / 1e9).isoformat(timespec="seconds"),
+    }
+
+
+def build_report(scanner: StatusScanner, index: ProjectIndex, section: Optional[str] = None,
+                 raw_consumed: Optional[Callable[[str], bool]] = None) -> Dict:
+    """씬 × 스테이지 매트릭스 생성
+
+    Args:
+        raw_consumed: 씬 ID → 투명 렌더가 합성에 사용된 뒤 정리되었는지 (Intermediates.consumed).
+            정리된 투명 렌더는 파일이 없어도 완료로 표시합니다.
+    """
+    started = time.perf_counter()
+    files = scanner.scan_all()
+
+    def lookup(artifact: str, scene: str = "", section_name: str = "") -> Optional[FileInfo]:
+        dir_key, pattern = ARTIFACT_FILES[artifact]
+        name = pattern.format(scene=scene, comp=scene.upper(), section=section_name)
+        return files.get(dir_key, {}).get(name)
+
+    sections = [section] if section else index.sections()
+    scenes = []
+    section_inputs: Dict[str, List[Optional[FileInfo]]] = {}
+
+    for sec in sections:
+        for scene_id in index.section_scenes(sec):
+            info = {artifact: lookup(artifact, scene_id) for artifact in ARTIFACT_FILES
+                    if artifact not in ("section", "final")}
+            composite_inputs = [info["raw"]] if info["raw"] else [info["tsx"], info["timed"]]
+            cells = {
+                artifact: _cell(info[artifact], [info[u] for u in UPSTREAM.get(artifact, [])])
+                for artifact in ("script", "timed", "srt", "tsx", "raw")
+            }
+            if info["raw"] is None and raw_consumed and raw_consumed(scene_id):
+                cells["raw"] = {"status": "ok", "size": 0, "mtime": None, "consumed": True}
+            cells["composite"] = _cell(info["composite"], composite_inputs)
+            section_inputs.setdefault(sec, []).append(info["composite"])
+            scenes.append({"scene_id": scene_id, "section": sec, "artifacts": cells})
+
+    section_cells = {
+        sec: _cell(lookup("section", section_name=sec), section_inputs.get(sec, []))
+        for sec in sections
+    }
+    for scene in scenes:
+        scene["artifacts"]["section"] = section_cells[scene["section"]]
+
+    final_cell = _cell(lookup("final"), [lookup("section", section_name=sec) for sec in index.sections()])
+    for scene in scenes:
+        scene["artifacts"]["final"] = final_cell
+
+    totals = {}
+    for artifact in ARTIFACTS:
+        if artifact == "section":
+            cells = list(section_cells.values())
+        elif artifact == "final":
+            cells = [final_cell]
+        else:
+            cells = [scene["artifacts"][artifact] for scene in scenes]
+        totals[artifact] = {
+            "ok": sum(1 for c in cells if c["status"] == "ok"),
+            "stale": sum(1 for c in cells if c["status"] == "stale"),
+            "missing": sum(1 for c in cells if c["status"] == "missing"),
+            "bytes": sum(c["size"] for c in cells),
+        }
+
+    return {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "artifacts": ARTIFACTS,
+        "scenes": scenes,
+        "sections": section_cells,
+        "final": final_cell,
+        "totals": totals,
+        "elapsed": round(time.perf_counter() - started, 4),
+    }
+
+
+def _format_size(size: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f}{unit}" if unit == "B" else f"{size:.1f}{unit}"
+        size /= 1024
+    return f"{size}"
+
+
+def print_matrix(report: Dict, problems_only: bool = False):
+    """매트릭스 출력 (● 있음, ! stale, · 없음)"""
+    header = f"  {'scene':<8}{'section':<12}" + "".join(f"{a:>10}" for a in ARTIFACTS)
+    print(header)
+    print("  " + "-" * (len(header) - 2))
+
+    for scene in report["scenes"]:
+        cells = scene["artifacts"]
+        if problems_only and all(cells[a]["status"] == "ok" for a in ARTIFACTS):
+            continue
+        row = "".join(f"{SYMBOLS[cells[a]['status']]:>10}" for a in ARTIFACTS)
+        print(f"  {scene['scene_id']:<8}{scene['section']:<12}{row}")
+
+    print("  " + "-" * (len(header) - 2))
+    totals = report["totals"]
+    for label, key in (("ok", "ok"), ("stale", "stale"), ("missing", "missing")):
+        print(f"  {label:<20}" + "".join(f"{totals[a][key]:>10}" for a in ARTIFACTS))
+    print(f"  {'size':<20}" + "".join(f"{_format_size(totals[a]['bytes']):>10}" for a in ARTIFACTS))
+    print(f"\n  ● 있음  ! 상위 산출물보다 오래됨  · 없음   ({report['elapsed'] * 1000:.0f}ms)")
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Timeline - 프레임 단위 프로젝트 타임라인
+
+update-root, section-merge, final이 각자 초 단위로 타이밍을 다시 계산하면서
+(int(duration * 30) + 1, section_start/section_end 쌍 비교, 고정 section_gap)
+반올림 오차가 누적되고, duration 위치가 다른 타이밍 파일(scene-splitter 형식)은
+기본값 10초로 렌더되는 문제가 있었습니다.
+
+Timeline은 모든 s{n}_timed.json을 한 번 읽어 씬 시작/끝을 **섹션 기준 절대 프레임**으로
+반올림합니다. 씬 길이는 (끝 프레임 - 시작 프레임)이므로 씬 길이의 합이 섹션 길이와
+정확히 일치하고 오차가 누적되지 않습니다.
+
+지원하는 타이밍 형식:
+    srt-timing       {"section_start", "section_end", "duration", ...}
+    scene-splitter   {"timing": {"scene_start", "scene_end", "duration"}, ...}
+
+사용법:
+    timeline = Timeline.build(PROJECT, section_gap=1.0)
+    timeline.duration_frames("s3")       # Root.tsx durationInFrames
+    timeline.gap_frames("s3")            # s3 뒤 무음 구간 (마지막 프레임 유지)
+    timeline.section_offset("core1")     # 최종 영상 내 섹션 시작 프레임
+    timeline.audio_offset_samples("s3")  # 최종 영상 내 씬 시작 (오디오 샘플)
+"""
+
+import array
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from project_index import ProjectIndex
+
+
+FPS = 30
+SAMPLE_RATE = 48000          # 최종 AAC 오디오 샘플레이트 (48000 / 30 = 프레임당 1600 샘플)
+DEFAULT_DURATION = 10.0      # 타이밍 파일이 없는 씬
+
+
+def _int_array(values: List[int]):
+    """int64 배열 (NumPy 없으면 array.array)"""
+    if NUMPY_AVAILABLE:
+        return np.asarray(values, dtype=np.int64)
+    return array.array("q", values)
+
+
+def scene_bounds(timed: Dict) -> Tuple[Optional[float], Optional[float], Optional[float]]:
+    """타이밍 파일 → (섹션 내 시작 초, 끝 초, duration) - 없는 값은 None"""
+    timing = timed.get("timing") or {}
+    start = timed.get("section_start", timing.get("scene_start"))
+    end = timed.get("section_end", timing.get("scene_end"))
+    duration = timed.get("duration", timing.get("duration"))
+    return start, end, duration
+
+
+class Timeline:
+    """씬/섹션 프레임 타임라인 (불변)
+
+    배열 (씬 순서, 길이 = 씬 수):
+        start_frames, end_frames   섹션 오디오 기준 씬 시작/끝 프레임
+        gap_frames                 다음 씬 시작까지 빈 프레임 (섹션 마지막 씬은 0)
+    섹션 배열 (길이 = 섹션 수):
+        section_frames             섹션 영상 길이 (씬 + gap)
+        section_offsets            최종 영상 내 섹션 시작 프레임 (section_gap 포함)
+    """
+
+    def __init__(self, scene_ids: List[str], scene_sections: List[str], sections: List[str],
+                 start_frames: List[int], end_frames: List[int], gap_frames: List[int],
+                 section_gap_frames: int = 0, missing: Optional[List[str]] = None,
+                 fps: int = FPS, sample_rate: int = SAMPLE_RATE):
+        self.fps = fps
+        self.sample_rate = sample_rate
+        self.scene_ids = list(scene_ids)
+        self.scene_sections = list(scene_sections)
+        self.sections = list(sections)
+        self.section_gap_frames = section_gap_frames
+        self.missing = list(missing or [])
+
+        self.start_frames = _int_array(start_frames)
+        self.end_frames = _int_array(end_frames)
+        self.gap_frames_arr = _int_array(gap_frames)
+
+        self._scene_index = {scene_id: i for i, scene_id in enumerate(self.scene_ids)}
+        self._section_index = {section: i for i, section in enumerate(self.sections)}
+
+        section_frames = [0] * len(self.sections)
+        for i, section in enumerate(self.scene_sections):
+            section_frames[self._section_index[section]] += end_frames[i] - start_frames[i] + gap_frames[i]
+
+        offsets, offset = [], 0
+        for frames in section_frames:
+            offsets.append(offset)
+            offset += frames + section_gap_frames
+        self.section_frames = _int_array(section_frames)
+        self.section_offsets = _int_array(offsets)
+        self.total_frames = offset
+
+        # 섹션 영상 안에서 씬 시작 프레임 (첫 씬 앞 무음은 섹션 영상에 포함되지 않음)
+        in_section, cursor = [], {}
+        for i, section in enumerate(self.scene_sections):
+            position = cursor.get(section, 0)
+            in_section.append(position)
+            cursor[section] = position + end_frames[i] - start_frames[i] + gap_frames[i]
+        self.section_positions = _int_array(in_section)
+
+    # --------------------------------------------------------
+    # 생성
+    # --------------------------------------------------------
+    @classmethod
+    def build(cls, index: ProjectIndex, section_gap: float = 0.0, fps: int = FPS,
+              sample_rate: int = SAMPLE_RATE, default_duration: float = DEFAULT_DURATION) -> "Timeline":
+        """프로젝트 인덱스의 모든 타이밍 파일로 타임라인 구성"""
+        scene_ids, scene_sections, sections = [], [], []
+        starts, ends, gaps, missing = [], [], [], []
+
+        for section in index.sections():
+            section_scenes = index.section_scenes(section)
+            if not section_scenes:
+                continue
+            sections.append(section)
+
+            cursor = 0.0  # 시작 시간이 없는 씬은 이전 씬 끝에 이어 붙임
+            first = len(starts)
+            for scene_id in section_scenes:
+                timed = index.timed(scene_id)
+                start = end = duration = None
+                if timed is not None:
+                    start, end, duration = scene_bounds(timed)
+                else:
+                    missing.append(scene_id)
+
+                if start is None:
+                    start = cursor
+                if end is None:
+                    end = start + (duration if duration else default_duration)
+
+                start_frame = round(start * fps)
+                end_frame = max(start_frame + 1, round(end * fps))
+                scene_ids.append(scene_id)
+                scene_sections.append(section)
+                starts.append(start_frame)
+                ends.append(end_frame)
+                cursor = end
+
+            # gap = 다음 씬 시작 - 현재 씬 끝 (겹치면 0)
+            for i in range(first, len(starts)):
+                gaps.append(max(0, starts[i + 1] - ends[i]) if i + 1 < len(starts) else 0)
+
+        return cls(scene_ids, scene_sections, sections, starts, ends, gaps,
+                   section_gap_frames=round(section_gap * fps), missing=missing,
+                   fps=fps, sample_rate=sample_rate)
+
+    # --------------------------------------------------------
+    # 조회
+    # --------------------------------------------------------
+    def __contains__(self, scene_id: str) -> bool:
+        return scene_id.lower() in self._scene_index
+
+    def __len__(self) -> int:
+        return len(self.scene_ids)
+
+    def _i(self, scene_id: str) -> int:
+        return self._scene_index[scene_id.lower()]
+
+    def duration_frames(self, scene_id: str) -> int:
+        """씬 컴포지션 길이 (프레임)"""
+        i = self._i(scene_id)
+        return int(self.end_frames[i] - self.start_frames[i])
+
+    def gap_frames(self, scene_id: str) -> int:
+        """씬 뒤에 마지막 프레임으로 채울 프레임 수"""
+        return int(self.gap_frames_arr[self._i(scene_id)])
+
+    def section_length(self, section: str) -> int:
+        """섹션 영상 길이 (프레임)"""
+        return int(self.section_frames[self._section_index[section]])
+
+    def section_offset(self, section: str) -> int:
+        """최종 영상 내 섹션 시작 프레임"""
+        return int(self.section_offsets[self._section_index[section]])
+
+    def scene_offset(self, scene_id: str) -> int:
+        """최종 영상 내 씬 시작 프레임"""
+        i = self._i(scene_id)
+        return self.section_offset(self.scene_sections[i]) + int(self.section_positions[i])
+
+    def audio_offset_samples(self, scene_id: str) -> int:
+        """최종 영상 내 씬 시작 (오디오 샘플 단위, 정수 - 프레임당 sample_rate / fps)"""
+        return self.scene_offset(scene_id) * self.sample_rate // self.fps
+
+    def seconds(self, frames: int) -> float:
+        return frames / self.fps
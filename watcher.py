@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Watcher - 폴더 변경 감지 (polling + debounce)
+
+외부 의존성 없이 os.scandir 스냅샷을 주기적으로 비교합니다.
+변경이 감지되면 debounce 시간 동안 추가 변경이 없을 때까지 기다렸다가
+(에디터 저장, 에이전트의 연속 쓰기를 한 번에 묶기 위해) 변경된 경로 묶음을 반환합니다.
+
+사용법:
+    watcher = Watcher([REMOTION_SCENES_DIR, SCRIPTS_DIR], interval=0.5, debounce=1.0)
+    while True:
+        changed = watcher.wait()      # Set[Path] (추가/수정/삭제)
+        ...                           # 재빌드
+        watcher.rebase(written)       # 재빌드 중 파이프라인이 쓴 파일만 기준에 반영
+                                      # (재빌드 중 사용자가 고친 파일은 다음 wait()에서 감지)
+"""
+
+import fnmatch
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+# (mtime_ns, size)
+Snapshot = Dict[str, Tuple[int, int]]
+
+# 편집기 임시 파일, 원자적 쓰기 임시 파일, 잠금 파일
+DEFAULT_IGNORE = ["*.tmp", "*.swp", "*~", ".#*", "*.lock", ".DS_Store", "__pycache__"]
+
+
+def take_snapshot(roots: Iterable[Path], ignore: List[str]) -> Snapshot:
+    """roots 아래 모든 파일의 (mtime, size) - 재귀 scandir"""
+    snapshot: Snapshot = {}
+    stack = [str(root) for root in roots]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if any(fnmatch.fnmatch(entry.name, pattern) for pattern in ignore):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        else:
+                            st = entry.stat()
+                            snapshot[entry.path] = (st.st_mtime_ns, st.st_size)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+    return snapshot
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> Set[Path]:
+    """추가/수정/삭제된 경로"""
+    changed = {path for path, sig in new.items() if old.get(path) != sig}
+    changed.update(path for path in old if path not in new)
+    return {Path(p) for p in changed}
+
+
+class Watcher:
+    """polling 기반 변경 감지"""
+
+    def __init__(self, roots: Iterable[Path], interval: float = 0.5, debounce: float = 1.0,
+                 ignore: Optional[List[str]] = None):
+        self.roots = [Path(r) for r in roots]
+        self.interval = interval
+        self.debounce = debounce
+        self.ignore = DEFAULT_IGNORE + list(ignore or [])
+        self._snapshot = take_snapshot(self.roots, self.ignore)
+
+    def poll(self) -> Set[Path]:
+        """마지막 기준 이후 변경된 경로 (기준은 갱신하지 않음)"""
+        return diff_snapshots(self._snapshot, take_snapshot(self.roots, self.ignore))
+
+    def rebase(self, paths: Optional[Iterable[Path]] = None):
+        """기준 갱신 - paths만 현재 상태로 (재빌드가 쓴 파일), 생략하면 전체 다시 스냅샷"""
+        if paths is None:
+            self._snapshot = take_snapshot(self.roots, self.ignore)
+            return
+        for path in paths:
+            path = Path(path)
+            if not any(root == parent for parent in path.parents for root in self.roots):
+                continue
+            if any(fnmatch.fnmatch(path.name, pattern) for pattern in self.ignore):
+                continue
+            try:
+                st = os.stat(path)
+                self._snapshot[str(path)] = (st.st_mtime_ns, st.st_size)
+            except OSError:
+                self._snapshot.pop(str(path), None)
+
+    def wait(self) -> Set[Path]:
+        """변경이 생기고 debounce 동안 잠잠해질 때까지 대기 후 변경 묶음 반환"""
+        changed: Set[Path] = set()
+        last_change = None
+        previous = self._snapshot
+        while True:
+            time.sleep(self.interval)
+            current = take_snapshot(self.roots, self.ignore)
+            delta = diff_snapshots(previous, current)
+            previous = current
+            if delta:
+                changed |= delta
+                last_change = time.monotonic()
+            elif changed and time.monotonic() - last_change >= self.debounce:
+                # 기준 대비 최종 차이 (저장 후 원복한 파일은 제외됨)
+                changed = diff_snapshots(self._snapshot, current)
+                self._snapshot = current
+                if changed:
+                    return changed
+                last_change = None
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Whisper Words - 단어 타임스탬프 컬럼 저장 (메모리 매핑)
+
+{section}_whisper.json의 words는 {word, start, end} dict 리스트라
+1시간 분량이면 섹션마다 수만 개의 dict를 만들고 반복 순회하게 됩니다.
+이 모듈은 같은 데이터를 {section}_whisper.wcol 한 파일에 컬럼 형태로 저장합니다.
+
+파일 형식 (리틀 엔디언):
+    0   magic    b"WCOL1\\0\\0\\0"
+    8   uint64   n (단어 수)
+    16  uint64   blob_len (UTF-8 단어 바이트 수)
+    24  float32  start[n]
+        float32  end[n]
+        uint32   offsets[n + 1]   (blob 내 단어 i = blob[offsets[i]:offsets[i+1]])
+        bytes    blob
+
+사용법:
+    words = load_section_words(AUDIO_DIR, "hook")   # .wcol 우선, 없으면 JSON에서 생성
+    words.start[-1], words.end[-1]                  # NumPy float32 (읽기 전용 memmap)
+    seconds(words.end[-1])                          # JSON에 쓸 값 (float32 오차 제거)
+    words.word(3), words.normalized(normalize_text)
+"""
+
+import array
+import struct
+import sys
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from json_io import atomic_write_bytes, read_json
+
+
+MAGIC = b"WCOL1\0\0\0"
+HEADER = struct.Struct("<8sQQ")
+FLOAT32 = struct.Struct("<f")
+
+
+def seconds(value) -> float:
+    """float32 타임스탬프 → Python float (원래 JSON 값)
+
+    float32로 저장된 12.34는 그대로 float()하면 12.34000015258789가 되어 타이밍 JSON에 새어 나가므로,
+    같은 float32로 돌아가는 가장 짧은 10진수를 사용합니다 (Whisper 값은 소수 2~3자리).
+    """
+    exact = float(value)
+    packed = FLOAT32.pack(exact)
+    for digits in range(6, 10):
+        short = float(f"{exact:.{digits}g}")
+        if FLOAT32.pack(short) == packed:
+            return short
+    return exact
+
+
+class WhisperWords:
+    """단어 타임스탬프 읽기 전용 뷰
+
+    start/end: float32 배열 (NumPy 있으면 memmap 뷰, 없으면 array.array)
+    """
+
+    def __init__(self, start, end, offsets, blob):
+        self.start = start
+        self.end = end
+        self._offsets = offsets
+        self._blob = blob
+        self._normalized: Optional[List[str]] = None
+        self._normalizer: Optional[Callable[[str], str]] = None
+
+    def __len__(self) -> int:
+        return len(self.start)
+
+    def word(self, i: int) -> str:
+        if i < 0:
+            i += len(self)
+        return bytes(self._blob[int(self._offsets[i]):int(self._offsets[i + 1])]).decode("utf-8")
+
+    def words(self) -> List[str]:
+        return [self.word(i) for i in range(len(self))]
+
+    def normalized(self, normalize: Callable[[str], str]) -> List[str]:
+        """정규화된 단어 목록 (같은 normalize 함수면 한 번만 계산)"""
+        if self._normalized is None or self._normalizer is not normalize:
+            self._normalized = [normalize(w) for w in self.words()]
+            self._normalizer = normalize
+        return self._normalized
+
+    @property
+    def duration(self) -> float:
+        return seconds(self.end[-1]) if len(self) else 0.0
+
+    def pauses(self, min_gap: float = 0.3) -> List[int]:
+        """단어 i와 i+1 사이 무음이 min_gap 이상인 i 목록 (씬 경계 후보)"""
+        if len(self) < 2:
+            return []
+        if NUMPY_AVAILABLE:
+            gaps = np.asarray(self.start[1:]) - np.asarray(self.end[:-1])
+            return np.nonzero(gaps >= min_gap)[0].tolist()
+        return [i for i in range(len(self) - 1) if self.start[i + 1] - self.end[i] >= min_gap]
+
+    def to_dicts(self) -> List[Dict]:
+        """기존 JSON 형식 ({word, start, end} 리스트)"""
+        return [
+            {"word": self.word(i), "start": seconds(self.start[i]), "end": seconds(self.end[i])}
+            for i in range(len(self))
+        ]
+
+
+# ============================================================
+# 저장 / 로드
+# ============================================================
+def encode_words(words: Sequence[Dict]) -> bytes:
+    """{word, start, end} 리스트 → .wcol 바이트"""
+    n = len(words)
+    encoded = [w["word"].encode("utf-8") for w in words]
+    offsets = array.array("I", [0])
+    total = 0
+    for b in encoded:
+        total += len(b)
+        offsets.append(total)
+
+    start = array.array("f", (float(w["start"]) for w in words))
+    end = array.array("f", (float(w["end"]) for w in words))
+    if sys.byteorder != "little":
+        for arr in (start, end, offsets):
+            arr.byteswap()
+
+    return b"".join([
+        HEADER.pack(MAGIC, n, total),
+        start.tobytes(),
+        end.tobytes(),
+        offsets.tobytes(),
+        b"".join(encoded),
+    ])
+
+
+def save_words(path: Path, words: Sequence[Dict]):
+    """.wcol 저장 (원자적)"""
+    atomic_write_bytes(path, encode_words(words))
+
+
+def load_words(path: Path) -> WhisperWords:
+    """.wcol 로드 - NumPy가 있으면 memmap (수 ms), 없으면 array로 전체 읽기"""
+    path = Path(path)
+    with open(path, "rb") as f:
+        magic, n, blob_len = HEADER.unpack(f.read(HEADER.size))
+    if magic != MAGIC:
+        raise ValueError(f"not a wcol file: {path}")
+
+    start_off = HEADER.size
+    end_off = start_off + 4 * n
+    offsets_off = end_off + 4 * n
+    blob_off = offsets_off + 4 * (n + 1)
+
+    if NUMPY_AVAILABLE:
+        if n == 0:
+            empty = np.zeros(0, dtype="<f4")
+            return WhisperWords(empty, empty, np.zeros(1, dtype="<u4"), b"")
+        mm = np.memmap(path, dtype=np.uint8, mode="r")
+        start = np.frombuffer(mm, dtype="<f4", count=n, offset=start_off)
+        end = np.frombuffer(mm, dtype="<f4", count=n, offset=end_off)
+        offsets = np.frombuffer(mm, dtype="<u4", count=n + 1, offset=offsets_off)
+        blob = memoryview(mm)[blob_off:blob_off + blob_len]
+        return WhisperWords(start, end, offsets, blob)
+
+    with open(path, "rb") as f:
+        data = f.read()
+    start = array.array("f")
+    start.frombytes(data[start_off:end_off])
+    end = array.array("f")
+    end.frombytes(data[end_off:offsets_off])
+    offsets = array.array("I")
+    offsets.frombytes(data[offsets_off:blob_off])
+    if sys.byteorder != "little":
+        for arr in (start, end, offsets):
+            arr.byteswap()
+    return WhisperWords(start, end, offsets, data[blob_off:blob_off + blob_len])
+
+
+def wcol_path(json_path: Path) -> Path:
+    """{section}_whisper.json → {section}_whisper.wcol"""
+    return Path(json_path).with_suffix(".wcol")
+
+
+def load_section_words(audio_dir: Path, section: str) -> Optional[WhisperWords]:
+    """섹션 Whisper 단어 로드
+
+    .wcol이 JSON보다 새로우면 그대로 매핑, 아니면 JSON을 읽어 .wcol을 만든 뒤 반환.
+    둘 다 없으면 None.
+    """
+    json_path = Path(audio_dir) / f"{section}_whisper.json"
+    col_path = wcol_path(json_path)
+
+    if col_path.exists() and (
+        not json_path.exists() or col_path.stat().st_mtime_ns >= json_path.stat().st_mtime_ns
+    ):
+        return load_words(col_path)
+
+    if not json_path.exists():
+        return None
+
+    words = read_json(json_path).get("words", [])
+    save_words(col_path, words)
+    return load_words(col_path)